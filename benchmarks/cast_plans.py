@@ -0,0 +1,72 @@
+"""
+Benchmark casting the cells of columns into values, and reading whole files.
+
+The scenario files shipped with the tests are tiny, so their DataFrames are
+replicated to about 20,000 rows each before being timed. Run it from the root of
+the repository, on each of the commits being compared:
+
+    python benchmarks/cast_plans.py
+"""
+
+import pathlib
+import statistics
+import sys
+import tempfile
+import time
+import typing
+
+import pandas as pd
+
+_ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
+
+import dftxt  # noqa: E402
+from dftxt._io import _read  # noqa: E402
+
+_SCENARIOS = _ROOT / "dftxt" / "tests" / "_io" / "scenarios"
+_NAMES = ("flights", "diamonds", "taxis")
+_ROWS = 20_000
+_REPEATS = 5
+
+
+def _replicate(source: pathlib.Path, path: pathlib.Path) -> None:
+    """Write the DataFrames of the source file replicated to about 20,000 rows."""
+    frames = dftxt.read_all(source)
+    replicated = {
+        name: pd.concat([frame] * (_ROWS // max(len(frame), 1)), ignore_index=True)
+        for name, frame in zip(frames.frame_names, frames.to_tuple())
+    }
+    path.write_text(dftxt.writes_all(replicated) + "\n")
+
+
+def _median_ms(function: typing.Callable[[], typing.Any]) -> float:
+    """Get the median time of calling the function, in milliseconds."""
+    times = []
+    for _ in range(_REPEATS):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main() -> None:
+    """Print the cells, to_values time and read_all time of each scenario."""
+    print(f"{'scenario':10} {'cells':>7} {'to_values':>10} {'read_all':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for name in _NAMES:
+            path = pathlib.Path(directory) / f"{name}.dftxt"
+            _replicate(_SCENARIOS / name / "source.dftxt", path)
+            columns = [
+                column
+                for _, load_lines in _read._iter_text_sections(path.read_text())
+                for block in _read._read_blocks(load_lines())
+                for column in block.columns
+            ]
+            cells = sum(len(column.cells) for column in columns)
+            cast = _median_ms(lambda: [column.to_values() for column in columns])
+            read = _median_ms(lambda: dftxt.read_all(path))
+            print(f"{name:10} {cells:7d} {cast:8.1f}ms {read:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,40 +1,66 @@
 """dftxt package root that exposes public interface for standard use cases."""
 from ._io import LoadedDataFrame
 from ._io import LoadedDataFrames
+from ._io import LoadedFiles
+from ._io import WrittenFile
+from ._io import agather
+from ._io import aread
+from ._io import aread_all
+from ._io import awrite
+from ._io import awrite_all
+from ._io import iter_frames
+from ._io import iter_rows
 from ._io import read
 from ._io import read_all
 from ._io import read_all_to_pandas
 from ._io import read_all_to_polars
+from ._io import read_batches
+from ._io import read_many
 from ._io import read_to_pandas
 from ._io import read_to_polars
 from ._io import reads
 from ._io import reads_all
 from ._io import reads_all_to_pandas
 from ._io import reads_all_to_polars
+from ._io import reads_batches
 from ._io import reads_to_pandas
 from ._io import reads_to_polars
 from ._io import write
 from ._io import write_all
+from ._io import write_many
 from ._io import writes
 from ._io import writes_all
 
 __all__ = [
     "LoadedDataFrame",
     "LoadedDataFrames",
+    "LoadedFiles",
+    "WrittenFile",
+    "agather",
+    "aread",
+    "aread_all",
+    "awrite",
+    "awrite_all",
+    "iter_frames",
+    "iter_rows",
     "read",
     "read_all",
     "read_all_to_pandas",
     "read_all_to_polars",
+    "read_batches",
+    "read_many",
     "read_to_pandas",
     "read_to_polars",
     "reads",
     "reads_all",
     "reads_all_to_pandas",
     "reads_all_to_polars",
+    "reads_batches",
     "reads_to_pandas",
     "reads_to_polars",
     "write",
     "write_all",
+    "write_many",
     "writes",
     "writes_all",
 ]
@@ -1,3 +1,12 @@
+from ._async import agather
+from ._async import aread
+from ._async import aread_all
+from ._async import awrite
+from ._async import awrite_all
+from ._many import LoadedFiles
+from ._many import WrittenFile
+from ._many import read_many
+from ._many import write_many
 from ._read import LoadedDataFrame
 from ._read import LoadedDataFrames
 from ._read import read
@@ -12,6 +21,10 @@ from ._read import reads_all_to_pandas
 from ._read import reads_all_to_polars
 from ._read import reads_to_pandas
 from ._read import reads_to_polars
+from ._stream import iter_frames
+from ._stream import iter_rows
+from ._stream import read_batches
+from ._stream import reads_batches
 from ._write import write
 from ._write import write_all
 from ._write import writes
@@ -20,20 +33,33 @@ from ._write import writes_all
 __all__ = [
     "LoadedDataFrame",
     "LoadedDataFrames",
+    "LoadedFiles",
+    "WrittenFile",
+    "agather",
+    "aread",
+    "aread_all",
+    "awrite",
+    "awrite_all",
+    "iter_frames",
+    "iter_rows",
     "read",
     "read_all",
     "read_all_to_pandas",
     "read_all_to_polars",
+    "read_batches",
+    "read_many",
     "read_to_pandas",
     "read_to_polars",
     "reads",
     "reads_all",
     "reads_all_to_pandas",
     "reads_all_to_polars",
+    "reads_batches",
     "reads_to_pandas",
     "reads_to_polars",
     "write",
     "write_all",
+    "write_many",
     "writes",
     "writes_all",
 ]
@@ -0,0 +1,389 @@
+import asyncio
+import functools
+import pathlib
+import pickle
+import typing
+from concurrent import futures
+
+from . import _cache
+from . import _read
+from . import _write
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
+
+T = typing.TypeVar("T")
+
+
+def _call_pickled(data: bytes) -> bytes:
+    """Call the function pickled by the cache pickler and pickle its result alike."""
+    return _cache.dumps(pickle.loads(data)())
+
+
+async def _run(
+    executor: typing.Optional["futures.Executor"],
+    function: typing.Callable[[], T],
+) -> T:
+    """
+    Run the function in the executor, or the default one of the event loop.
+
+    Functions run by process pools, along with their results, are pickled by the
+    cache pickler so that Polars DataFrames keep their dtypes between processes.
+    """
+    loop = asyncio.get_running_loop()
+    if isinstance(executor, futures.ProcessPoolExecutor):
+        data = _cache.dumps(function)
+        return pickle.loads(await loop.run_in_executor(executor, _call_pickled, data))
+    return await loop.run_in_executor(executor, function)
+
+
+async def agather(
+    *awaitables: typing.Awaitable[T],
+    limit: int = 8,
+    return_exceptions: bool = False,
+) -> typing.List[T]:
+    """
+    Await the awaitables with at most limit of them running at the same time.
+
+    Results are returned in the order of the awaitables, as with asyncio.gather,
+    which makes it possible to read many files at once without starting all of
+    the reads at the same time.
+    """
+    if limit < 1:
+        raise ValueError(f"Limit must be a positive integer, not {limit}.")
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def limited(awaitable: typing.Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    results = await asyncio.gather(
+        *(limited(a) for a in awaitables), return_exceptions=return_exceptions
+    )
+    return typing.cast(typing.List[T], results)
+
+
+@typing.overload
+async def aread(
+    path: typing.Union[pathlib.Path, str],
+    kind: typing.Literal["pandas"] = "pandas",
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    encoding: str = "utf-8",
+    modifier_prefix: str = "&",
+    mmap: bool = False,
+    cache_dir: typing.Union[pathlib.Path, str, None] = None,
+    memoize: bool = False,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: _read.EngineType = "python",
+    dictionary_encode: bool = False,
+    executor: typing.Optional["futures.Executor"] = None,
+) -> "pd.DataFrame":
+    """Read dftxt file into a Pandas DataFrame without blocking the event loop."""
+    ...
+
+
+@typing.overload
+async def aread(
+    path: typing.Union[pathlib.Path, str],
+    kind: typing.Literal["polars"],
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    encoding: str = "utf-8",
+    modifier_prefix: str = "&",
+    mmap: bool = False,
+    cache_dir: typing.Union[pathlib.Path, str, None] = None,
+    memoize: bool = False,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: _read.EngineType = "python",
+    dictionary_encode: bool = False,
+    executor: typing.Optional["futures.Executor"] = None,
+) -> "pl.DataFrame":
+    """Read dftxt file into a Polars DataFrame without blocking the event loop."""
+    ...
+
+
+@typing.overload
+async def aread(
+    path: typing.Union[pathlib.Path, str],
+    kind: typing.Literal["arrow"],
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    encoding: str = "utf-8",
+    modifier_prefix: str = "&",
+    mmap: bool = False,
+    cache_dir: typing.Union[pathlib.Path, str, None] = None,
+    memoize: bool = False,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: _read.EngineType = "python",
+    dictionary_encode: bool = False,
+    executor: typing.Optional["futures.Executor"] = None,
+) -> "pa.Table":
+    """Read dftxt file into an Arrow Table without blocking the event loop."""
+    ...
+
+
+async def aread(
+    path: typing.Union[pathlib.Path, str],
+    kind: typing.Literal["pandas", "polars", "arrow"] = "pandas",
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    encoding: str = "utf-8",
+    modifier_prefix: str = "&",
+    mmap: bool = False,
+    cache_dir: typing.Union[pathlib.Path, str, None] = None,
+    memoize: bool = False,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: _read.EngineType = "python",
+    dictionary_encode: bool = False,
+    executor: typing.Optional["futures.Executor"] = None,
+):
+    """
+    Read dftxt file into a Pandas or Polars DataFrame without blocking the event loop.
+
+    The file is read and parsed by the executor, which defaults to the thread pool
+    of the event loop. Process pools avoid contending for the interpreter lock with
+    the event loop when parsing large files.
+    """
+    return await _run(
+        executor,
+        functools.partial(
+            _read.read,
+            path=path,
+            kind=kind,
+            filters=filters,
+            markdown=markdown,
+            encoding=encoding,
+            modifier_prefix=modifier_prefix,
+            mmap=mmap,
+            cache_dir=cache_dir,
+            memoize=memoize,
+            columns=columns,
+            nrows=nrows,
+            skip_rows=skip_rows,
+            engine=engine,
+            dictionary_encode=dictionary_encode,
+        ),
+    )
+
+
+@typing.overload
+async def aread_all(
+    path: typing.Union[pathlib.Path, str],
+    kind: typing.Literal["pandas"] = "pandas",
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    encoding: str = "utf-8",
+    modifier_prefix: str = "&",
+    mmap: bool = False,
+    cache_dir: typing.Union[pathlib.Path, str, None] = None,
+    memoize: bool = False,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: _read.EngineType = "python",
+    dictionary_encode: bool = False,
+    fences: typing.Optional[typing.Sequence[str]] = None,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional["futures.Executor"] = None,
+) -> _read.LoadedDataFrames["pd.DataFrame"]:
+    """Read dftxt file into Pandas DataFrames without blocking the event loop."""
+    ...
+
+
+@typing.overload
+async def aread_all(
+    path: typing.Union[pathlib.Path, str],
+    kind: typing.Literal["polars"],
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    encoding: str = "utf-8",
+    modifier_prefix: str = "&",
+    mmap: bool = False,
+    cache_dir: typing.Union[pathlib.Path, str, None] = None,
+    memoize: bool = False,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: _read.EngineType = "python",
+    dictionary_encode: bool = False,
+    fences: typing.Optional[typing.Sequence[str]] = None,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional["futures.Executor"] = None,
+) -> _read.LoadedDataFrames["pl.DataFrame"]:
+    """Read dftxt file into Polars DataFrames without blocking the event loop."""
+    ...
+
+
+@typing.overload
+async def aread_all(
+    path: typing.Union[pathlib.Path, str],
+    kind: typing.Literal["arrow"],
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    encoding: str = "utf-8",
+    modifier_prefix: str = "&",
+    mmap: bool = False,
+    cache_dir: typing.Union[pathlib.Path, str, None] = None,
+    memoize: bool = False,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: _read.EngineType = "python",
+    dictionary_encode: bool = False,
+    fences: typing.Optional[typing.Sequence[str]] = None,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional["futures.Executor"] = None,
+) -> _read.LoadedDataFrames["pa.Table"]:
+    """Read dftxt file into Arrow Tables without blocking the event loop."""
+    ...
+
+
+async def aread_all(
+    path: typing.Union[pathlib.Path, str],
+    kind: typing.Literal["pandas", "polars", "arrow"] = "pandas",
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    encoding: str = "utf-8",
+    modifier_prefix: str = "&",
+    mmap: bool = False,
+    cache_dir: typing.Union[pathlib.Path, str, None] = None,
+    memoize: bool = False,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: _read.EngineType = "python",
+    dictionary_encode: bool = False,
+    fences: typing.Optional[typing.Sequence[str]] = None,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional["futures.Executor"] = None,
+):
+    """
+    Read dftxt file into Pandas or Polars DataFrames without blocking the event loop.
+
+    The file is read and parsed by the executor, which defaults to the thread pool
+    of the event loop. When workers is specified, the DataFrames of the file are
+    also read in parallel by a pool of that many processes as with read_all.
+    """
+    return await _run(
+        executor,
+        functools.partial(
+            _read.read_all,
+            path=path,
+            kind=kind,
+            filters=filters,
+            markdown=markdown,
+            encoding=encoding,
+            modifier_prefix=modifier_prefix,
+            mmap=mmap,
+            cache_dir=cache_dir,
+            memoize=memoize,
+            columns=columns,
+            nrows=nrows,
+            skip_rows=skip_rows,
+            engine=engine,
+            dictionary_encode=dictionary_encode,
+            fences=fences,
+            workers=workers,
+        ),
+    )
+
+
+async def awrite(
+    path: typing.Union[str, pathlib.Path],
+    data_frame: typing.Union["pd.DataFrame", "pl.DataFrame"],
+    line_width: int = 88,
+    allow_short: bool = False,
+    repeat_columns: typing.Union[None, str, typing.Sequence[str]] = None,
+    only_filters: typing.Optional[
+        typing.Mapping[typing.Any, typing.Sequence[str]]
+    ] = None,
+    never_filters: typing.Optional[
+        typing.Mapping[typing.Any, typing.Sequence[str]]
+    ] = None,
+    modifier_prefix: str = "&",
+    encoding: str = "utf-8",
+    index: typing.Union[bool, str, typing.Sequence[str], None] = False,
+    column_width: typing.Union[int, typing.Dict[str, int]] = -1,
+    executor: typing.Optional["futures.Executor"] = None,
+) -> None:
+    """
+    Write the serialized DataFrame to the file without blocking the event loop.
+
+    The DataFrame is serialized and written by the executor, which defaults to the
+    thread pool of the event loop.
+    """
+    await _run(
+        executor,
+        functools.partial(
+            _write.write,
+            path=path,
+            data_frame=data_frame,
+            line_width=line_width,
+            allow_short=allow_short,
+            repeat_columns=repeat_columns,
+            only_filters=only_filters,
+            never_filters=never_filters,
+            modifier_prefix=modifier_prefix,
+            encoding=encoding,
+            index=index,
+            column_width=column_width,
+        ),
+    )
+
+
+async def awrite_all(
+    path: typing.Union[str, pathlib.Path],
+    data_frames: typing.Union[
+        typing.Mapping[str, typing.Union["pd.DataFrame", "pl.DataFrame"]],
+        typing.Sequence[typing.Union["pd.DataFrame", "pl.DataFrame"]],
+    ],
+    line_width: int = 88,
+    allow_short: bool = False,
+    repeat_columns: typing.Union[None, str, typing.Sequence[str]] = None,
+    only_filters: typing.Optional[
+        typing.Mapping[typing.Any, typing.Sequence[str]]
+    ] = None,
+    never_filters: typing.Optional[
+        typing.Mapping[typing.Any, typing.Sequence[str]]
+    ] = None,
+    modifier_prefix: str = "&",
+    encoding: str = "utf-8",
+    index: typing.Union[bool, str, typing.Sequence[str], None] = False,
+    column_width: typing.Union[int, typing.Dict[str, int]] = -1,
+    executor: typing.Optional["futures.Executor"] = None,
+) -> None:
+    """
+    Write multiple, serialized DataFrames to the file without blocking the event loop.
+
+    The DataFrames are serialized and written by the executor, which defaults to the
+    thread pool of the event loop.
+    """
+    await _run(
+        executor,
+        functools.partial(
+            _write.write_all,
+            path=path,
+            data_frames=data_frames,
+            line_width=line_width,
+            allow_short=allow_short,
+            repeat_columns=repeat_columns,
+            only_filters=only_filters,
+            never_filters=never_filters,
+            modifier_prefix=modifier_prefix,
+            encoding=encoding,
+            index=index,
+            column_width=column_width,
+        ),
+    )
@@ -0,0 +1,317 @@
+import collections
+import dataclasses
+import hashlib
+import importlib.metadata
+import io
+import json
+import os
+import pathlib
+import pickle
+import tempfile
+import threading
+import typing
+from concurrent import futures
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import polars as pl
+else:
+    try:
+        import polars as pl
+    except ImportError:  # pragma: no cover
+        pl = None  # type: ignore
+
+#: Environment variable specifying the directory of the persistent read cache when
+#: a cache directory is not specified directly.
+CACHE_DIR_ENVIRONMENT_VARIABLE = "DFTXT_CACHE_DIR"
+#: Environment variable specifying the size budget of the persistent read cache.
+CACHE_MAX_BYTES_ENVIRONMENT_VARIABLE = "DFTXT_CACHE_MAX_BYTES"
+#: Environment variable specifying the number of entries in the in-memory cache.
+MEMORY_CACHE_MAX_ENTRIES_ENVIRONMENT_VARIABLE = "DFTXT_MEMORY_CACHE_MAX_ENTRIES"
+#: Environment variable specifying the estimated size budget of the in-memory cache.
+MEMORY_CACHE_MAX_BYTES_ENVIRONMENT_VARIABLE = "DFTXT_MEMORY_CACHE_MAX_BYTES"
+
+_DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+_DEFAULT_MEMORY_MAX_ENTRIES = 128
+_DEFAULT_MEMORY_MAX_BYTES = 512 * 1024 * 1024
+_ENTRY_SUFFIX = ".pickle"
+
+T = typing.TypeVar("T")
+
+
+def _get_version() -> str:
+    """Get the installed version of the dftxt package."""
+    try:
+        return importlib.metadata.version("dftxt")
+    except importlib.metadata.PackageNotFoundError:  # pragma: no cover
+        return "unknown"
+
+
+def _get_environment_integer(name: str, default: int) -> int:
+    """Get the integer value of the environment variable or the default."""
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def _restore_polars_frame(
+    data: bytes,
+    schema: typing.Dict[str, "pl.PolarsDataType"],
+    decimals: typing.Dict[str, typing.List[typing.Any]],
+) -> "pl.DataFrame":
+    """Restore a Polars DataFrame pickled by the cache pickler."""
+    frame = pl.read_ipc(io.BytesIO(data))
+    return pl.DataFrame(
+        [
+            pl.Series(name, decimals[name], dtype=dtype).cast(dtype)
+            if name in decimals
+            else frame[name].cast(dtype)
+            for name, dtype in schema.items()
+        ]
+    )
+
+
+class _Pickler(pickle.Pickler):
+    """Pickler that keeps the dtypes that Polars DataFrames lose when pickled."""
+
+    def reducer_override(self, obj: typing.Any) -> typing.Any:
+        """Pickle Polars DataFrames with their schema to restore their dtypes."""
+        if pl is None or not isinstance(obj, pl.DataFrame):
+            return NotImplemented
+
+        # Decimals are not preserved by IPC, or castable from other dtypes, and
+        # so are kept as their values instead.
+        decimals = {
+            name: obj[name].to_list()
+            for name, dtype in obj.schema.items()
+            if isinstance(dtype, pl.Decimal)
+        }
+        data = io.BytesIO()
+        obj.drop(list(decimals)).write_ipc(data)
+        return _restore_polars_frame, (data.getvalue(), dict(obj.schema), decimals)
+
+
+def dumps(value: typing.Any) -> bytes:
+    """Pickle the value while keeping the dtypes of any Polars DataFrames within it."""
+    data = io.BytesIO()
+    _Pickler(data, protocol=pickle.HIGHEST_PROTOCOL).dump(value)
+    return data.getvalue()
+
+
+@dataclasses.dataclass(frozen=True)
+class DiskCache:
+    """
+    Persistent cache of read results stored as pickle files within a directory.
+
+    Entries are written atomically and the least recently used entries are removed
+    when the entries exceed the byte budget, which makes it safe for concurrent use
+    by multiple processes, such as pytest-xdist workers, sharing the directory.
+    """
+
+    directory: pathlib.Path
+    max_bytes: int = _DEFAULT_MAX_BYTES
+
+    def _entry_path(self, key: str) -> pathlib.Path:
+        """Get the path of the entry file for the key."""
+        return self.directory / f"{key}{_ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> typing.Tuple[bool, typing.Any]:
+        """Get whether the key has an entry in the cache and the value if it does."""
+        path = self._entry_path(key)
+        try:
+            with path.open("rb") as f:
+                value = pickle.load(f)
+        except Exception:
+            # Entries that are missing, possibly removed by another process, or
+            # that cannot be loaded, e.g. when written with incompatible library
+            # versions, are read again and replaced.
+            return False, None
+
+        try:
+            # Modified times track access for least recently used removals.
+            os.utime(path)
+        except OSError:  # pragma: no cover
+            pass
+        return True, value
+
+    def put(self, key: str, value: typing.Any) -> None:
+        """Store the value for the key and remove entries over the byte budget."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Entries are written to a temporary file and then moved into place so that
+        # other processes never see partially written entries.
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=".tmp", delete=False
+        ) as f:
+            try:
+                _Pickler(f, protocol=pickle.HIGHEST_PROTOCOL).dump(value)
+            except BaseException:
+                f.close()
+                os.unlink(f.name)
+                raise
+        os.replace(f.name, self._entry_path(key))
+        self.prune()
+
+    def prune(self) -> None:
+        """Remove the least recently used entries until within the byte budget."""
+        entries: typing.List[typing.Tuple[float, int, pathlib.Path]] = []
+        for path in self.directory.glob(f"*{_ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Removed by another process in the meantime.
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+def get_disk_cache(
+    cache_dir: typing.Union[pathlib.Path, str, None],
+) -> typing.Optional["DiskCache"]:
+    """Get the persistent cache for the directory or the environment if enabled."""
+    directory = cache_dir or os.environ.get(CACHE_DIR_ENVIRONMENT_VARIABLE)
+    if not directory:
+        return None
+
+    return DiskCache(
+        directory=pathlib.Path(directory).expanduser().resolve(),
+        max_bytes=_get_environment_integer(
+            CACHE_MAX_BYTES_ENVIRONMENT_VARIABLE, _DEFAULT_MAX_BYTES
+        ),
+    )
+
+
+def to_key(content: bytes, settings: typing.Dict[str, typing.Any]) -> str:
+    """Create a cache key from the source content and the read settings."""
+    digest = hashlib.blake2b(content, digest_size=20)
+    settings = {**settings, "version": _get_version()}
+    digest.update(json.dumps(settings, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load(
+    cache_dir: typing.Union[pathlib.Path, str, None],
+    path: pathlib.Path,
+    settings: typing.Dict[str, typing.Any],
+    read: typing.Callable[[typing.Optional[bytes]], T],
+) -> T:
+    """
+    Load the read result from the persistent cache or read and cache it.
+
+    The file is read with the content that its cache key is created from, so that
+    changes to the file while it is being read are never cached under that key.
+    The read function is given None when the cache is disabled.
+    """
+    cache = get_disk_cache(cache_dir)
+    if cache is None:
+        return read(None)
+
+    content = path.read_bytes()
+    key = to_key(content, settings)
+    exists, value = cache.get(key)
+    if exists:
+        return typing.cast(T, value)
+
+    value = read(content)
+    cache.put(key, value)
+    return value
+
+
+class MemoryCache:
+    """
+    Thread-safe, in-memory cache of read results for the current process.
+
+    Concurrent loads of the same key only read once, with the other callers waiting
+    for that result, and the least recently used entries are removed when there are
+    too many entries or their estimated size exceeds the byte budget.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        """Construct an empty MemoryCache with the specified limits."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: typing.OrderedDict[
+            typing.Hashable, typing.Tuple[typing.Any, int]
+        ] = collections.OrderedDict()
+        self._pending: typing.Dict[typing.Hashable, futures.Future] = {}
+
+    def __len__(self) -> int:
+        """Get the number of entries in the cache."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def load(
+        self,
+        key: typing.Hashable,
+        read: typing.Callable[[], T],
+        estimate_size: typing.Callable[[T], int],
+    ) -> T:
+        """Get the cached value for the key or read it once for all callers."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return typing.cast(T, self._entries[key][0])
+
+            pending = self._pending.get(key)
+            if pending is None:
+                future: futures.Future = futures.Future()
+                self._pending[key] = future
+
+        if pending is not None:
+            return typing.cast(T, pending.result())
+
+        try:
+            value = read()
+        except BaseException as error:
+            with self._lock:
+                self._pending.pop(key, None)
+            future.set_exception(error)
+            raise
+
+        with self._lock:
+            self._pending.pop(key, None)
+            self._entries[key] = (value, estimate_size(value))
+            self._prune()
+        future.set_result(value)
+        return value
+
+    def _prune(self) -> None:
+        """Remove the least recently used entries beyond the cache limits."""
+        total = sum(size for _, size in self._entries.values())
+        while self._entries and (
+            len(self._entries) > self.max_entries or total > self.max_bytes
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            total -= size
+
+
+#: Cache for reads that are memoized within the current process.
+memory_cache = MemoryCache(
+    max_entries=_get_environment_integer(
+        MEMORY_CACHE_MAX_ENTRIES_ENVIRONMENT_VARIABLE, _DEFAULT_MEMORY_MAX_ENTRIES
+    ),
+    max_bytes=_get_environment_integer(
+        MEMORY_CACHE_MAX_BYTES_ENVIRONMENT_VARIABLE, _DEFAULT_MEMORY_MAX_BYTES
+    ),
+)
+
+
+def to_memory_key(
+    path: pathlib.Path, settings: typing.Dict[str, typing.Any]
+) -> typing.Hashable:
+    """Create an in-memory cache key from the file state and the read settings."""
+    stat = path.stat()
+    return (
+        str(path),
+        stat.st_mtime_ns,
+        stat.st_size,
+        json.dumps(settings, sort_keys=True, default=str),
+    )
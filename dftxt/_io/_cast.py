@@ -1,17 +1,22 @@
 import datetime
 import decimal
+import functools
 import re
 import typing
+import warnings
 
 import pytz
 
 if typing.TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
     import pandas as pd
     import polars as pl
 else:
     try:
+        import numpy as np
         import pandas as pd
     except ImportError:  # pragma: no cover
+        np = None  # type: ignore
         pd = None  # type: ignore
 
     try:
@@ -19,8 +24,28 @@ else:
     except ImportError:  # pragma: no cover
         pl = None  # type: ignore
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover
+    pa = None  # type: ignore
+    pc = None  # type: ignore
+
 _PANDAS_DTYPES = {"date": "object"}
 
+#: Serialized values that are read as missing values.
+_NA_VALUES = frozenset(["None", "NA", "NAN", "NAT", "null"])
+
+_TRUE_VALUES = ["true", "yes", "1", "on", "y", "t"]
+
+#: Matches decimal data types with a precision and an optional scale.
+_DECIMAL_TYPE_PATTERN = re.compile(
+    r"^decimal\[\s*(\d+)\s*(?:,\s*(\d+)\s*)?\]$", re.IGNORECASE
+)
+
+#: Matches serialized datetimes that specify their UTC offsets.
+_OFFSET_PATTERN = r"[T ]\d.*(?:Z|[+-]\d{2}(?::?\d{2})?)$"
+
 _CATEGORICAL_DTYPES = {
     "cat": False,
     "category": False,
@@ -36,58 +61,134 @@ _CATEGORICAL_DTYPES = {
 }
 
 
-def _get_categorical_ordering(dftxt_data_type: str, values: typing.List[typing.Any]):
-    """Convert dftxt categorical dtype into stored category ordering."""
-    distinct = set(values)
-    available_indexed = [(values.index(v), v) for v in distinct]
+def is_categorical(data_type: typing.Optional[str]) -> bool:
+    """Whether the dftxt data type is one of the categorical data types."""
+    return (data_type or "").lower().split(":", 1)[0] in _CATEGORICAL_DTYPES
+
+
+def is_string(data_type: typing.Optional[str]) -> bool:
+    """Whether the dftxt data type is a string data type, which is the default."""
+    return (data_type or "str").lower().startswith("str")
+
+
+def is_ordered(data_type: typing.Optional[str]) -> bool:
+    """Whether the dftxt categorical data type has ordered categories."""
+    dt = (data_type or "").lower()
+    return ":" in dt and dt.startswith(("enum", "ord"))
+
+
+@functools.lru_cache(maxsize=None)
+def to_decimal_type(
+    data_type: typing.Optional[str],
+) -> typing.Optional[typing.Tuple[int, int]]:
+    """Get the precision and scale of a "decimal[precision,scale]" data type."""
+    match = _DECIMAL_TYPE_PATTERN.match((data_type or "").strip())
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2) or 0)
+
+
+def to_decimal_pattern(decimal_type: typing.Tuple[int, int]) -> str:
+    """
+    Get the pattern of plain decimals that fit the precision and scale as written.
+
+    Cells that do not match, such as exponents or fractions with more digits than
+    the scale, even when those are zeros, are left to to_decimal to cast or reject.
+    """
+    precision, scale = decimal_type
+    return rf"^[+-]?0*\d{{0,{precision - scale}}}(\.\d{{0,{scale}}})?$"
+
+
+def _get_categorical_ordering(
+    dftxt_data_type: str, values: typing.Iterable[typing.Any]
+) -> typing.List[typing.Any]:
+    """
+    Convert dftxt categorical dtype into stored category ordering.
+
+    Positions in the ordering refer to the distinct values, missing values included,
+    in the order that they first appear, which are found in a single pass.
+    """
+    appearance_ordered = list(dict.fromkeys(values))
     raw = dftxt_data_type.split(":", 1)[-1]
     if raw in ("az", "abc"):
-        return [x[1] for x in sorted(available_indexed, key=lambda v: v[1])]
+        return sorted(v for v in appearance_ordered if v is not None)
 
     if raw in ("za", "cba"):
-        return [
-            x[1] for x in sorted(available_indexed, key=lambda v: v[1], reverse=True)
-        ]
+        return sorted((v for v in appearance_ordered if v is not None), reverse=True)
 
     raw_ordering = list(raw) if "," not in raw else raw.split(",")
     indexes = [
         int(v.strip()) if v.strip().isdigit() else v.strip() for v in raw_ordering
     ]
-    appearance_ordered = list(sorted(available_indexed, key=lambda v: v[0]))
-    return [appearance_ordered[i][1] if isinstance(i, int) else i for i in indexes]
+    return [appearance_ordered[i] if isinstance(i, int) else i for i in indexes]
 
 
 def _encode_categorical_ordering(
-    order: typing.List[typing.Any], values: typing.List[typing.Any]
+    order: typing.List[typing.Any], values: typing.Iterable[typing.Any]
 ) -> str:
-    """Serialize categorical ordering for preservation in dftxt outputs."""
-    distinct = set(values)
+    """
+    Serialize categorical ordering for preservation in dftxt outputs.
+
+    The values only need to hold the distinct values, missing values included, in
+    the order that they first appear, which is how they are found from the codes of
+    categorical columns.
+    """
+    physical_ordered = list(dict.fromkeys(values))
+    positions = {v: i for i, v in enumerate(physical_ordered)}
     defined = set(order)
 
-    has_all = distinct == defined
+    has_all = set(positions) == defined
 
     if has_all and order == list(sorted(order)):
         return "az"
     if has_all and order == list(sorted(order, reverse=True)):
         return "za"
 
-    delimiter = "" if has_all and len(distinct) < 10 else ","
+    delimiter = "" if has_all and len(positions) < 10 else ","
 
-    available_indexed = [(values.index(v), v) for v in distinct]
-    physical_ordered = [v[1] for v in sorted(available_indexed, key=lambda v: v[0])]
     if order == physical_ordered:
         return ""
-    return delimiter.join(
-        [str(physical_ordered.index(v)) if v in distinct else v for v in order]
-    )
+    return delimiter.join([str(positions[v]) if v in positions else v for v in order])
+
+
+def _to_first_categories(codes: typing.Any, categories: typing.List[typing.Any]):
+    """Get the categories of the codes in the order they first appear in them."""
+    return [None if code < 0 else categories[code] for code in pd.unique(codes)]
+
+
+def to_pandas_categorical(
+    values: typing.List[typing.Any], dtype: typing.Union[str, "pd.CategoricalDtype"]
+) -> "pd.Categorical":
+    """
+    Create the Pandas categorical of the values from the codes of their categories.
+
+    The values are factorized once and only their distinct values are looked up in
+    the categories, which for the "category" dtype are sorted as Pandas sorts them.
+    """
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+    if not isinstance(dtype, pd.CategoricalDtype):
+        categories = uniques.sort_values()
+        if len(categories) == 0 and len(values) > 0:
+            # Pandas infers float categories for columns of only missing values.
+            categories = pd.Index([], dtype="float64")
+        dtype = pd.CategoricalDtype(categories)
+
+    positions = {category: code for code, category in enumerate(dtype.categories)}
+    lookup = np.array([positions.get(v, -1) for v in uniques] + [-1], dtype=np.int64)
+    # Missing values have codes of -1, which look up the last code of -1.
+    return pd.Categorical.from_codes(lookup[codes], dtype=dtype)
 
 
 def to_pandas_dtype(
     data_type: typing.Optional[str], values: typing.List[typing.Any]
-) -> typing.Union[None, str, "pd.CategoricalDtype"]:
+) -> typing.Union[None, str, "pd.CategoricalDtype", "pd.ArrowDtype"]:
     """Convert a dftxt data type into the associated Pandas data type."""
     dtype = data_type or ""
     dt = dtype.lower()
+    decimal_type = to_decimal_type(data_type)
+    if decimal_type is not None and pa is not None:
+        return pd.ArrowDtype(pa.decimal128(*decimal_type))
+
     if dt.startswith("decimal"):
         return "object"
     if dt in ("timestamp", "datetime", "datetime64"):
@@ -112,6 +213,16 @@ def to_pandas_dtype(
     return _PANDAS_DTYPES.get(data_type or "", data_type)
 
 
+def to_arrow_categories(
+    data_type: typing.Optional[str], values: typing.List[typing.Any]
+) -> typing.List[typing.Any]:
+    """Get the categories of the dftxt categorical data type in their order."""
+    if ":" not in (data_type or ""):
+        # Categories without a specified ordering are sorted as Pandas sorts them.
+        return sorted({v for v in values if v is not None})
+    return _get_categorical_ordering(data_type or "", values)
+
+
 def to_polars_dtype(
     data_type: typing.Optional[str],
     values: typing.List[typing.Any],
@@ -139,59 +250,385 @@ def to_polars_dtype(
     if is_enum:
         return pl.Enum(_get_categorical_ordering(data_type or "", values))
 
+    if dtype in ("bool", "boolean"):
+        return pl.Boolean()
+
+    if dtype == "date":
+        return pl.Date()
+
+    if dtype in ("timestamp", "datetime", "datetime64"):
+        # Polars converts values to UTC when the first value has a UTC offset, which
+        # leaves the time zone of columns without values unknown.
+        first = next((v for v in values if v is not None), None)
+        if first is None:
+            return None
+        return pl.Datetime("us", None if first.tzinfo is None else "UTC")
+
+    if dtype.startswith(("timestamp[", "datetime[", "datetime64[")):
+        return pl.Datetime("us", "UTC")
+
+    decimal_type = to_decimal_type(dtype)
+    if decimal_type is not None:
+        return pl.Decimal(*decimal_type)
+
+    if dtype.startswith("decimal"):
+        exponents = [
+            v.as_tuple().exponent
+            for v in values
+            if isinstance(v, decimal.Decimal) and v.is_finite()
+        ]
+        return pl.Decimal(None, max([0, *(-typing.cast(int, e) for e in exponents)]))
+
     return None
 
 
+def infers_polars_dtype(data_type: typing.Optional[str]) -> bool:
+    """Whether the Polars data type of the dftxt data type depends on the values."""
+    dtype = (data_type or "").lower()
+    is_decimal = dtype.startswith("decimal") and to_decimal_type(dtype) is None
+    return is_decimal or dtype in (
+        "timestamp",
+        "datetime",
+        "datetime64",
+    )
+
+
 def to_decimal(value: typing.Any, data_type: str) -> decimal.Decimal:
-    """Convert dftxt-serialized value into the decimal data type."""
-    return decimal.Decimal(value)
+    """
+    Convert dftxt-serialized value into the decimal data type.
+
+    Values of "decimal[precision,scale]" data types that do not fit their precision
+    or scale raise errors instead of being rounded by the columns holding them.
+    """
+    converted = decimal.Decimal(value)
+    decimal_type = to_decimal_type(data_type)
+    if decimal_type is None or not converted.is_finite() or converted.is_zero():
+        return converted
+
+    precision, scale = decimal_type
+    exponent = typing.cast(int, converted.as_tuple().exponent)
+    if -exponent > scale or converted.adjusted() >= precision - scale:
+        raise ValueError(f"Decimal {value!r} does not fit the {data_type} data type.")
+    return converted
 
 
 def to_boolean(value: typing.Optional[str]) -> bool:
     """Convert dftxt-serialized value into the boolean data type."""
     if value is None:
         return False
-    return value.strip().lower() in ["true", "yes", "1", "on", "y", "t"]
+    return value.strip().lower() in _TRUE_VALUES
 
 
-def cast_to(value: typing.Any, data_type: str) -> typing.Any:
-    """Cast dftxt-serialized value to the specified data type."""
-    if value is None or value in ["None", "NA", "NAN", "NAT", "null"]:
-        return None
+def _to_zoned_datetime(value: str, time_zone: datetime.tzinfo) -> datetime.datetime:
+    """Convert dftxt-serialized value into a datetime in the time zone."""
+    parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed.replace(tzinfo=time_zone)
+
 
+def _to_datetime(value: str) -> datetime.datetime:
+    """Convert dftxt-serialized value into a datetime."""
+    return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _to_value(value: typing.Any) -> typing.Any:
+    """Keep dftxt-serialized values of unknown data types as they are."""
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def to_converter(data_type: str) -> typing.Callable[[str], typing.Any]:
+    """
+    Resolve the data type into a function that converts non-NA serialized values.
+
+    Data types are resolved once, including the time zones of datetime data types,
+    instead of for every value that is converted.
+    """
     dtype = data_type or ""
     dt = dtype.lower()
 
     if dt.startswith("str"):
-        return str(value)
+        return str
 
     if dt.startswith("int"):
-        return int(value)
+        return int
 
     if dt.startswith("float"):
-        return float(value)
+        return float
 
     if dt.startswith("decimal"):
-        return to_decimal(value, data_type)
+        return functools.partial(to_decimal, data_type=data_type)
 
     if dt in ("bool", "boolean"):
-        return to_boolean(value)
+        return to_boolean
 
     if dt == "date":
-        return datetime.date.fromisoformat(value)
+        return datetime.date.fromisoformat
 
     if dt in ("timestamp", "datetime", "datetime64"):
-        return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return _to_datetime
 
     if dt.startswith(("timestamp[", "datetime[", "datetime64[")):
         time_zone = pytz.timezone(
             data_type.split("[")[-1].strip().split(",")[-1].strip().split("]")[0]
         )
-        return datetime.datetime.fromisoformat(value.replace("Z", "+00:00")).replace(
-            tzinfo=time_zone
+        return functools.partial(_to_zoned_datetime, time_zone=time_zone)
+
+    return _to_value
+
+
+def cast_all(
+    values: typing.Iterable[typing.Any], data_type: str
+) -> typing.List[typing.Any]:
+    """Cast dftxt-serialized values to the specified data type."""
+    convert = to_converter(data_type)
+    na_values = _NA_VALUES
+    if convert is str:
+        # Repeated strings share a single object rather than one for each cell.
+        interned: typing.Dict[str, str] = {}
+        intern = interned.setdefault
+        return [None if v is None or v in na_values else intern(v, v) for v in values]
+    return [None if v is None or v in na_values else convert(v) for v in values]
+
+
+def to_caster(data_type: str) -> typing.Callable[[typing.Any], typing.Any]:
+    """Resolve the data type into a function that casts serialized values to it."""
+    convert = to_converter(data_type)
+
+    def cast(value: typing.Any) -> typing.Any:
+        if value is None or value in _NA_VALUES:
+            return None
+        return convert(value)
+
+    return cast
+
+
+def cast_to(value: typing.Any, data_type: str) -> typing.Any:
+    """Cast dftxt-serialized value to the specified data type."""
+    if value is None or value in _NA_VALUES:
+        return None
+    return to_converter(data_type)(value)
+
+
+def _to_arrow_decimals(strings: "pa.Array") -> typing.Optional["pa.Array"]:
+    """Cast the strings to the Arrow decimal type with the scale of all of them."""
+    # Leading zeros are not digits of the precision, except for the zero of values
+    # without a fraction, as for the Python decimals Arrow infers the type from.
+    unsigned = pc.replace_substring_regex(strings, r"^[+-]?0*", "")
+    lengths = pc.utf8_length(unsigned)
+    points = pc.find_substring(unsigned, ".")
+    has_point = pc.greater_equal(points, 0)
+    fractions = pc.if_else(has_point, pc.subtract(pc.subtract(lengths, points), 1), 0)
+    wholes = pc.max_element_wise(
+        pc.if_else(has_point, points, lengths),
+        pc.if_else(pc.equal(fractions, 0), 1, 0),
+    )
+    scale = pc.max(fractions).as_py() or 0
+    precision = (pc.max(wholes).as_py() or 0) + scale
+    if precision > 38:
+        return None
+    return pc.cast(strings, pa.decimal128(max(precision, 1), scale))
+
+
+def _to_arrow_datetimes(
+    strings: "pa.Array", time_zone: typing.Optional[str]
+) -> typing.Optional["pa.Array"]:
+    """Cast the strings to Arrow timestamps, localized to the time zone if any."""
+    has_offsets = pc.match_substring_regex(strings, _OFFSET_PATTERN)
+    offsets = pc.sum(has_offsets).as_py() or 0
+    if offsets == 0:
+        naive = pc.cast(strings, pa.timestamp("us"))
+        if time_zone is None:
+            return naive
+        return pc.assume_timezone(
+            naive, timezone=time_zone, ambiguous="earliest", nonexistent="earliest"
         )
 
-    return value
+    if time_zone is not None or offsets < len(strings) - strings.null_count:
+        # Mixing values with and without offsets leaves them as Python objects, and
+        # zoned values drop their offsets in the Python cast, which Arrow would apply.
+        return None
+
+    is_utc = pc.all(pc.ends_with(pc.drop_null(strings), "Z")).as_py()
+    return pc.cast(strings, pa.timestamp("us", "UTC")) if is_utc else None
+
+
+def to_arrow(
+    cells: typing.Union[typing.Sequence[typing.Optional[str]], "pa.Array"],
+    data_type: str,
+) -> typing.Optional["pa.Array"]:
+    """
+    Cast dftxt-serialized cells of a column to an Arrow array in vectorized passes.
+
+    The cells can also be given as an Arrow string array. None is returned when the
+    data type, or the values themselves, cannot be cast by Arrow, such as
+    categorical data types, in which case the cells need to be cast one at a time
+    instead.
+    """
+    if pa is None:
+        raise RuntimeError("No pyarrow module was found.")
+
+    dt = (data_type or "").lower()
+    strings = cells if isinstance(cells, pa.Array) else pa.array(cells, pa.string())
+    is_missing = pc.is_in(strings, value_set=pa.array(sorted(_NA_VALUES)))
+    strings = pc.if_else(is_missing, pa.scalar(None, pa.string()), strings)
+    if strings.null_count == len(strings):
+        # Python infers the types of columns without values, which it leaves unknown
+        # for data types like decimals and naive datetimes.
+        return None
+
+    try:
+        if dt.startswith("str"):
+            return strings
+
+        if dt.startswith("int"):
+            return pc.cast(strings, pa.int64())
+
+        if dt.startswith("float"):
+            return pc.cast(strings, pa.float64())
+
+        decimal_type = to_decimal_type(data_type)
+        if decimal_type is not None:
+            # Arrow also accepts digits beyond the precision and scale that are
+            # zeros, which raise errors when cast one at a time instead.
+            pattern = to_decimal_pattern(decimal_type)
+            if not pc.all(pc.match_substring_regex(strings, pattern)).as_py():
+                return None
+            return pc.cast(strings, pa.decimal128(*decimal_type))
+
+        if dt.startswith("decimal"):
+            return _to_arrow_decimals(strings)
+
+        if dt in ("bool", "boolean"):
+            normalized = pc.utf8_lower(pc.utf8_trim_whitespace(strings))
+            is_true = pc.is_in(normalized, value_set=pa.array(_TRUE_VALUES))
+            return pc.if_else(pc.is_null(strings), None, is_true)
+
+        if dt == "date":
+            return pc.cast(strings, pa.date32())
+
+        if dt in ("timestamp", "datetime", "datetime64"):
+            return _to_arrow_datetimes(strings, None)
+
+        if dt.startswith(("timestamp[", "datetime[", "datetime64[")):
+            time_zone = (
+                data_type.split("[")[-1].strip().split(",")[-1].strip().split("]")[0]
+            )
+            if pytz.timezone(time_zone) is not pytz.utc:
+                # Python replaces the time zones of the values, which applies the
+                # local mean time offsets of pytz time zones, and so is kept.
+                return None
+            return _to_arrow_datetimes(strings, time_zone)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return None
+
+    return None
+
+
+def _to_pandas_datetimes(
+    strings: "pd.Series[str]", time_zone: typing.Optional[str]
+) -> typing.Optional[typing.Any]:
+    """Cast the strings to Pandas datetimes, localized to the time zone if any."""
+    with warnings.catch_warnings():
+        # Mixing UTC offsets leaves the values as objects, which are cast by Python.
+        warnings.simplefilter("ignore", FutureWarning)
+        parsed = pd.to_datetime(strings, format="ISO8601")
+    if parsed.dtype.kind != "M" or not parsed.notna().any():
+        # Columns without values are inferred from their Python values instead.
+        return None
+
+    if getattr(parsed.dtype, "tz", None) is not None:
+        # Pandas also converts values without offsets to the offset of the others,
+        # whereas Python only casts them to UTC when every one of them has one.
+        offset = re.compile(_OFFSET_PATTERN)
+        has_offsets = all(offset.search(v) for v in strings.dropna())
+        if time_zone is not None or not has_offsets or str(parsed.dt.tz) != "UTC":
+            return None
+
+    if parsed.dt.nanosecond.any():
+        # Python does not keep fractions of seconds beyond microseconds.
+        return None
+
+    if time_zone is not None:
+        parsed = parsed.dt.tz_localize(time_zone)
+    return parsed.array
+
+
+def to_pandas(
+    cells: typing.Sequence[typing.Optional[str]], data_type: str
+) -> typing.Optional[typing.Any]:
+    """
+    Cast dftxt-serialized cells of a column to a Pandas array in vectorized passes.
+
+    The array creates the same Pandas Series, with the Pandas data type of the
+    column, as the values cast one at a time. None is returned when the data type,
+    or the values themselves, cannot be cast that way, such as categorical data
+    types, in which case the cells need to be cast one at a time instead.
+    """
+    if pd is None:
+        raise RuntimeError("No pandas module was found.")
+
+    dt = (data_type or "").lower()
+    if is_categorical(data_type):
+        return None
+
+    if to_decimal_type(data_type) is not None and pa is not None:
+        # Native decimal columns hold the Arrow array the cells are cast into.
+        array = to_arrow(cells, data_type)
+        return None if array is None else pd.arrays.ArrowExtensionArray(array)
+
+    dtype = to_pandas_dtype(data_type, [])
+    strings = typing.cast("pd.Series[str]", pd.Series(cells, dtype=object))
+    is_missing = strings.isin([*_NA_VALUES, None]).to_numpy()
+    is_present = ~is_missing
+    try:
+        if dt.startswith("str"):
+            values = strings.to_numpy(copy=True)
+            values[is_missing] = None
+            # Repeated strings share a single object rather than one for each cell.
+            positions, distinct_values = pd.factorize(values)
+            shared = np.empty(len(distinct_values) + 1, dtype=object)
+            shared[:-1] = distinct_values
+            return shared[positions]
+
+        if dt.startswith("int") and dtype in ("int64", "Int64"):
+            # Casting Python strings with NumPy parses them as int() does.
+            numbers = np.zeros(len(cells), dtype=np.int64)
+            numbers[is_present] = strings.to_numpy()[is_present].astype(np.int64)
+            if dtype == "Int64":
+                return pd.arrays.IntegerArray(numbers, is_missing)
+            return None if is_missing.any() else numbers
+
+        if dt.startswith("float") and dtype in ("float", "float64", "float32"):
+            # Unlike pd.to_numeric, NumPy parses floats exactly as float() does.
+            numbers = np.full(len(cells), np.nan)
+            numbers[is_present] = strings.to_numpy()[is_present].astype(np.float64)
+            return numbers
+
+        if dt in ("bool", "boolean") and dtype in ("bool", "boolean"):
+            # Only the distinct values are cast, with missing values cast to False.
+            codes, uniques = pd.factorize(strings)
+            distinct = [to_boolean(v) for v in uniques] + [False]
+            flags = np.array(distinct, dtype=bool)[codes] & is_present
+            if dtype == "boolean":
+                return pd.arrays.BooleanArray(flags, is_missing)
+            return flags
+
+        if dt in ("timestamp", "datetime", "datetime64"):
+            return _to_pandas_datetimes(strings.where(is_present), None)
+
+        if dt.startswith(("timestamp[", "datetime[", "datetime64[")):
+            time_zone = (
+                data_type.split("[")[-1].strip().split(",")[-1].strip().split("]")[0]
+            )
+            if pytz.timezone(time_zone) is not pytz.utc:
+                # Python replaces the time zones of the values, which applies the
+                # local mean time offsets of pytz time zones, and so is kept.
+                return None
+            return _to_pandas_datetimes(strings.where(is_present), "UTC")
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+    return None
 
 
 def cast_from(
@@ -240,6 +677,10 @@ def from_value(value: typing.Any) -> typing.Optional[str]:
 def from_pandas(series: "pd.Series") -> typing.Optional[str]:
     """Determine dftxt dtype from a Pandas Series column."""
     dtype = str(series.dtype)
+    arrow_dtype = getattr(series.dtype, "pyarrow_dtype", None)
+    if pa is not None and arrow_dtype is not None and pa.types.is_decimal(arrow_dtype):
+        return f"decimal[{arrow_dtype.precision},{arrow_dtype.scale}]"
+
     index = series.first_valid_index()
     if index is None and dtype == "object":
         return None
@@ -249,8 +690,9 @@ def from_pandas(series: "pd.Series") -> typing.Optional[str]:
 
     if isinstance(series.dtype, pd.CategoricalDtype):
         prefix = "ordinal" if series.dtype.ordered else "category"
+        categories = series.dtype.categories.tolist()
         ordering = _encode_categorical_ordering(
-            series.dtype.categories.tolist(), series.tolist()
+            categories, _to_first_categories(series.cat.codes.to_numpy(), categories)
         )
         separator = ":" if ordering else ""
         return f"{prefix}{separator}{ordering}"
@@ -282,7 +724,8 @@ def from_polars(series: "pl.Series") -> typing.Optional[str]:
 
     if isinstance(series.dtype, pl.Enum):
         ordering = _encode_categorical_ordering(
-            series.dtype.categories.to_list(), series.to_list()
+            series.dtype.categories.to_list(),
+            series.unique(maintain_order=True).to_list(),
         )
         separator = ":" if ordering else ""
         return f"enum{separator}{ordering}"
@@ -290,6 +733,9 @@ def from_polars(series: "pl.Series") -> typing.Optional[str]:
     if dtype == "categorical":
         return "category"
 
+    if isinstance(series.dtype, pl.Decimal) and series.dtype.precision is not None:
+        return f"decimal[{series.dtype.precision},{series.dtype.scale}]"
+
     if dtype == "int64":
         return "int"
 
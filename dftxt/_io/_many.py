@@ -0,0 +1,477 @@
+import dataclasses
+import functools
+import glob
+import os
+import pathlib
+import pickle
+import shutil
+import time
+import typing
+import uuid
+from concurrent import futures
+
+from . import _cache
+from . import _read
+from . import _write
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
+else:
+    try:
+        import pandas as pd
+    except ImportError:  # pragma: no cover
+        pd = None  # type: ignore
+
+    try:
+        import polars as pl
+    except ImportError:  # pragma: no cover
+        pl = None  # type: ignore
+
+    try:
+        import pyarrow as pa
+    except ImportError:  # pragma: no cover
+        pa = None  # type: ignore
+
+PathsType = typing.Union[
+    str, pathlib.Path, typing.Iterable[typing.Union[str, pathlib.Path]]
+]
+
+FramesType = typing.Union[
+    "pd.DataFrame",
+    "pl.DataFrame",
+    typing.Mapping[str, typing.Union["pd.DataFrame", "pl.DataFrame"]],
+    typing.Sequence[typing.Union["pd.DataFrame", "pl.DataFrame"]],
+]
+
+_GLOB_CHARACTERS = ("*", "?", "[")
+
+
+class LoadedFiles(typing.Mapping[pathlib.Path, _read.LoadedDataFrames[_read.DF_TYPE]]):
+    """
+    Mapping of file paths to the DataFrames read from them by read_many.
+
+    Files that could not be read are left out of the mapping and the errors they
+    raised are available by path in errors instead.
+    """
+
+    def __init__(
+        self,
+        files: typing.Dict[pathlib.Path, _read.LoadedDataFrames[_read.DF_TYPE]],
+        errors: typing.Dict[pathlib.Path, Exception],
+        concatenated: typing.Optional[_read.LoadedDataFrames[_read.DF_TYPE]] = None,
+    ) -> None:
+        """Construct a LoadedFiles instance from the results of reading the files."""
+        self._files: typing.Dict[
+            pathlib.Path, _read.LoadedDataFrames[_read.DF_TYPE]
+        ] = files
+        self._concatenated: typing.Optional[
+            _read.LoadedDataFrames[_read.DF_TYPE]
+        ] = concatenated
+        #: Errors raised by files that could not be read, or stacked when read with
+        #: concat, by the path of the file.
+        self.errors = errors
+
+    @property
+    def concatenated(self) -> _read.LoadedDataFrames[_read.DF_TYPE]:
+        """Get the same-named DataFrames of the files stacked into one another."""
+        if self._concatenated is None:
+            raise ValueError("The files were not read with concat=True.")
+        return self._concatenated
+
+    def __getitem__(self, path: pathlib.Path) -> _read.LoadedDataFrames[_read.DF_TYPE]:
+        """Get the DataFrames read from the file."""
+        return self._files[path]
+
+    def __iter__(self) -> typing.Iterator[pathlib.Path]:
+        """Iterate over the paths of the files that were read."""
+        return iter(self._files)
+
+    def __len__(self) -> int:
+        """Get the number of files that were read."""
+        return len(self._files)
+
+
+def _to_paths(paths_or_glob: PathsType) -> typing.List[pathlib.Path]:
+    """Get the distinct, resolved paths of the files to read in order."""
+    if isinstance(paths_or_glob, (str, pathlib.Path)):
+        pattern = os.path.expanduser(str(paths_or_glob))
+        if not any(c in pattern for c in _GLOB_CHARACTERS):
+            return [pathlib.Path(pattern).resolve()]
+
+        matches = sorted(glob.glob(pattern, recursive=True))
+        return [pathlib.Path(p).resolve() for p in matches if os.path.isfile(p)]
+
+    resolved = (pathlib.Path(p).expanduser().resolve() for p in paths_or_glob)
+    return list(dict.fromkeys(resolved))
+
+
+def _read_file(path: pathlib.Path, settings: typing.Dict[str, typing.Any]) -> bytes:
+    """Read the file into pickled DataFrames that keep their dtypes across processes."""
+    return _cache.dumps(_read.read_all(path, **settings))
+
+
+def _to_schema(data_frame: typing.Any) -> typing.Tuple[typing.Any, ...]:
+    """Get the schema of the DataFrame that must match to stack it with others."""
+    if pl is not None and isinstance(data_frame, pl.DataFrame):
+        return tuple(data_frame.schema.items())
+
+    if pa is not None and isinstance(data_frame, pa.Table):
+        return (data_frame.schema,)
+
+    # Unordered categories are combined when stacked and so do not need to match.
+    dtypes = [
+        "category" if getattr(dtype, "ordered", None) is False else dtype
+        for dtype in data_frame.dtypes
+    ]
+    return (
+        tuple(zip(data_frame.columns, dtypes)),
+        tuple(data_frame.index.names),
+    )
+
+
+def _stack(data_frames: typing.List[typing.Any]) -> typing.Any:
+    """Stack DataFrames with the same schema into a single DataFrame."""
+    first = data_frames[0]
+    if pl is not None and isinstance(first, pl.DataFrame):
+        categorical = [
+            name
+            for name, dtype in first.schema.items()
+            if isinstance(dtype, pl.Categorical)
+        ]
+        # Categoricals read separately do not share a string cache and so are
+        # stacked as strings within one before being cast back.
+        with pl.StringCache():
+            stacked = pl.concat(
+                [
+                    frame.with_columns(pl.col(categorical).cast(pl.Utf8))
+                    for frame in data_frames
+                ]
+            )
+            return stacked.with_columns(
+                [pl.col(name).cast(first.schema[name]) for name in categorical]
+            )
+
+    if pa is not None and isinstance(first, pa.Table):
+        # Dictionaries of categorical columns are unified when they differ.
+        return pa.concat_tables(data_frames).unify_dictionaries()
+
+    stacked = pd.concat(
+        data_frames,
+        ignore_index=all(
+            isinstance(frame.index, pd.RangeIndex) and frame.index.name is None
+            for frame in data_frames
+        ),
+    )
+    for name, dtype in first.dtypes.items():
+        if getattr(dtype, "ordered", None) is False:
+            # Pandas stacks columns with differing categories as objects.
+            stacked[name] = pd.api.types.union_categoricals(
+                [frame[name] for frame in data_frames], sort_categories=True
+            )
+    return stacked
+
+
+def _concatenate(
+    files: typing.Dict[pathlib.Path, _read.LoadedDataFrames],
+    errors: typing.Dict[pathlib.Path, Exception],
+) -> _read.LoadedDataFrames:
+    """Stack the same-named DataFrames of the files in the order of the files."""
+    grouped: typing.Dict[str, typing.List[typing.Tuple[pathlib.Path, typing.Any]]] = {}
+    sourced_names: typing.Dict[str, typing.Optional[str]] = {}
+    for path, loaded in files.items():
+        for item in loaded:
+            grouped.setdefault(item.name, []).append((path, item.data_frame))
+            sourced_names.setdefault(item.name, item.sourced_name)
+
+    stacked: typing.Dict[str, typing.Any] = {}
+    for name, frames in grouped.items():
+        first_path, first = frames[0]
+        schema = _to_schema(first)
+        matching = []
+        for path, frame in frames:
+            if _to_schema(frame) != schema:
+                errors.setdefault(
+                    path,
+                    ValueError(
+                        f"The '{name}' DataFrame does not have the same schema as "
+                        f"the one read from '{first_path}'."
+                    ),
+                )
+                continue
+            matching.append(frame)
+        stacked[name] = _stack(matching)
+
+    return _read.LoadedDataFrames(stacked, [sourced_names[n] for n in stacked])
+
+
+@typing.overload
+def read_many(
+    paths_or_glob: PathsType,
+    kind: typing.Literal["pandas"] = "pandas",
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    encoding: str = "utf-8",
+    modifier_prefix: str = "&",
+    mmap: bool = False,
+    cache_dir: typing.Union[pathlib.Path, str, None] = None,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: _read.EngineType = "python",
+    dictionary_encode: bool = False,
+    fences: typing.Optional[typing.Sequence[str]] = None,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional["futures.Executor"] = None,
+    concat: bool = False,
+) -> LoadedFiles["pd.DataFrame"]:
+    """Read dftxt files into Pandas DataFrames."""
+    ...
+
+
+@typing.overload
+def read_many(
+    paths_or_glob: PathsType,
+    kind: typing.Literal["polars"],
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    encoding: str = "utf-8",
+    modifier_prefix: str = "&",
+    mmap: bool = False,
+    cache_dir: typing.Union[pathlib.Path, str, None] = None,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: _read.EngineType = "python",
+    dictionary_encode: bool = False,
+    fences: typing.Optional[typing.Sequence[str]] = None,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional["futures.Executor"] = None,
+    concat: bool = False,
+) -> LoadedFiles["pl.DataFrame"]:
+    """Read dftxt files into Polars DataFrames."""
+    ...
+
+
+@typing.overload
+def read_many(
+    paths_or_glob: PathsType,
+    kind: typing.Literal["arrow"],
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    encoding: str = "utf-8",
+    modifier_prefix: str = "&",
+    mmap: bool = False,
+    cache_dir: typing.Union[pathlib.Path, str, None] = None,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: _read.EngineType = "python",
+    dictionary_encode: bool = False,
+    fences: typing.Optional[typing.Sequence[str]] = None,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional["futures.Executor"] = None,
+    concat: bool = False,
+) -> LoadedFiles["pa.Table"]:
+    """Read dftxt files into Arrow Tables."""
+    ...
+
+
+def read_many(
+    paths_or_glob: PathsType,
+    kind: typing.Literal["pandas", "polars", "arrow"] = "pandas",
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    encoding: str = "utf-8",
+    modifier_prefix: str = "&",
+    mmap: bool = False,
+    cache_dir: typing.Union[pathlib.Path, str, None] = None,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: _read.EngineType = "python",
+    dictionary_encode: bool = False,
+    fences: typing.Optional[typing.Sequence[str]] = None,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional["futures.Executor"] = None,
+    concat: bool = False,
+):
+    """
+    Read many dftxt files, specified by paths or a glob pattern, into DataFrames.
+
+    Each file is read as it would be by read_all. When workers is greater than one,
+    the files are read in parallel by a pool of that many processes, or by the
+    executor when one is specified instead. Files that cannot be read do not stop
+    the others from being read and their errors are returned by path instead.
+
+    When concat is True, the same-named DataFrames of the files are also stacked in
+    the order of the files. DataFrames with a different schema than the first one
+    of that name are not stacked and reported as errors of their files.
+    """
+    settings: typing.Dict[str, typing.Any] = {
+        "kind": kind,
+        "filters": filters,
+        "markdown": markdown,
+        "encoding": encoding,
+        "modifier_prefix": modifier_prefix,
+        "mmap": mmap,
+        "cache_dir": cache_dir,
+        "columns": columns,
+        "nrows": nrows,
+        "skip_rows": skip_rows,
+        "engine": engine,
+        "dictionary_encode": dictionary_encode,
+        "fences": fences,
+    }
+    files: typing.Dict[pathlib.Path, typing.Any] = {}
+    errors: typing.Dict[pathlib.Path, Exception] = {}
+    paths = _to_paths(paths_or_glob)
+    with _read._open_executor(workers, executor) as pool:
+        if pool is None:
+            for path in paths:
+                try:
+                    files[path] = _read.read_all(path, **settings)
+                except Exception as error:
+                    errors[path] = error
+        else:
+            pending = {path: pool.submit(_read_file, path, settings) for path in paths}
+            for path, future in pending.items():
+                try:
+                    files[path] = pickle.loads(future.result())
+                except Exception as error:
+                    errors[path] = error
+
+    concatenated = _concatenate(files, errors) if concat else None
+    return LoadedFiles(files, errors, concatenated)
+
+
+@dataclasses.dataclass(frozen=True)
+class WrittenFile:
+    """Result of writing a file with write_many."""
+
+    path: pathlib.Path
+    #: Number of bytes written to the file.
+    size: int
+    #: Seconds taken to serialize the DataFrames and write the file.
+    seconds: float
+
+
+def _write_atomic(path: pathlib.Path, text: str, encoding: str) -> int:
+    """Write the text to a temporary file that then replaces the file at the path."""
+    # The temporary file is within the same directory so that it can be renamed in
+    # place, which means readers never see partially written files.
+    temporary = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with temporary.open("x", encoding=encoding) as f:
+            f.write(text)
+        if path.exists():
+            shutil.copymode(path, temporary)
+        os.replace(temporary, path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+    return path.stat().st_size
+
+
+def _write_file(
+    path: pathlib.Path,
+    data_frames: FramesType,
+    settings: typing.Dict[str, typing.Any],
+    encoding: str,
+) -> "WrittenFile":
+    """Serialize the DataFrame, or DataFrames, and write them to the file."""
+    start = time.perf_counter()
+    if isinstance(data_frames, typing.Mapping):
+        text = _write.writes_all(dict(data_frames), **settings)
+    elif isinstance(data_frames, typing.Sequence):
+        text = _write.writes_all(data_frames, **settings)
+    else:
+        text = _write.writes(data_frames, **settings)
+    size = _write_atomic(path, text + "\n", encoding)
+    return WrittenFile(path=path, size=size, seconds=time.perf_counter() - start)
+
+
+def _write_pickled_file(
+    path: pathlib.Path,
+    data: bytes,
+    settings: typing.Dict[str, typing.Any],
+    encoding: str,
+) -> "WrittenFile":
+    """Write the DataFrames pickled by the cache pickler to keep their dtypes."""
+    return _write_file(path, pickle.loads(data), settings, encoding)
+
+
+def write_many(
+    files: typing.Mapping[typing.Union[str, pathlib.Path], FramesType],
+    line_width: int = 88,
+    allow_short: bool = False,
+    repeat_columns: typing.Union[None, str, typing.Sequence[str]] = None,
+    only_filters: typing.Optional[
+        typing.Mapping[typing.Any, typing.Sequence[str]]
+    ] = None,
+    never_filters: typing.Optional[
+        typing.Mapping[typing.Any, typing.Sequence[str]]
+    ] = None,
+    modifier_prefix: str = "&",
+    encoding: str = "utf-8",
+    index: typing.Union[bool, str, typing.Sequence[str], None] = False,
+    column_width: typing.Union[int, typing.Dict[str, int]] = -1,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional["futures.Executor"] = None,
+) -> typing.Dict[pathlib.Path, "WrittenFile"]:
+    """
+    Write many files of serialized DataFrames, specified by their paths.
+
+    Files given a single DataFrame are written as they would be by write and files
+    given a collection of DataFrames as they would be by write_all. Each file is
+    written to a temporary file that then replaces it, so that files are never left
+    partially written. When workers is greater than one, the files are serialized
+    and written in parallel by a pool of that many processes, or by the executor
+    when one is specified instead.
+
+    All of the files are written, or attempted, before the first error raised by
+    any of them is raised.
+    """
+    settings: typing.Dict[str, typing.Any] = {
+        "line_width": line_width,
+        "allow_short": allow_short,
+        "repeat_columns": repeat_columns,
+        "only_filters": only_filters,
+        "never_filters": never_filters,
+        "modifier_prefix": modifier_prefix,
+        "index": index,
+        "column_width": column_width,
+    }
+    written: typing.Dict[pathlib.Path, WrittenFile] = {}
+    errors: typing.List[Exception] = []
+    paths = {
+        pathlib.Path(p).expanduser().resolve(): frames for p, frames in files.items()
+    }
+    with _read._open_executor(workers, executor) as pool:
+        if pool is None:
+            pending: typing.Dict[pathlib.Path, typing.Callable[[], WrittenFile]] = {
+                path: functools.partial(_write_file, path, frames, settings, encoding)
+                for path, frames in paths.items()
+            }
+        else:
+            pending = {
+                path: pool.submit(
+                    _write_pickled_file,
+                    path,
+                    _cache.dumps(frames),
+                    settings,
+                    encoding,
+                ).result
+                for path, frames in paths.items()
+            }
+
+        for path, result in pending.items():
+            try:
+                written[path] = result()
+            except Exception as error:
+                errors.append(error)
+
+    if errors:
+        raise errors[0]
+    return written
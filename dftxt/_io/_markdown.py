@@ -1,3 +1,4 @@
+import dataclasses
 import re
 import typing
 
@@ -73,3 +74,114 @@ def extract(markdown: str) -> str:
         frame_sections[args["name"]].append(section)
 
     return _combine_frame_sections(frame_sections)
+
+
+@dataclasses.dataclass(frozen=True)
+class Fence:
+    """A dftxt fence of a markdown document and where its content is found."""
+
+    name: str
+    #: Whether the content starts a new block of the DataFrame it is part of.
+    wraps: bool
+    #: Offsets of the content within the markdown, between the fence lines.
+    start: int
+    end: int
+    #: Line numbers, starting at one, of the opening and closing fence lines.
+    first_line: int
+    last_line: int
+
+
+def iter_fences(markdown: str) -> typing.Iterator["Fence"]:
+    """
+    Walk the dftxt fences of the markdown one after another.
+
+    The markdown is expected to be without carriage returns. Fences that are never
+    closed are ignored, as are the fences following them.
+    """
+    offset = 0
+    line = 1
+    while offset < len(markdown):
+        opening_match = _START_FENCE_PATTERN.search(markdown, offset)
+        if opening_match is None:
+            return
+
+        ending_match = _END_FENCE_PATTERN.search(markdown, opening_match.end())
+        if ending_match is None:
+            return
+
+        fence_start = opening_match.start("fence")
+        first_line = line + markdown.count("\n", offset, fence_start)
+        line = first_line + markdown.count("\n", fence_start, ending_match.end())
+        offset = ending_match.end()
+
+        args = _parse_args(opening_match.group("args"))
+        yield Fence(
+            name=args["name"],
+            wraps=args["action"] == "wrap",
+            start=opening_match.end(),
+            end=ending_match.start(),
+            first_line=first_line,
+            last_line=line,
+        )
+
+
+class Section:
+    """
+    The fences of a markdown document that have the same name.
+
+    Sections are loaders of the lines of the DataFrame of their fences, which are
+    sliced out of the markdown by the offsets of the fences when loaded.
+    """
+
+    def __init__(self, markdown: str, fences: typing.List["Fence"]) -> None:
+        """Construct a Section instance from its fences within the markdown."""
+        self.markdown = markdown
+        self.fences = fences
+
+    @property
+    def name(self) -> str:
+        """Get the name of the fences."""
+        return self.fences[0].name
+
+    @property
+    def location(self) -> str:
+        """Get a description of where the fences are found in the markdown."""
+        spans = ", ".join(f"{f.first_line}-{f.last_line}" for f in self.fences)
+        noun = "fence" if len(self.fences) == 1 else "fences"
+        return f"markdown {noun} at lines {spans}"
+
+    def to_text(self) -> str:
+        """Combine the content of the fences into the dftxt of their DataFrame."""
+        contents = []
+        for fence in self.fences:
+            content = self.markdown[fence.start : fence.end]
+            contents.append(f"\n\n{content.strip()}" if fence.wraps else content)
+        return "\n".join(contents)
+
+    def __call__(self) -> typing.List[str]:
+        """Load the lines of the DataFrame, normalized as dftxt lines are read."""
+        return self.to_text().replace("\t", "  ").split("\n")
+
+
+def iter_sections(
+    markdown: str, names: typing.Optional[typing.Sequence[str]] = None
+) -> typing.Iterator["Section"]:
+    """
+    Find the sections of the dftxt fences of the markdown, in order of their names.
+
+    When names are specified, only the fences with those names are included and an
+    error is raised when any of them are not found.
+    """
+    cleaned = markdown.replace("\r", "")
+    selected = None if names is None else set(names)
+    sections: typing.Dict[str, typing.List[Fence]] = {}
+    for fence in iter_fences(cleaned):
+        if selected is None or fence.name in selected:
+            sections.setdefault(fence.name, []).append(fence)
+
+    missing = sorted((selected or set()) - set(sections))
+    if missing:
+        raise ValueError(f"Requested fences were not found: {missing}.")
+
+    for fences in sections.values():
+        yield Section(cleaned, fences)
@@ -0,0 +1,246 @@
+import typing
+
+import pytz
+
+from . import _cast
+from . import _read
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import polars as pl
+else:
+    try:
+        import polars as pl
+    except ImportError:  # pragma: no cover
+        pl = None  # type: ignore
+
+_NA_VALUES = sorted(_cast._NA_VALUES)
+_DECIMAL_PATTERN = r"^[+-]?(\d+\.?\d*|\.\d+)$"
+_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S%.f"
+
+
+def _cut_cells(
+    rows: "pl.Series", columns: typing.List["_read.RawColumn"]
+) -> typing.Optional["pl.DataFrame"]:
+    """
+    Cut the data rows into the cells of the columns within Polars.
+
+    Cells of missing values are nulls. None is returned when any of the rows has
+    cells that are quoted or that are not aligned with their columns, which must be
+    tokenized instead.
+    """
+    line = pl.col("line")
+    length = line.str.len_chars()
+    cells = []
+    misaligned = []
+    for column in columns:
+        start = column.bounds.start_index
+        end = column.bounds.end_index
+        cell = line.str.slice(start, end - start).str.strip_chars()
+        is_present = (length > start) & ~cell.is_in(_NA_VALUES)
+        cells.append(pl.when(is_present).then(cell).alias(column.name))
+        if start > 0:
+            gutter = line.str.slice(start - 1, 1)
+            misaligned.append(((length > start) & (gutter != " ")).any())
+
+    lines = rows.to_frame("line")
+    quoted = [
+        line.str.slice(c.bounds.start_index).str.contains("^ *[\"']") for c in columns
+    ]
+    flags = lines.select(
+        pl.any_horizontal(quoted).any().alias("quoted"),
+        pl.any_horizontal(misaligned or [pl.lit(False)]).alias("misaligned"),
+    )
+    if any(flags.row(0)):
+        return None
+    return lines.select(cells)
+
+
+def _to_datetimes(
+    cells: "pl.Series", time_zone: typing.Optional[str]
+) -> typing.Optional["pl.Expr"]:
+    """Create the expression to cast the cells to datetimes in the time zone."""
+    cell = pl.col(cells.name)
+    if time_zone is None and cells.null_count() == len(cells):
+        # Python casts naive datetimes without any values to a null column.
+        return None
+
+    if time_zone is not None and pytz.timezone(time_zone) is not pytz.utc:
+        # Python replaces the time zones of the values, which applies the local mean
+        # time offsets of pytz time zones, and so is kept.
+        return None
+
+    offsets = cells.str.contains(_cast._OFFSET_PATTERN).sum()
+    if offsets == 0:
+        naive = cell.str.to_datetime(_DATETIME_FORMAT, time_unit="us")
+        if time_zone is None:
+            return naive
+        return naive.dt.replace_time_zone("UTC")
+
+    if time_zone is not None or offsets < len(cells) - cells.null_count():
+        # Mixing values with and without offsets leaves them to be cast by Python, as
+        # do zoned values, which Python replaces the offsets of instead of applying.
+        return None
+    return cell.str.to_datetime(time_unit="us").dt.convert_time_zone("UTC")
+
+
+def _to_expression(cells: "pl.Series", data_type: str) -> typing.Optional["pl.Expr"]:
+    """
+    Create the Polars expression that casts the cells of the column.
+
+    None is returned when the data type, or the cells, cannot be cast by Polars as
+    they are cast by Python, in which case the cells are cast by Python instead.
+    """
+    cell = pl.col(cells.name)
+    dt = data_type.lower()
+    if dt.startswith("str"):
+        return cell
+
+    if dt.startswith("int"):
+        return cell.cast(pl.Int64)
+
+    if dt.startswith("float"):
+        return cell.cast(pl.Float64)
+
+    if dt.startswith("decimal"):
+        # Polars silently nulls decimals it cannot parse, such as exponents, and
+        # rounds those that do not fit the precision and scale of the data type.
+        decimal_type = _cast.to_decimal_type(data_type)
+        patterns = [_DECIMAL_PATTERN]
+        if decimal_type is not None:
+            patterns.append(_cast.to_decimal_pattern(decimal_type))
+        if not all(cells.str.contains(p).all(ignore_nulls=True) for p in patterns):
+            return None
+        if decimal_type is None:
+            # The scale is that of the longest fraction of all of the cells, as
+            # inferring it from leading cells nulls the longer fractions after them.
+            fractions = cells.str.extract(r"\.(\d*)$", 1).str.len_chars().max()
+            return cell.cast(pl.Decimal(None, typing.cast(int, fractions or 0)))
+
+        return cell.cast(pl.Decimal(*decimal_type))
+
+    if dt in ("bool", "boolean"):
+        normalized = cell.str.strip_chars().str.to_lowercase()
+        return pl.when(cell.is_not_null()).then(normalized.is_in(_cast._TRUE_VALUES))
+
+    if dt == "date":
+        return cell.str.to_date("%Y-%m-%d")
+
+    if dt in ("timestamp", "datetime", "datetime64"):
+        return _to_datetimes(cells, None)
+
+    if dt.startswith(("timestamp[", "datetime[", "datetime64[")):
+        time_zone = (
+            data_type.split("[")[-1].strip().split(",")[-1].strip().split("]")[0]
+        )
+        return _to_datetimes(cells, time_zone)
+
+    if _cast.is_categorical(data_type):
+        values = cells.unique(maintain_order=True).to_list()
+        dtype = _cast.to_polars_dtype(data_type, values)
+        return None if dtype is None else cell.cast(dtype)
+
+    return None
+
+
+def _cast_python(cells: "pl.Series", column: "_read.RawColumn") -> "pl.Series":
+    """Cast the cells of the column by Python."""
+    raw = _read.RawColumn(
+        bounds=column.bounds,
+        name=column.name,
+        modifiers=column.modifiers,
+        cells=cells.to_list(),
+    )
+    return _read._to_polars([raw]).to_series()
+
+
+def _cast_cells(
+    frame: "pl.DataFrame", columns: typing.List["_read.RawColumn"]
+) -> typing.List["pl.Series"]:
+    """
+    Cast the cells of the columns with Polars expressions, which run in parallel.
+
+    Columns that Polars cannot cast, or fails to cast, are cast by Python instead,
+    which raises the same errors for invalid values as without this engine.
+    """
+    expressions = {
+        c.name: _to_expression(frame[c.name], c.data_type or "str") for c in columns
+    }
+    cast = [e.alias(name) for name, e in expressions.items() if e is not None]
+    try:
+        casted = frame.select(cast)
+    except pl.exceptions.PolarsError:
+        casted = None
+
+    series = []
+    for column in columns:
+        expression = expressions[column.name]
+        if casted is None and expression is not None:
+            try:
+                series.append(frame.select(expression.alias(column.name)).to_series())
+                continue
+            except pl.exceptions.PolarsError:
+                expression = None
+
+        if expression is None:
+            series.append(_cast_python(frame[column.name], column))
+        else:
+            series.append(typing.cast(pl.DataFrame, casted)[column.name])
+    return series
+
+
+def _read_block(
+    block: "_read._BlockScan",
+    modifier_prefix: str,
+    selection: "_read._ColumnSelection",
+    rows: typing.Optional[range],
+    dictionary_encode: bool = False,
+) -> typing.List["pl.Series"]:
+    """Read the block into the Polars Series of its selected columns."""
+    frame = None
+    if not block.has_continuations:
+        raw = _read._read_blocks(block.heading, modifier_prefix)[0]
+        columns = [c for c in raw.columns if selection.includes(c)]
+        if dictionary_encode:
+            columns = _read._encode_strings(columns)
+        data_rows = block.rows if rows is None else block.rows[rows.start : rows.stop]
+        frame = _cut_cells(pl.Series("line", data_rows, dtype=pl.Utf8), columns)
+
+    if frame is None:
+        # Blocks that need the tokenizer are read as they are without this engine.
+        raw_blocks = _read._read_blocks(block.lines, modifier_prefix, selection, rows)
+        tokenized = [c for b in raw_blocks for c in b.columns if selection.includes(c)]
+        if dictionary_encode:
+            tokenized = _read._encode_strings(tokenized)
+        return _read._to_polars(tokenized).get_columns()
+
+    return _cast_cells(frame, columns)
+
+
+def read_frame(
+    lines: typing.Iterable[str],
+    modifier_prefix: str,
+    selection: "_read._ColumnSelection",
+    rows: typing.Optional[range] = None,
+    dictionary_encode: bool = False,
+) -> "pl.DataFrame":
+    """
+    Read the lines of a frame into a Polars DataFrame with Polars expressions.
+
+    The lines of the data rows of each block are loaded into a single Polars
+    string column, cut into cells with the boundaries of the header and cast with
+    Polars expressions, which run in Rust instead of cell by cell in Python.
+    Blocks with quoted cells, backslash continuations or cells that are not aligned
+    with their columns are tokenized instead, and columns that Polars cannot cast
+    as Python would are cast by Python.
+    """
+    if pl is None:
+        raise RuntimeError("No polars module was found.")
+
+    series = [
+        column
+        for block in _read._scan_blocks(lines, modifier_prefix)
+        for column in _read_block(
+            block, modifier_prefix, selection, rows, dictionary_encode
+        )
+    ]
+    return pl.DataFrame(series)
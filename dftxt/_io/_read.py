@@ -1,17 +1,33 @@
+import array
+import contextlib
 import dataclasses
+import enum
+import functools
+import itertools
+import json
+import mmap
+import multiprocessing
+import operator
 import pathlib
+import pickle
 import re
+import sys
 import typing
+from concurrent import futures
 
+from . import _cache
 from . import _cast
 from . import _markdown
 from . import _modifiers
+from . import _polars
 
 if typing.TYPE_CHECKING:  # pragma: no cover
     import pandas as pd
     import polars as pl
+    import pyarrow as pa
+    import pyarrow.compute as pc
 
-    DF_TYPE = typing.TypeVar("DF_TYPE", "pl.DataFrame", "pd.DataFrame")
+    DF_TYPE = typing.TypeVar("DF_TYPE", "pl.DataFrame", "pd.DataFrame", "pa.Table")
 else:
     _DF_TYPE_VALUES = []
     try:
@@ -28,15 +44,40 @@ else:
     except ImportError:  # pragma: no cover
         pl = None  # type: ignore
 
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        _DF_TYPE_VALUES.append("pa.Table")
+    except ImportError:  # pragma: no cover
+        pa = None  # type: ignore
+        pc = None  # type: ignore
+
     DF_TYPE = typing.TypeVar("DF_TYPE", *_DF_TYPE_VALUES)
 
 
 _DATA_FRAME_SEPARATOR_REGEX = re.compile(
     r"(^|\n)\s*-{3,}\s*(?P<name>[^\s-]*)\s*-{0,}\n+"
 )
+# Memory-mapped files are searched without newline translation.
+_DATA_FRAME_SEPARATOR_BYTES_REGEX = re.compile(
+    rb"(^|\n)\s*-{3,}\s*(?P<name>[^\s-]*)\s*-{0,}(\r?\n)+"
+)
+_DATA_FRAME_SEPARATOR_LINE_REGEX = re.compile(r"^\s*-{3,}\s*(?P<name>[^\s-]*)\s*-*\s*$")
+#: Sections with at least this many lines have their blocks read in parallel
+#: instead of reading the section as a whole when reading with an executor.
+_PARALLEL_BLOCK_MIN_LINES = 10_000
+
+_LinesLoader = typing.Callable[[], typing.Iterable[str]]
+
+#: Engines that cast the cells of columns into values when reading.
+EngineType = typing.Literal["python", "arrow", "polars", "pandas"]
+_ENGINES = typing.get_args(EngineType)
 
 _loaded_custom_class_indexes = {"pandas": 0, "polars": 0}
 
+_QUOTE_CHARACTERS = ("'", '"')
+
 
 @dataclasses.dataclass(frozen=True)
 class LoadedDataFrame(typing.Generic[DF_TYPE]):
@@ -53,16 +94,42 @@ class LoadedDataFrame(typing.Generic[DF_TYPE]):
         return self.data_frame
 
 
+class _LazyDataFrames(typing.Mapping[str, DF_TYPE]):
+    """Mapping of DataFrames that are each read when first accessed."""
+
+    def __init__(self, loaders: typing.Dict[str, typing.Callable[[], DF_TYPE]]):
+        self._loaders: typing.Dict[str, typing.Callable[[], DF_TYPE]] = loaders
+        self._loaded: typing.Dict[str, DF_TYPE] = {}
+
+    def __getitem__(self, name: str) -> DF_TYPE:
+        """Get the DataFrame, reading it if it has not been accessed before."""
+        if name not in self._loaded:
+            self._loaded[name] = self._loaders[name]()
+        return self._loaded[name]
+
+    def __contains__(self, name: object) -> bool:
+        """Whether the DataFrame exists without reading it."""
+        return name in self._loaders
+
+    def __iter__(self) -> typing.Iterator[str]:
+        """Iterate over the names of the DataFrames."""
+        return iter(self._loaders)
+
+    def __len__(self) -> int:
+        """Get the number of DataFrames."""
+        return len(self._loaders)
+
+
 class LoadedDataFrames(typing.Generic[DF_TYPE]):
     """A collection of loaded DataFrames."""
 
     def __init__(
         self,
-        data_frames: typing.Dict[str, DF_TYPE],
+        data_frames: typing.Mapping[str, DF_TYPE],
         sourced_names: typing.List[typing.Optional[str]],
     ) -> None:
         """Construct a LoadedDataFrames instance from parsed values."""
-        self._frames: typing.Dict[str, DF_TYPE] = data_frames
+        self._frames: typing.Mapping[str, DF_TYPE] = data_frames
         self._sourced_names = sourced_names
 
     @property
@@ -77,7 +144,7 @@ class LoadedDataFrames(typing.Generic[DF_TYPE]):
 
     def to_dict(self) -> typing.Dict[str, DF_TYPE]:
         """Convert to a dictionary representation of the loaded DataFrames."""
-        return self._frames.copy()
+        return dict(self._frames)
 
     def to_tuple(self) -> typing.Tuple[DF_TYPE, ...]:
         """Convert to a tuple representation of the loaded DataFrames."""
@@ -100,7 +167,7 @@ class LoadedDataFrames(typing.Generic[DF_TYPE]):
     def __getitem__(self, name_or_index: typing.Union[str, int]) -> DF_TYPE:
         """Get the DataFrame by dictionary-style, key-based access."""
         if isinstance(name_or_index, int):
-            return list(self._frames.values())[name_or_index]
+            return self._frames[list(self._frames.keys())[name_or_index]]
 
         if name_or_index not in self._frames:
             raise KeyError(f"No loaded DataFrame named '{name_or_index}' was found.")
@@ -130,11 +197,17 @@ class LoadedDataFrames(typing.Generic[DF_TYPE]):
         """Whether the frame with the specified name is in the loaded DataFrames."""
         return name in self._frames
 
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        """Pickle the loaded DataFrames, reading any that have not been read yet."""
+        return self.__class__, (dict(self._frames), list(self._sourced_names))
+
 
 @dataclasses.dataclass()
 class ColumnBounds:
     """Data structure that represents fixed-width columns within the raw table."""
 
+    __slots__ = ("start_index", "end_index")
+
     start_index: int
     end_index: int
 
@@ -143,16 +216,122 @@ class ColumnBounds:
         return f"({self.start_index}, {self.end_index})"
 
 
-@dataclasses.dataclass()
+class RawRows:
+    """
+    Data rows of a table block held as the source lines they were read from.
+
+    The cells of each column are only cut from the lines, at the boundaries of the
+    column, when they are needed, which holds one string for each row instead of one
+    for each cell. Rows that cannot be cut that way, such as those with quoted cells
+    or backslash continuations, are held as their cells instead.
+    """
+
+    __slots__ = ("lines", "positions", "exploded", "_arrow_lines")
+
+    def __init__(self) -> None:
+        """Construct an empty RawRows instance to append rows to."""
+        self.lines: typing.List[str] = []
+        #: Positions of the rows held as their cells, which have empty lines.
+        self.positions = array.array("I")
+        self.exploded: typing.List[typing.Sequence[typing.Optional[str]]] = []
+        self._arrow_lines: typing.Optional["pa.Array"] = None
+
+    def __len__(self) -> int:
+        """Get the number of data rows."""
+        return len(self.lines)
+
+    def __getstate__(self) -> typing.Any:
+        """Pickle the rows without the Arrow array of their lines."""
+        return self.lines, self.positions, self.exploded
+
+    def __setstate__(self, state: typing.Any) -> None:
+        """Unpickle the rows."""
+        self.lines, self.positions, self.exploded = state
+        self._arrow_lines = None
+
+    def append(self, row: typing.Union[str, typing.Sequence[typing.Optional[str]]]):
+        """Append the row as its line, or as its cells when it cannot be cut."""
+        if isinstance(row, str):
+            self.lines.append(row)
+            return
+
+        self.positions.append(len(self.lines))
+        self.lines.append("")
+        self.exploded.append(row)
+
+    def cut(
+        self, bounds: "ColumnBounds", index: int
+    ) -> typing.List[typing.Optional[str]]:
+        """Cut the cells of the column with the bounds and index out of the rows."""
+        start, end = bounds.start_index, bounds.end_index
+        cells: typing.List[typing.Optional[str]]
+        cells = [line[start:end].strip() for line in self.lines]
+        for position, row in zip(self.positions, self.exploded):
+            cells[position] = row[index]
+        return cells
+
+    def cut_arrow(self, bounds: "ColumnBounds", index: int) -> "pa.Array":
+        """Cut the cells of the column out of the rows within Arrow."""
+        if self._arrow_lines is None:
+            # Every column of the block is cut from the same Arrow array of lines.
+            self._arrow_lines = pa.array(self.lines, pa.string())
+        sliced = pc.utf8_slice_codeunits(
+            self._arrow_lines, bounds.start_index, bounds.end_index
+        )
+        cells = pc.utf8_trim_whitespace(sliced)
+        if not self.exploded:
+            return cells
+
+        is_exploded = [False] * len(self.lines)
+        for position in self.positions:
+            is_exploded[position] = True
+        return pc.replace_with_mask(
+            cells,
+            pa.array(is_exploded, pa.bool_()),
+            pa.array([row[index] for row in self.exploded], pa.string()),
+        )
+
+
 class RawColumn:
-    """Data structure for source column data."""
+    """
+    Data structure for source column data.
 
-    bounds: "ColumnBounds"
-    name: str
-    modifiers: "_modifiers.ColumnModifiers"
-    cells: typing.List[typing.Optional[str]] = dataclasses.field(
-        default_factory=lambda: []
-    )
+    The cells of the column are either specified directly or cut out of the data
+    rows of its block, at the position of the column within the cells of rows held
+    as their cells, each time they are needed.
+    """
+
+    __slots__ = ("bounds", "name", "modifiers", "_cells", "_rows", "_index")
+
+    def __init__(
+        self,
+        bounds: "ColumnBounds",
+        name: str,
+        modifiers: "_modifiers.ColumnModifiers",
+        cells: typing.Optional[typing.List[typing.Optional[str]]] = None,
+        rows: typing.Optional["RawRows"] = None,
+        index: int = 0,
+    ) -> None:
+        """Construct a RawColumn instance from its cells or the rows of its block."""
+        self.bounds = bounds
+        self.name = name
+        self.modifiers = modifiers
+        self._cells = cells
+        self._rows = rows
+        self._index = index
+
+    def __repr__(self) -> str:
+        """Simplified display representation for the RawColumn data."""
+        return f"RawColumn({self.name!r}, {self.bounds!r}, {self.data_type!r})"
+
+    @property
+    def cells(self) -> typing.List[typing.Optional[str]]:
+        """Get the cells of the column, cutting them out of its rows if needed."""
+        if self._cells is not None:
+            return self._cells
+        if self._rows is None:
+            return []
+        return self._rows.cut(self.bounds, self._index)
 
     @property
     def data_type(self) -> typing.Optional[str]:
@@ -161,7 +340,25 @@ class RawColumn:
 
     def to_values(self) -> typing.List[typing.Any]:
         """Cast cell data to values."""
-        return [_cast.cast_to(v, self.modifiers.data_type or "str") for v in self.cells]
+        return _cast.cast_all(self.cells, self.modifiers.data_type or "str")
+
+    def to_array(self) -> typing.Optional["pa.Array"]:
+        """Cast cell data to an Arrow array, if it can be cast in vectorized passes."""
+        cells: typing.Any = self._cells
+        if cells is None:
+            rows = self._rows
+            cells = [] if rows is None else rows.cut_arrow(self.bounds, self._index)
+        return _cast.to_arrow(cells, self.modifiers.data_type or "str")
+
+    def to_pandas_array(self) -> typing.Any:
+        """Cast cell data to a Pandas array, if it can be cast in vectorized passes."""
+        return _cast.to_pandas(self.cells, self.modifiers.data_type or "str")
+
+    def with_modifiers(self, modifiers: "_modifiers.ColumnModifiers") -> "RawColumn":
+        """Get a copy of the column, sharing its cells, with other modifiers."""
+        return RawColumn(
+            self.bounds, self.name, modifiers, self._cells, self._rows, self._index
+        )
 
     def should_skip(self, filters: typing.Set[str]) -> bool:
         """Whether the column should be skipped when loaded."""
@@ -185,50 +382,155 @@ class RawColumn:
 class RawTableBlock:
     """Data structure for raw table blocks."""
 
-    columns: typing.List["RawColumn"] = dataclasses.field(default_factory=lambda: [])
+    __slots__ = ("columns",)
 
+    columns: typing.List["RawColumn"]
 
-def _read_blocks(
-    lines: typing.List[str], modifier_prefix: str = "&"
-) -> typing.List["RawTableBlock"]:
-    """Read table block data into its raw separated format for parsing."""
-    blocks = []
 
+@dataclasses.dataclass()
+class _ColumnSelection:
+    """Selection of the columns to read by filters and requested column names."""
+
+    filters: typing.Set[str] = dataclasses.field(default_factory=set)
+    names: typing.Optional[typing.Set[str]] = None
+    #: Whether index columns are selected regardless of the requested names, which
+    #: is the case for Pandas where they are the index rather than columns, and for
+    #: Arrow where they are the index of the Pandas DataFrames converted from it.
+    keeps_index: bool = False
+    #: Names of all columns considered for selection, used to find missing names.
+    found: typing.Set[str] = dataclasses.field(default_factory=set)
+
+    def includes(self, column: "RawColumn") -> bool:
+        """Whether the column is selected to be read."""
+        self.found.add(column.name)
+        return not column.should_skip(self.filters) and (
+            self.names is None
+            or column.name in self.names
+            or (self.keeps_index and bool(column.modifiers.index))
+        )
+
+    def validate(self) -> None:
+        """Raise an error if requested columns were not found in any header."""
+        missing = sorted((self.names or set()) - self.found)
+        if missing:
+            raise ValueError(f"Requested columns were not found: {missing}.")
+
+
+def _to_selection(
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    kind: typing.Optional[typing.Literal["pandas", "polars", "arrow"]] = None,
+) -> "_ColumnSelection":
+    """Create the column selection for the filters and requested column names."""
+    return _ColumnSelection(
+        filters=set(filters or []),
+        names=None if columns is None else {str(c) for c in columns},
+        keeps_index=kind in ("pandas", "arrow"),
+    )
+
+
+def _to_row_range(
+    nrows: typing.Optional[int], skip_rows: int
+) -> typing.Optional[range]:
+    """Create the range of the data rows to read from each block, if limited."""
+    if nrows is not None and nrows < 0:
+        raise ValueError(f"The number of rows must not be negative, not {nrows}.")
+    if skip_rows < 0:
+        raise ValueError(f"The rows to skip must not be negative, not {skip_rows}.")
+    if nrows is None and skip_rows == 0:
+        return None
+
+    stop = skip_rows + nrows if nrows is not None else sys.maxsize
+    return range(skip_rows, stop)
+
+
+def _to_raw_block(
+    column_boundaries: typing.List["ColumnBounds"],
+    column_names: typing.List[str],
+    column_modifiers: typing.List[typing.List[typing.Optional[str]]],
+    rows: "RawRows",
+    modifier_prefix: str,
+) -> "RawTableBlock":
+    """Assemble the buffered rows of a block into a RawTableBlock of its columns."""
+    return RawTableBlock(
+        [
+            RawColumn(
+                bounds=bounds,
+                name=name,
+                modifiers=_modifiers.parse(modifiers, modifier_prefix),
+                rows=rows,
+                index=index,
+            )
+            for index, (bounds, name, modifiers) in enumerate(
+                zip(column_boundaries, column_names, column_modifiers)
+            )
+        ]
+    )
+
+
+class _Token(enum.IntEnum):
+    """Kinds of tokens emitted while tokenizing the lines of table blocks."""
+
+    #: Multiple blank lines were followed by content, which ends the current block.
+    BLOCK = 0
+    #: Header row of a block with a (boundaries, names) payload.
+    HEADER = 1
+    #: Modifier row of a block with the row's cells as payload.
+    MODIFIER = 2
+    #: Data row of a block with the row's cells as payload.
+    ROW = 3
+
+
+def _tokenize(
+    lines: typing.Iterable[str],
+    modifier_prefix: str = "&",
+    slice_rows: bool = True,
+    select: typing.Optional[typing.Callable[[], typing.List[int]]] = None,
+    rows: typing.Optional[range] = None,
+    lines_as_rows: bool = False,
+) -> typing.Iterator[typing.Tuple["_Token", typing.Any]]:
+    """
+    Tokenize table block lines into header, modifier and data row cells.
+
+    When slice_rows is False, data rows are emitted with a None payload and are
+    only cut into cells when needed to follow backslash continuations, which makes
+    it possible to cheaply scan for the layout of the blocks.
+
+    When select is specified, it is called as the first data row of each block is
+    reached, after the header and modifier tokens of the block have been consumed,
+    and the data rows of the block are only cut into the cells of the column
+    indexes that it returns.
+
+    When rows is specified, only the data rows of each block at those positions are
+    cut into cells and the others are emitted with a None payload. Rows that span
+    multiple lines with backslash continuations count as a single row.
+
+    When lines_as_rows is True, data rows that can be cut into cells at the column
+    boundaries are emitted with their line as payload instead of their cells, which
+    leaves the cells to be cut from the line when needed.
+    """
+    remaining = iter(lines)
     column_boundaries: typing.List[ColumnBounds] = []
-    column_names: typing.List[str] = []
-    column_modifiers: typing.List[typing.List[typing.Optional[str]]] = []
-    column_data: typing.List[typing.List[typing.Optional[str]]] = []
+    has_header = False
+    slice_line = _compile_row_slicer(column_boundaries)
+    slice_row = slice_line
+    is_aligned = _compile_row_check(column_boundaries)
+    selected: typing.Optional[typing.List[int]] = None
+    row_position = 0
 
-    remaining_lines = lines.copy()
     contiguous_blank_line_count = 0
-    while remaining_lines:
-        raw = remaining_lines.pop(0)
+    for raw in remaining:
         stripped = raw.strip()
 
         start_new_block = (
-            len(stripped) > 0
-            and len(column_names) > 0
-            and contiguous_blank_line_count > 1
+            len(stripped) > 0 and has_header and contiguous_blank_line_count > 1
         )
         if start_new_block:
             # A row of multiple blank lines starts a new block.
             contiguous_blank_line_count = 0
-            columns = [
-                RawColumn(
-                    bounds=bounds,
-                    name=name,
-                    modifiers=_modifiers.parse(modifiers, modifier_prefix),
-                    cells=cells,
-                )
-                for bounds, name, modifiers, cells in zip(
-                    column_boundaries, column_names, column_modifiers, column_data
-                )
-            ]
-            blocks.append(RawTableBlock(columns))
             column_boundaries = []
-            column_names = []
-            column_modifiers = []
-            column_data = []
+            has_header = False
+            yield _Token.BLOCK, None
 
         if not stripped:
             contiguous_blank_line_count += 1
@@ -242,36 +544,304 @@ def _read_blocks(
 
         if not column_boundaries:
             column_boundaries = _find_boundaries(raw)
-            column_modifiers = [[] for _ in range(len(column_boundaries))]
-            column_data = [[] for _ in range(len(column_boundaries))]
+            slice_line = _compile_row_slicer(column_boundaries)
+            slice_row = slice_line
+            is_aligned = _compile_row_check(column_boundaries)
+            selected = None
+            row_position = 0
+
+        is_row = has_header and not stripped.startswith(modifier_prefix)
+        is_sliced = slice_rows
+        if is_row:
+            is_sliced = slice_rows and (rows is None or row_position in rows)
+            row_position += 1
+
+        if is_row and not is_sliced and "\\" not in raw:
+            yield _Token.ROW, None
+            continue
 
-        exploded, continuation = _explode_line(column_boundaries, raw)
-        while continuation:
-            exploded_continued, continuation = _explode_line(
-                column_boundaries, remaining_lines.pop(0)
-            )
-            exploded = _combine_cells_across_lines(exploded, exploded_continued)
+        if is_row and is_sliced and select is not None and selected is None:
+            selected = select()
+            selected_boundaries = [column_boundaries[i] for i in selected]
+            slice_row = _compile_row_slicer(selected_boundaries)
+            is_aligned = _compile_row_check(selected_boundaries)
+
+        has_quotes = "'" in raw or '"' in raw
+        if (
+            is_row
+            and is_sliced
+            and lines_as_rows
+            and not has_quotes
+            and is_aligned(raw)
+        ):
+            yield _Token.ROW, raw
+            continue
+
+        # Modifier rows apply to every column and so are never narrowed by select.
+        sliced = slice_row(raw) if is_row else slice_line(raw)
+        if sliced is not None:
+            exploded, continuation = sliced, False
+        else:
+            exploded, continuation = _explode_line(column_boundaries, raw)
+        if continuation:
+            exploded = _continue_cells(column_boundaries, exploded, remaining)
+
+        if sliced is None and is_row and selected is not None:
+            # Continuations depend on every cell of the row and so rows that are not
+            # sliced are exploded in full before they are narrowed.
+            exploded = [exploded[i] for i in selected]
+
+        if not has_header:
+            has_header = True
+            yield _Token.HEADER, (column_boundaries, [n or "" for n in exploded])
+        elif is_row:
+            yield _Token.ROW, exploded if is_sliced else None
+        else:
+            yield _Token.MODIFIER, exploded
+
+
+@dataclasses.dataclass()
+class _BlockScan:
+    """Lines of a table block with the features found by pre-scanning them."""
+
+    lines: typing.List[str] = dataclasses.field(default_factory=list)
+    #: Lines of the header and modifier rows of the block.
+    heading: typing.List[str] = dataclasses.field(default_factory=list)
+    #: Lines of the data rows of the block, without comments and blank lines.
+    rows: typing.List[str] = dataclasses.field(default_factory=list)
+    #: Whether any of the lines has backslashes, which continue cells.
+    has_continuations: bool = False
+    #: Whether any of the lines has quotes, which can quote cells.
+    has_quotes: bool = False
+    #: Whether any modifier rows follow data rows of the block.
+    has_late_modifiers: bool = False
 
-        if not column_names:
-            column_names = [n or "" for n in exploded]
+    @property
+    def is_plain(self) -> bool:
+        """Whether every row is a single line whose cells are never quoted."""
+        return not (
+            self.has_continuations or self.has_quotes or self.has_late_modifiers
+        )
+
+
+def _scan_blocks(
+    lines: typing.Iterable[str], modifier_prefix: str
+) -> typing.List["_BlockScan"]:
+    """
+    Split the lines of a frame into the lines of its blocks without cutting rows.
+
+    Blocks, comments, header, modifier and data rows are found as the tokenizer
+    finds them, along with the features of each block that decide how cheaply its
+    rows can be cut into cells.
+    """
+    blocks: typing.List[_BlockScan] = []
+    block = _BlockScan()
+    boundaries: typing.List[ColumnBounds] = []
+    contiguous_blank_line_count = 0
+    continues = False
+    for line in lines:
+        if continues:
+            # Continued rows take the following lines whatever they hold.
+            block.lines.append(line)
+            continues = "\\" in line and _explode_line(boundaries, line)[1]
+            continue
+
+        stripped = line.strip()
+        if not stripped:
+            contiguous_blank_line_count += 1
+            block.lines.append(line)
+            continue
+
+        if block.heading and contiguous_blank_line_count > 1:
+            # A row of multiple blank lines starts a new block.
+            blocks.append(block)
+            block = _BlockScan()
+
+        contiguous_blank_line_count = 0
+        block.lines.append(line)
+        if stripped.startswith("#"):
+            continue
+
+        if not block.heading:
+            boundaries = _find_boundaries(line)
+        if "\\" in line:
+            block.has_continuations = True
+            continues = _explode_line(boundaries, line)[1]
+        if "'" in line or '"' in line:
+            block.has_quotes = True
+
+        if not block.heading:
+            block.heading.append(line)
         elif stripped.startswith(modifier_prefix):
-            column_modifiers = _append_columnwise(column_modifiers, exploded)
+            block.has_late_modifiers = block.has_late_modifiers or bool(block.rows)
+            block.heading.append(line)
         else:
-            column_data = _append_columnwise(column_data, exploded)
+            block.rows.append(line)
 
-    if column_names:
-        columns = [
+    if block.heading:
+        blocks.append(block)
+    return blocks
+
+
+def _read_plain_block(
+    block: "_BlockScan",
+    modifier_prefix: str,
+    selection: typing.Optional["_ColumnSelection"],
+    rows: typing.Optional[range],
+) -> "RawTableBlock":
+    """
+    Read a plain block without tokenizing it line by line.
+
+    Rows of plain blocks are single lines without quoted cells and so, other than
+    those that are not aligned with the columns, are held as their lines as they
+    are without any checks for quotes or continuations.
+    """
+    header, *modifier_lines = block.heading
+    boundaries = _find_boundaries(header)
+    names = [name or "" for name in _explode_line(boundaries, header)[0]]
+    modifiers: typing.List[typing.List[typing.Optional[str]]]
+    modifiers = [[] for _ in boundaries]
+    for line in modifier_lines:
+        _append_columnwise(modifiers, _explode_line(boundaries, line)[0])
+
+    data = block.rows if rows is None else block.rows[rows.start : rows.stop]
+    raw = _to_raw_block(boundaries, names, modifiers, RawRows(), modifier_prefix)
+    selected = list(range(len(boundaries)))
+    if selection is not None and data:
+        selected = [i for i, c in enumerate(raw.columns) if selection.includes(c)]
+
+    raw_rows = RawRows()
+    raw_rows.lines = list(data)
+    is_aligned = _compile_row_check([boundaries[i] for i in selected])
+    for position, line in enumerate(data):
+        if not is_aligned(line):
+            cells = _explode_line(boundaries, line)[0]
+            raw_rows.positions.append(position)
+            raw_rows.exploded.append([cells[i] for i in selected])
+
+    return RawTableBlock(
+        [
             RawColumn(
-                bounds=bounds,
-                name=name,
-                modifiers=_modifiers.parse(modifiers, modifier_prefix),
-                cells=cells,
-            )
-            for bounds, name, modifiers, cells in zip(
-                column_boundaries, column_names, column_modifiers, column_data
+                bounds=column.bounds,
+                name=column.name,
+                modifiers=column.modifiers,
+                rows=raw_rows,
+                index=index,
             )
+            for index, column in enumerate([raw.columns[i] for i in selected])
         ]
-        blocks.append(RawTableBlock(columns))
+    )
+
+
+def _read_blocks(
+    lines: typing.Iterable[str],
+    modifier_prefix: str = "&",
+    selection: typing.Optional["_ColumnSelection"] = None,
+    rows: typing.Optional[range] = None,
+) -> typing.List["RawTableBlock"]:
+    """
+    Read table block data into its raw separated format for parsing.
+
+    When a selection is specified, the data rows are only cut into the cells of the
+    selected columns and the blocks only hold those columns, except for blocks
+    without data rows.
+
+    When rows is specified, only the data rows at those positions within each block
+    are read, which keeps the rows of wrapped blocks aligned.
+
+    Each block is pre-scanned for quotes, backslash continuations and modifier rows
+    following its data rows. Blocks without any of them are read without the
+    tokenizer, which is only needed for the others.
+    """
+    blocks: typing.List[RawTableBlock] = []
+    for block in _scan_blocks(lines, modifier_prefix):
+        if block.is_plain:
+            blocks.append(_read_plain_block(block, modifier_prefix, selection, rows))
+        else:
+            blocks.extend(
+                _tokenize_blocks(block.lines, modifier_prefix, selection, rows)
+            )
+    return blocks
+
+
+def _tokenize_blocks(
+    lines: typing.Iterable[str],
+    modifier_prefix: str = "&",
+    selection: typing.Optional["_ColumnSelection"] = None,
+    rows: typing.Optional[range] = None,
+) -> typing.List["RawTableBlock"]:
+    """Read table blocks into their raw format by tokenizing them line by line."""
+    blocks = []
+
+    column_boundaries: typing.List[ColumnBounds] = []
+    column_names: typing.List[str] = []
+    column_modifiers: typing.List[typing.List[typing.Optional[str]]] = []
+    column_data = RawRows()
+    selected: typing.Optional[typing.List[int]] = None
+
+    def select_columns() -> typing.List[int]:
+        nonlocal selected, column_data
+        selected = find_selected()
+        column_data = RawRows()
+        return selected
+
+    def find_selected() -> typing.List[int]:
+        block = _to_raw_block(
+            column_boundaries,
+            column_names,
+            column_modifiers,
+            RawRows(),
+            modifier_prefix,
+        )
+        selector = typing.cast(_ColumnSelection, selection)
+        return [i for i, c in enumerate(block.columns) if selector.includes(c)]
+
+    def to_block() -> "RawTableBlock":
+        if selected is None:
+            return _to_raw_block(
+                column_boundaries,
+                column_names,
+                column_modifiers,
+                column_data,
+                modifier_prefix,
+            )
+        return _to_raw_block(
+            [column_boundaries[i] for i in selected],
+            [column_names[i] for i in selected],
+            [column_modifiers[i] for i in selected],
+            column_data,
+            modifier_prefix,
+        )
+
+    tokens = _tokenize(
+        lines,
+        modifier_prefix,
+        select=select_columns if selection else None,
+        rows=rows,
+        lines_as_rows=True,
+    )
+    for token, payload in tokens:
+        if token is _Token.ROW:
+            if payload is not None:
+                column_data.append(payload)
+        elif token is _Token.MODIFIER:
+            _append_columnwise(column_modifiers, payload)
+            if selected is not None and find_selected() != selected:
+                raise ValueError(
+                    "Modifier rows that change the selected columns must precede "
+                    "the data rows of a block."
+                )
+        elif token is _Token.HEADER:
+            column_boundaries, column_names = payload
+            column_modifiers = [[] for _ in range(len(column_boundaries))]
+            column_data = RawRows()
+            selected = None
+        else:
+            blocks.append(to_block())
+            column_names = []
+
+    if column_names:
+        blocks.append(to_block())
 
     return blocks
 
@@ -279,8 +849,10 @@ def _read_blocks(
 def _append_columnwise(
     existing: typing.List[typing.List[typing.Optional[str]]],
     new_cells: typing.List[typing.Optional[str]],
-) -> typing.List[typing.List[typing.Optional[str]]]:
-    return [[*column, cell] for column, cell in zip(existing, new_cells)]
+) -> None:
+    """Append the cells of a row onto the end of their respective column buffers."""
+    for column, cell in zip(existing, new_cells):
+        column.append(cell)
 
 
 def _find_boundaries(first_header_line: str) -> typing.List["ColumnBounds"]:
@@ -304,6 +876,67 @@ def _find_boundaries(first_header_line: str) -> typing.List["ColumnBounds"]:
     return columns
 
 
+def _compile_row_check(
+    boundaries: typing.List["ColumnBounds"],
+) -> typing.Callable[[str], bool]:
+    """
+    Compile the column boundaries of a block into a check of aligned rows.
+
+    Rows are aligned when they can be cut into cells at the boundaries, which are
+    not rows with hanging columns, negatively aligned cells or backslash
+    continuations. Quoted cells are not checked for.
+    """
+    gutters = [b.start_index - 1 for b in boundaries if b.start_index > 0]
+    minimum_length = boundaries[-1].start_index + 1 if boundaries else 0
+    get_gutters = operator.itemgetter(*gutters) if gutters else None
+    blank_gutters = get_gutters(" " * minimum_length) if get_gutters else None
+    has_columns = bool(boundaries)
+
+    def is_aligned(line: str) -> bool:
+        return (
+            has_columns
+            and len(line) >= minimum_length
+            and "\\" not in line
+            and (get_gutters is None or get_gutters(line) == blank_gutters)
+        )
+
+    return is_aligned
+
+
+def _compile_row_slicer(
+    boundaries: typing.List["ColumnBounds"],
+) -> typing.Callable[[str], typing.Optional[typing.List[typing.Optional[str]]]]:
+    """
+    Compile the column boundaries of a block into a single row-splitting routine.
+
+    The returned function cuts a row into all of its cells with one C-level
+    itemgetter call. It returns None for rows that need the per-cell handling of
+    _explode_line instead: rows with hanging columns, negatively aligned cells,
+    quoted cells or backslash continuations.
+    """
+    slices = [slice(b.start_index, b.end_index) for b in boundaries]
+    is_aligned = _compile_row_check(boundaries)
+
+    # Itemgetter returns a bare item instead of a tuple when given a single key.
+    get_cells = operator.itemgetter(*slices) if slices else None
+    is_single_column = len(slices) == 1
+
+    def slice_row(line: str) -> typing.Optional[typing.List[typing.Optional[str]]]:
+        if get_cells is None or not is_aligned(line):
+            return None
+
+        sliced = get_cells(line)
+        if is_single_column:
+            sliced = (sliced,)
+        cells = [cell.strip() for cell in sliced]
+        has_quotes = "'" in line or '"' in line
+        if has_quotes and any(cell.startswith(_QUOTE_CHARACTERS) for cell in cells):
+            return None
+        return typing.cast(typing.List[typing.Optional[str]], cells)
+
+    return slice_row
+
+
 def _extract_cell(
     bounds: "ColumnBounds", line: str
 ) -> typing.Tuple[typing.Optional[str], bool]:
@@ -346,41 +979,105 @@ def _explode_line(
     return cells, continues_on_next_line
 
 
-def _combine_cells_across_lines(
-    existing: typing.List[typing.Optional[str]],
-    continuations: typing.List[typing.Optional[str]],
+def _continue_cells(
+    boundaries: typing.List["ColumnBounds"],
+    cells: typing.List[typing.Optional[str]],
+    remaining: typing.Iterator[str],
 ) -> typing.List[typing.Optional[str]]:
-    combined: typing.List[typing.Optional[str]] = []
-    for prefix, suffix in zip(existing, continuations):
-        if prefix is None and suffix is None:
-            combined.append(None)
-        elif prefix is None:
-            combined.append(suffix)
-        elif suffix is None:
-            combined.append(prefix)
-        else:
-            combined.append(f"{prefix}{suffix}")
-    return combined
+    """
+    Combine the cells of a row with those of the lines it continues onto.
+
+    The fragments of each cell are collected and joined once the row ends, which
+    keeps rows continued across many lines from copying their cells for each line.
+    """
+    fragments = [[] if cell is None else [cell] for cell in cells]
+    continuation = True
+    while continuation:
+        following = next(remaining, None)
+        if following is None:
+            break
+        continued, continuation = _explode_line(boundaries, following)
+        for parts, cell in zip(fragments, continued):
+            if cell is not None:
+                parts.append(cell)
+    return ["".join(parts) if parts else None for parts in fragments]
+
+
+def _to_engine_array(
+    column: "RawColumn", engine: EngineType
+) -> typing.Optional["pa.Array"]:
+    """
+    Cast the cells of the column into an Arrow array if they are cast with Arrow.
+
+    Columns of decimal[precision,scale] data types are cast with Arrow by every
+    engine, as the native decimal columns they are read into hold Arrow arrays,
+    instead of creating a Python Decimal for each of their cells.
+    """
+    is_native_decimal = _cast.to_decimal_type(column.data_type) is not None
+    if engine == "arrow" or (is_native_decimal and pa is not None):
+        return column.to_array()
+    return None
+
+
+def _to_pandas_values(column: "RawColumn", engine: EngineType) -> typing.Any:
+    """Cast the cells of the column into values to create a Pandas Series from."""
+    if engine == "pandas":
+        values = column.to_pandas_array()
+        return column.to_values() if values is None else values
+
+    array = _to_engine_array(column, engine)
+    if array is None:
+        return column.to_values()
+    if array.null_count and (column.data_type or "").startswith("int"):
+        # NumPy integer columns cannot hold missing values, which raise the same
+        # errors as by default when cast one at a time.
+        return column.to_values()
+    if _cast.to_decimal_type(column.data_type) is not None:
+        return pd.arrays.ArrowExtensionArray(array)
+    return array.to_pandas(coerce_temporal_nanoseconds=True).array
+
+
+def _to_pandas(
+    columns: typing.List["RawColumn"],
+    dtypes: typing.Optional[typing.Sequence[typing.Any]] = None,
+    engine: EngineType = "python",
+):
+    """
+    Convert raw columns into a Pandas DataFrame.
 
+    Explicit dtypes, aligned with the columns, can be specified to keep frames
+    built from parts of a column consistent with the column as a whole.
 
-def _to_pandas(columns: typing.List["RawColumn"]):
+    The arrow and pandas engines cast the cells of each column in vectorized
+    passes, falling back to casting them one at a time for columns they cannot cast.
+    """
     if pd is None:
         raise RuntimeError("No pandas module was found.")
 
     if not columns:
         return pd.DataFrame([])
 
+    column_values = [_to_pandas_values(c, engine) for c in columns]
+    if dtypes is None:
+        dtypes = [
+            _cast.to_pandas_dtype(c.data_type or "object", values)
+            for c, values in zip(columns, column_values)
+        ]
+    column_values = [
+        _cast.to_pandas_categorical(values, dtype)
+        if _cast.is_categorical(c.data_type)
+        else values
+        for c, values, dtype in zip(columns, column_values, dtypes)
+    ]
+
     indexes: typing.Union[None, pd.Series, typing.List[pd.Series]]
     indexes = [
         pd.Series(
-            (values := c.to_values()),
+            values,
             name=_cast.cast_to(c.name, c.modifiers.name_data_type or "str"),
-            dtype=_cast.to_pandas_dtype(  # type: ignore
-                c.data_type or "object",
-                values,
-            ),
+            dtype=dtype,
         )
-        for c in columns
+        for c, values, dtype in zip(columns, column_values, dtypes)
         if c.modifiers.index
     ]
     if len(indexes) == 1:
@@ -389,27 +1086,35 @@ def _to_pandas(columns: typing.List["RawColumn"]):
         indexes = None
 
     series: typing.Dict[typing.Any, pd.Series] = {}
-    for column in columns:
+    for column, values, dtype in zip(columns, column_values, dtypes):
         if column.modifiers.index:
             continue
 
         name = _cast.cast_to(column.name, column.modifiers.name_data_type or "str")
-        values = column.to_values()
-        dtype = _cast.to_pandas_dtype(
-            column.data_type or "object",
-            values,
-        )
         series[name] = pd.Series(
             values,
             name=name,
-            dtype=dtype,  # type: ignore
+            dtype=dtype,
             index=indexes,
         )
 
     return pd.DataFrame(series)
 
 
-def _to_polars(columns: typing.List["RawColumn"]):
+def _to_polars(
+    columns: typing.List["RawColumn"],
+    dtypes: typing.Optional[typing.Sequence[typing.Any]] = None,
+    engine: EngineType = "python",
+):
+    """
+    Convert raw columns into a Polars DataFrame.
+
+    Explicit dtypes, aligned with the columns, can be specified to keep frames
+    built from parts of a column consistent with the column as a whole.
+
+    The arrow engine casts the cells of each column in vectorized passes, falling
+    back to casting them one at a time for columns it cannot cast.
+    """
     if pl is None:
         raise RuntimeError("No polars module was found.")
 
@@ -417,17 +1122,595 @@ def _to_polars(columns: typing.List["RawColumn"]):
         return pl.DataFrame([])
 
     series: typing.List[pl.Series] = []
-    for column in columns:
+    for index, column in enumerate(columns):
+        array = _to_engine_array(column, engine)
+        if array is not None:
+            # Arrow decimals are otherwise converted into floats by Polars.
+            with pl.Config(activate_decimals=str(array.type).startswith("decimal")):
+                created = pl.Series(column.name, array)
+            if _cast.infers_polars_dtype(column.data_type) and isinstance(
+                created.dtype, pl.Decimal
+            ):
+                # Decimals inferred from their values have no precision by default.
+                created = created.cast(pl.Decimal(None, created.dtype.scale))
+            series.append(created)
+            continue
+
         values = column.to_values()
-        series.append(
-            pl.Series(
-                column.name,
-                values,
-                dtype=_cast.to_polars_dtype(column.data_type, values),
+        if dtypes is None:
+            dtype = _cast.to_polars_dtype(column.data_type, values)
+            created = pl.Series(column.name, values, dtype=dtype)
+            if isinstance(dtype, pl.Decimal):
+                # Polars infers the precision and scale of decimals from the values.
+                created = created.cast(dtype)
+            series.append(created)
+        elif (explicit := dtypes[index]) is None:
+            series.append(pl.Series(column.name, values))
+        else:
+            # Columns without any values lose the parameters of dtypes like
+            # decimals unless they are cast to the dtype afterwards.
+            series.append(pl.Series(column.name, values, dtype=explicit).cast(explicit))
+
+    return pl.DataFrame(series)
+
+
+def _to_arrow_array(column: "RawColumn", engine: EngineType) -> "pa.Array":
+    """Cast the cells of the column into an Arrow array."""
+    data_type = column.data_type or "str"
+    if _cast.is_categorical(data_type):
+        values = pa.array(column.to_values(), pa.string())
+        categories = pa.array(
+            _cast.to_arrow_categories(data_type, pc.unique(values).to_pylist()),
+            pa.string(),
+        )
+        return pa.DictionaryArray.from_arrays(
+            pc.index_in(values, value_set=categories),
+            categories,
+            ordered=_cast.is_ordered(data_type),
+        )
+
+    array = _to_engine_array(column, engine)
+    if array is None:
+        decimal_type = _cast.to_decimal_type(data_type)
+        arrow_type = None if decimal_type is None else pa.decimal128(*decimal_type)
+        return pa.array(column.to_values(), arrow_type)
+    return array
+
+
+def _to_arrow(columns: typing.List["RawColumn"], engine: EngineType = "python"):
+    """
+    Convert raw columns into an Arrow Table.
+
+    Categorical columns become dictionary arrays with the ordering of their
+    categories. Index columns are fields of the table and are identified in the
+    Pandas schema metadata, which makes them the index when converted to Pandas.
+    """
+    if pa is None:
+        raise RuntimeError("No pyarrow module was found.")
+
+    table = pa.table(
+        [_to_arrow_array(column, engine) for column in columns],
+        names=[column.name for column in columns],
+    )
+    indexes = [column.name for column in columns if column.modifiers.index]
+    if not indexes:
+        return table
+
+    metadata = {
+        "index_columns": indexes,
+        "column_indexes": [],
+        "columns": [
+            {
+                "name": name,
+                "field_name": name,
+                "pandas_type": "unknown",
+                "numpy_type": "object",
+                "metadata": None,
+            }
+            for name in indexes
+        ],
+    }
+    return table.replace_schema_metadata({"pandas": json.dumps(metadata)})
+
+
+def _read_frame(
+    lines: typing.Iterable[str],
+    kind: typing.Literal["pandas", "polars", "arrow"],
+    selection: "_ColumnSelection",
+    modifier_prefix: str,
+    rows: typing.Optional[range] = None,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
+):
+    """Read the lines of a frame into a Pandas, Polars or Arrow frame."""
+    if engine not in _ENGINES:
+        raise ValueError(f"Engine must be one of {_ENGINES}, not {engine!r}.")
+    if engine in ("pandas", "polars") and kind != engine:
+        raise ValueError(f"The {engine} engine cannot read {kind} frames.")
+
+    if engine == "polars":
+        return _polars.read_frame(
+            lines, modifier_prefix, selection, rows, dictionary_encode
+        )
+    blocks = _read_blocks(lines, modifier_prefix, selection, rows)
+    return _to_data_frame(blocks, kind, selection, engine, dictionary_encode)
+
+
+def _encode_strings(columns: typing.List["RawColumn"]) -> typing.List["RawColumn"]:
+    """
+    Read the string columns as categorical columns to dictionary-encode them.
+
+    Each distinct string is then stored once, with the cells of the column holding
+    codes into the distinct strings, which becomes a Pandas Categorical, a Polars
+    Categorical or an Arrow DictionaryArray. Index columns are left as strings.
+    """
+    return [
+        column.with_modifiers(
+            dataclasses.replace(column.modifiers, data_type="category")
+        )
+        if _cast.is_string(column.data_type) and not column.modifiers.index
+        else column
+        for column in columns
+    ]
+
+
+def _to_data_frame(
+    blocks: typing.List["RawTableBlock"],
+    kind: typing.Literal["pandas", "polars", "arrow"],
+    selection: typing.Optional["_ColumnSelection"] = None,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
+):
+    """Convert the raw table blocks of a frame into a Pandas, Polars or Arrow frame."""
+    selector = selection or _ColumnSelection()
+    raw_columns = [
+        column
+        for block in blocks
+        for column in block.columns
+        if selector.includes(column)
+    ]
+    if dictionary_encode:
+        raw_columns = _encode_strings(raw_columns)
+
+    if kind == "pandas":
+        return _to_pandas(raw_columns, engine=engine)
+    if kind == "arrow":
+        return _to_arrow(raw_columns, engine=engine)
+    return _to_polars(raw_columns, engine=engine)
+
+
+def _to_lines(text: str) -> typing.List[str]:
+    """Split dftxt text into normalized lines for reading."""
+    return text.replace("\r", "").replace("\t", "  ").split("\n")
+
+
+def _slice_lines(text: str, start: int, end: int) -> typing.List[str]:
+    """Split the range of the dftxt text into normalized lines for reading."""
+    return _to_lines(text[start:end])
+
+
+def _iter_text_sections(
+    text: str,
+) -> typing.Iterator[typing.Tuple[str, "_LinesLoader"]]:
+    """Split dftxt text into the names and lines of its data frame sections."""
+    offset = 0
+    next_name = ""
+    while offset < len(text):
+        match = _DATA_FRAME_SEPARATOR_REGEX.search(text, pos=offset)
+        start = offset
+        end = len(text) if not match else match.start()
+        offset = len(text) if not match else match.end()
+        if offset == start:
+            continue
+
+        yield next_name, functools.partial(_slice_lines, text, start, end)
+        next_name = match.group("name") if match else ""
+
+
+def _iter_markdown_sections(
+    markdown: str,
+    fences: typing.Optional[typing.Sequence[str]] = None,
+) -> typing.Iterator[typing.Tuple[str, "_LinesLoader"]]:
+    """
+    Find the names and lines of the data frame sections of the markdown fences.
+
+    The fences of each section are read directly from the markdown, instead of being
+    extracted into dftxt text that is then split into sections again.
+    """
+    for section in _markdown.iter_sections(markdown, fences):
+        yield section.name, section
+
+
+def _read_text(
+    path: pathlib.Path, encoding: str, content: typing.Optional[bytes] = None
+) -> str:
+    """Read the text of the file, or decode its content if already read, as text."""
+    if content is None:
+        return path.read_text(encoding)
+    # Universal newlines are translated as they are when reading the file as text.
+    return content.decode(encoding).replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _is_mappable(encoding: str) -> bool:
+    """Whether lines and separators can be found in the encoded bytes directly."""
+    characters = "\n\r\t -"
+    try:
+        return characters.encode(encoding) == characters.encode("ascii")
+    except (LookupError, UnicodeError):
+        return False
+
+
+@contextlib.contextmanager
+def _map_file(
+    path: pathlib.Path, content: typing.Optional[bytes] = None
+) -> typing.Iterator[typing.Union[bytes, mmap.mmap]]:
+    """Memory-map the file for reading, unless its content has already been read."""
+    if content is not None:
+        yield content
+        return
+
+    with path.open("rb") as handle:
+        if path.stat().st_size == 0:
+            # Empty files cannot be mapped.
+            yield b""
+            return
+
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+
+def _iter_mapped_lines(
+    buffer: typing.Union[bytes, mmap.mmap], start: int, end: int, encoding: str
+) -> typing.Iterator[str]:
+    """Decode the normalized lines within the byte range of the mapped file."""
+    position = start
+    while position <= end:
+        line_end = buffer.find(b"\n", position, end)
+        if line_end < 0:
+            line_end = end
+        line = buffer[position:line_end].decode(encoding)
+        yield line.replace("\r", "").replace("\t", "  ")
+        position = line_end + 1
+
+
+def _iter_remapped_lines(
+    path: pathlib.Path, start: int, end: int, encoding: str
+) -> typing.Iterator[str]:
+    """Map the file again to decode the normalized lines within the byte range."""
+    with _map_file(path) as buffer:
+        yield from _iter_mapped_lines(buffer, start, end, encoding)
+
+
+def _iter_mapped_sections(
+    buffer: typing.Union[bytes, mmap.mmap],
+    encoding: str,
+    path: typing.Optional[pathlib.Path] = None,
+) -> typing.Iterator[typing.Tuple[str, "_LinesLoader"]]:
+    """
+    Find the names and lines of the data frame sections of the mapped file.
+
+    If the path of the mapped file is specified, the lines of the sections are read
+    by mapping the file again, which allows them to be read after the buffer closes.
+    """
+    offset = 0
+    next_name = ""
+    while offset < len(buffer):
+        match = _DATA_FRAME_SEPARATOR_BYTES_REGEX.search(buffer, pos=offset)
+        start = offset
+        end = len(buffer) if not match else match.start()
+        offset = len(buffer) if not match else match.end()
+        if offset == start:
+            continue
+
+        if path is None:
+            yield (
+                next_name,
+                functools.partial(_iter_mapped_lines, buffer, start, end, encoding),
             )
+        else:
+            yield (
+                next_name,
+                functools.partial(_iter_remapped_lines, path, start, end, encoding),
+            )
+        next_name = match.group("name").decode(encoding) if match else ""
+
+
+def _has_columns(
+    lines: typing.Iterable[str],
+    kind: typing.Literal["pandas", "polars", "arrow"],
+    selection: "_ColumnSelection",
+    modifier_prefix: str,
+) -> bool:
+    """Whether a DataFrame read from the lines would have columns."""
+    has_columns = False
+    column_boundaries: typing.List[ColumnBounds] = []
+    column_names: typing.List[str] = []
+    column_modifiers: typing.List[typing.List[typing.Optional[str]]] = []
+    # Only the header and modifier lines of the blocks are needed, so data rows
+    # are scanned without slicing them into cells.
+    tokens = _tokenize(lines, modifier_prefix, slice_rows=False)
+    end: typing.List[typing.Tuple[_Token, typing.Any]] = [(_Token.BLOCK, None)]
+    for token, payload in itertools.chain(tokens, end):
+        if token is _Token.HEADER:
+            column_boundaries, column_names = payload
+            column_modifiers = [[] for _ in range(len(column_boundaries))]
+        elif token is _Token.MODIFIER:
+            _append_columnwise(column_modifiers, payload)
+        elif column_names:
+            block = _to_raw_block(
+                column_boundaries,
+                column_names,
+                column_modifiers,
+                RawRows(),
+                modifier_prefix,
+            )
+            included = [
+                column
+                for column in block.columns
+                if selection.includes(column)
+                # Pandas index columns are not columns of the DataFrame.
+                and not (kind == "pandas" and column.modifiers.index)
+            ]
+            has_columns = has_columns or len(included) > 0
+            # All headers are needed to find any missing requested columns.
+            if has_columns and selection.names is None:
+                return True
+            column_names = []
+    return has_columns
+
+
+def _read_section(
+    load_lines: "_LinesLoader",
+    kind: typing.Literal["pandas", "polars", "arrow"],
+    selection: "_ColumnSelection",
+    modifier_prefix: str,
+    rows: typing.Optional[range] = None,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
+):
+    """Read the lines of a data frame section into a Pandas or Polars DataFrame."""
+    return _read_frame(
+        load_lines(),
+        kind,
+        selection,
+        modifier_prefix,
+        rows,
+        engine,
+        dictionary_encode,
+    )
+
+
+def _split_blocks(
+    lines: typing.List[str], modifier_prefix: str
+) -> typing.List[typing.List[str]]:
+    """Split the lines of a section into the lines of each of its table blocks."""
+    return [block.lines for block in _scan_blocks(lines, modifier_prefix)] or [lines]
+
+
+def _read_section_lines(
+    lines: typing.List[str],
+    kind: typing.Literal["pandas", "polars", "arrow"],
+    selection: "_ColumnSelection",
+    modifier_prefix: str,
+    rows: typing.Optional[range],
+    engine: EngineType,
+    dictionary_encode: bool,
+) -> typing.Tuple[bytes, typing.Set[str]]:
+    """Read section lines into a pickled DataFrame and the column names found."""
+    data_frame = _read_section(
+        lambda: lines,
+        kind,
+        selection,
+        modifier_prefix,
+        rows,
+        engine,
+        dictionary_encode,
+    )
+    return _cache.dumps(data_frame), selection.found
+
+
+def _read_block_lines(
+    lines: typing.List[str],
+    selection: "_ColumnSelection",
+    modifier_prefix: str,
+    rows: typing.Optional[range],
+) -> typing.Tuple[typing.List["RawTableBlock"], typing.Set[str]]:
+    """Read the lines of a table block into raw blocks and the column names found."""
+    return _read_blocks(lines, modifier_prefix, selection, rows), selection.found
+
+
+def _submit_section(
+    executor: "futures.Executor",
+    load_lines: "_LinesLoader",
+    kind: typing.Literal["pandas", "polars", "arrow"],
+    selection: "_ColumnSelection",
+    modifier_prefix: str,
+    rows: typing.Optional[range],
+    engine: EngineType,
+    dictionary_encode: bool,
+) -> typing.Callable[[], typing.Any]:
+    """
+    Submit the section to be read by the executor and get a function to await it.
+
+    Large sections with multiple blocks have each block read by the executor, with
+    the columns of the blocks being combined into the DataFrame once awaited.
+    """
+    lines = list(load_lines())
+    blocks = [lines]
+    # The polars engine reads the blocks of each section in parallel by itself.
+    if len(lines) >= _PARALLEL_BLOCK_MIN_LINES and engine != "polars":
+        blocks = _split_blocks(lines, modifier_prefix)
+
+    if len(blocks) == 1:
+        future = executor.submit(
+            _read_section_lines,
+            lines,
+            kind,
+            selection,
+            modifier_prefix,
+            rows,
+            engine,
+            dictionary_encode,
         )
 
-    return pl.DataFrame(series)
+        def await_section() -> typing.Any:
+            data, found = future.result()
+            selection.found.update(found)
+            return pickle.loads(data)
+
+        return await_section
+
+    block_futures = [
+        executor.submit(_read_block_lines, block, selection, modifier_prefix, rows)
+        for block in blocks
+    ]
+
+    def await_blocks() -> typing.Any:
+        raw_blocks: typing.List[RawTableBlock] = []
+        for block_future in block_futures:
+            read_blocks, found = block_future.result()
+            selection.found.update(found)
+            raw_blocks.extend(read_blocks)
+        return _to_data_frame(raw_blocks, kind, selection, engine, dictionary_encode)
+
+    return await_blocks
+
+
+def _read_located(location: str, load_frame: typing.Callable[[], typing.Any]):
+    """Read the data frame, with errors reporting where it is found in the source."""
+    try:
+        return load_frame()
+    except ValueError as error:
+        raise ValueError(f"{error} (in the {location})") from error
+
+
+def _locate_errors(
+    load_lines: "_LinesLoader", load_frame: typing.Callable[[], typing.Any]
+) -> typing.Callable[[], typing.Any]:
+    """Wrap the reading of markdown sections to report their fence lines in errors."""
+    if isinstance(load_lines, _markdown.Section):
+        return functools.partial(_read_located, load_lines.location, load_frame)
+    return load_frame
+
+
+@contextlib.contextmanager
+def _open_executor(
+    workers: typing.Optional[int],
+    executor: typing.Optional["futures.Executor"],
+) -> typing.Iterator[typing.Optional["futures.Executor"]]:
+    """Open the executor for parallel reads, if any, shutting down created pools."""
+    if workers is not None and executor is not None:
+        raise ValueError("Only one of workers or executor can be specified.")
+    if workers is not None and workers < 1:
+        raise ValueError(f"Workers must be a positive integer, not {workers}.")
+
+    if executor is not None or workers is None or workers == 1:
+        yield executor
+        return
+
+    # Forked workers deadlock on the thread pools that libraries like Polars start in
+    # the parent process once used, which spawned workers do not inherit.
+    context = multiprocessing.get_context("spawn")
+    with futures.ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        yield pool
+
+
+def _to_loaded_data_frames(
+    sections: typing.Iterable[typing.Tuple[str, "_LinesLoader"]],
+    kind: typing.Literal["pandas", "polars", "arrow"],
+    filters: typing.Union[str, typing.Sequence[str], None],
+    modifier_prefix: str,
+    lazy: bool = False,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
+    executor: typing.Optional["futures.Executor"] = None,
+):
+    """
+    Read the data frame sections into Pandas or Polars DataFrames.
+
+    When lazy, only the headers and modifiers of the sections are read to find the
+    DataFrames and each DataFrame is read when it is first accessed.
+
+    When an executor is specified, all of the sections are submitted to it before
+    the DataFrames are collected from it in source order.
+    """
+    if lazy and executor is not None:
+        raise ValueError("Lazy reads cannot be read in parallel.")
+
+    selection = _to_selection(filters, columns, kind)
+    rows = _to_row_range(nrows, skip_rows)
+    loaders: typing.Iterable[
+        typing.Tuple[str, "_LinesLoader", typing.Callable[[], typing.Any]]
+    ] = (
+        (
+            name,
+            load_lines,
+            functools.partial(
+                _read_section,
+                load_lines,
+                kind,
+                selection,
+                modifier_prefix,
+                rows,
+                engine,
+                dictionary_encode,
+            ),
+        )
+        for name, load_lines in sections
+    )
+    if executor is not None:
+        loaders = [
+            (
+                name,
+                load_lines,
+                _submit_section(
+                    executor,
+                    load_lines,
+                    kind,
+                    selection,
+                    modifier_prefix,
+                    rows,
+                    engine,
+                    dictionary_encode,
+                ),
+            )
+            for name, load_lines, _ in loaders
+        ]
+
+    sourced_names: typing.List[typing.Optional[str]] = []
+    data_frames: typing.Dict[str, typing.Any] = {}
+    for name, load_lines, read_frame in loaders:
+        load_frame = _locate_errors(load_lines, read_frame)
+        sourced_name = name or None
+        frame_name = name or f"data_frame_{len(data_frames) + 1}"
+        if lazy:
+            if not _has_columns(load_lines(), kind, selection, modifier_prefix):
+                continue
+            data_frame: typing.Any = load_frame
+        else:
+            data_frame = load_frame()
+            if len(data_frame.columns) == 0:
+                continue
+
+        sourced_names.append(sourced_name)
+        data_frames[frame_name] = data_frame
+
+    selection.validate()
+    frames = _LazyDataFrames(data_frames) if lazy else data_frames
+    if kind == "pandas":
+        return LoadedDataFrames["pd.DataFrame"](
+            typing.cast(typing.Mapping[str, "pd.DataFrame"], frames), sourced_names
+        )
+    if kind == "arrow":
+        return LoadedDataFrames["pa.Table"](
+            typing.cast(typing.Mapping[str, "pa.Table"], frames), sourced_names
+        )
+    return LoadedDataFrames["pl.DataFrame"](
+        typing.cast(typing.Mapping[str, "pl.DataFrame"], frames), sourced_names
+    )
 
 
 @typing.overload
@@ -437,6 +1720,11 @@ def reads(
     filters: typing.Union[str, typing.Sequence[str], None] = None,
     markdown: bool = False,
     modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
 ) -> "pd.DataFrame":
     """Read dftxt string into a Pandas DataFrame."""
     ...
@@ -449,39 +1737,64 @@ def reads(
     filters: typing.Union[str, typing.Sequence[str], None] = None,
     markdown: bool = False,
     modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
 ) -> "pl.DataFrame":
     """Read dftxt string into a Polars DataFrame."""
     ...
 
 
+@typing.overload
+def reads(
+    table: str,
+    kind: typing.Literal["arrow"],
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
+) -> "pa.Table":
+    """Read dftxt string into an Arrow Table."""
+    ...
+
+
 def reads(
     table: str,
-    kind: typing.Literal["pandas", "polars"] = "pandas",
+    kind: typing.Literal["pandas", "polars", "arrow"] = "pandas",
     filters: typing.Union[str, typing.Sequence[str], None] = None,
     markdown: bool = False,
     modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
 ):
-    """Read dftxt string into a Pandas or Polars DataFrame."""
+    """Read dftxt string into a Pandas or Polars DataFrame, or an Arrow Table."""
     if markdown:
         source_text = _markdown.extract(table)
     else:
         source_text = table
 
-    blocks = _read_blocks(
-        source_text.replace("\r", "").replace("\t", "  ").split("\n"),
-        modifier_prefix=modifier_prefix,
+    selection = _to_selection(filters, columns, kind)
+    rows = _to_row_range(nrows, skip_rows)
+    data_frame = _read_frame(
+        _to_lines(source_text),
+        kind,
+        selection,
+        modifier_prefix,
+        rows,
+        engine,
+        dictionary_encode,
     )
-    distinct_filters = set(filters or [])
-    raw_columns = [
-        column
-        for block in blocks
-        for column in block.columns
-        if not column.should_skip(distinct_filters)
-    ]
-
-    if kind == "pandas":
-        return _to_pandas(raw_columns)
-    return _to_polars(raw_columns)
+    selection.validate()
+    return data_frame
 
 
 @typing.overload
@@ -491,6 +1804,15 @@ def reads_all(
     filters: typing.Union[str, typing.Sequence[str], None] = None,
     markdown: bool = False,
     modifier_prefix: str = "&",
+    lazy: bool = False,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
+    fences: typing.Optional[typing.Sequence[str]] = None,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional["futures.Executor"] = None,
 ) -> LoadedDataFrames["pd.DataFrame"]:
     """Read dftxt string into a tuple of Pandas DataFrames."""
     ...
@@ -503,57 +1825,95 @@ def reads_all(
     filters: typing.Union[str, typing.Sequence[str], None] = None,
     markdown: bool = False,
     modifier_prefix: str = "&",
+    lazy: bool = False,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
+    fences: typing.Optional[typing.Sequence[str]] = None,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional["futures.Executor"] = None,
 ) -> LoadedDataFrames["pl.DataFrame"]:
     """Read dftxt string into a tuple of Polars DataFrames."""
     ...
 
 
+@typing.overload
 def reads_all(
     tables: str,
-    kind: typing.Literal["pandas", "polars"] = "pandas",
+    kind: typing.Literal["arrow"],
     filters: typing.Union[str, typing.Sequence[str], None] = None,
     markdown: bool = False,
     modifier_prefix: str = "&",
-):
-    """Read dftxt string into a tuple of Pandas or Polars DataFrames."""
-    if markdown:
-        source_text = _markdown.extract(tables)
-    else:
-        source_text = tables
-    offset = 0
-    next_name = ""
-    sourced_names: typing.List[typing.Optional[str]] = []
-    data_frames: typing.Dict[str, typing.Union["pl.DataFrame", "pd.DataFrame"]] = {}
-    while offset < len(source_text):
-        match = _DATA_FRAME_SEPARATOR_REGEX.search(source_text, pos=offset)
-        start = offset
-        end = len(source_text) if not match else match.start()
-        offset = len(source_text) if not match else match.end()
-        if offset == start:
-            continue
+    lazy: bool = False,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
+    fences: typing.Optional[typing.Sequence[str]] = None,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional["futures.Executor"] = None,
+) -> LoadedDataFrames["pa.Table"]:
+    """Read dftxt string into a tuple of Arrow Tables."""
+    ...
+
 
-        data_frame = reads(
-            table=source_text[start:end],
+def reads_all(
+    tables: str,
+    kind: typing.Literal["pandas", "polars", "arrow"] = "pandas",
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    modifier_prefix: str = "&",
+    lazy: bool = False,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
+    fences: typing.Optional[typing.Sequence[str]] = None,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional["futures.Executor"] = None,
+):
+    """
+    Read dftxt string into a tuple of Pandas or Polars DataFrames, or Arrow Tables.
+
+    When lazy is True, only the data frame separators and the headers of the tables
+    are read up front and each DataFrame is read when it is first accessed.
+
+    When workers is greater than one, the DataFrames are read in parallel by a pool
+    of that many processes, as are the blocks of large DataFrames that are wrapped
+    across multiple blocks. An existing executor can be specified instead of workers
+    to share a pool between reads. The DataFrames are collected in source order.
+
+    When markdown is True, the dftxt fences are read directly from the markdown and
+    errors reading a DataFrame include the line numbers of its fences. When fences
+    are specified, only the fences with those names are read, where an empty name
+    selects the fences without a name.
+    """
+    if fences is not None and not markdown:
+        raise ValueError("Fences can only be selected from markdown.")
+
+    sections = (
+        _iter_markdown_sections(tables, fences)
+        if markdown
+        else _iter_text_sections(tables)
+    )
+    with _open_executor(workers, executor) as pool:
+        return _to_loaded_data_frames(
+            sections=sections,
             kind=kind,
             filters=filters,
             modifier_prefix=modifier_prefix,
-            markdown=False,
-        )
-        sourced_name = next_name or None
-        frame_name = next_name or f"data_frame_{len(data_frames) + 1}"
-        next_name = match.group("name") if match else ""
-
-        if len(data_frame.columns) > 0:
-            sourced_names.append(sourced_name)
-            data_frames[frame_name] = data_frame
-
-    if kind == "pandas":
-        return LoadedDataFrames["pd.DataFrame"](
-            typing.cast(typing.Dict[str, "pd.DataFrame"], data_frames), sourced_names
+            lazy=lazy,
+            columns=columns,
+            nrows=nrows,
+            skip_rows=skip_rows,
+            engine=engine,
+            dictionary_encode=dictionary_encode,
+            executor=pool,
         )
-    return LoadedDataFrames["pl.DataFrame"](
-        typing.cast(typing.Dict[str, "pl.DataFrame"], data_frames), sourced_names
-    )
 
 
 def reads_to_pandas(
@@ -561,6 +1921,11 @@ def reads_to_pandas(
     filters: typing.Union[str, typing.Sequence[str], None] = None,
     markdown: bool = False,
     modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
 ) -> "pd.DataFrame":
     """Read the table to a Pandas DataFrame."""
     return typing.cast(
@@ -571,6 +1936,11 @@ def reads_to_pandas(
             filters=filters,
             modifier_prefix=modifier_prefix,
             markdown=markdown,
+            columns=columns,
+            nrows=nrows,
+            skip_rows=skip_rows,
+            engine=engine,
+            dictionary_encode=dictionary_encode,
         ),
     )
 
@@ -580,6 +1950,14 @@ def reads_all_to_pandas(
     filters: typing.Union[str, typing.Sequence[str], None] = None,
     markdown: bool = False,
     modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
+    fences: typing.Optional[typing.Sequence[str]] = None,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional["futures.Executor"] = None,
 ) -> LoadedDataFrames["pd.DataFrame"]:
     """Read the table to Pandas DataFrames."""
     return reads_all(
@@ -588,6 +1966,14 @@ def reads_all_to_pandas(
         filters=filters,
         modifier_prefix=modifier_prefix,
         markdown=markdown,
+        columns=columns,
+        nrows=nrows,
+        skip_rows=skip_rows,
+        engine=engine,
+        dictionary_encode=dictionary_encode,
+        fences=fences,
+        workers=workers,
+        executor=executor,
     )
 
 
@@ -596,6 +1982,11 @@ def reads_to_polars(
     filters: typing.Union[str, typing.Sequence[str], None] = None,
     markdown: bool = False,
     modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
 ) -> "pl.DataFrame":
     """Read the table to a Polars DataFrame."""
     return typing.cast(
@@ -606,6 +1997,11 @@ def reads_to_polars(
             filters=filters,
             modifier_prefix=modifier_prefix,
             markdown=markdown,
+            columns=columns,
+            nrows=nrows,
+            skip_rows=skip_rows,
+            engine=engine,
+            dictionary_encode=dictionary_encode,
         ),
     )
 
@@ -615,6 +2011,14 @@ def reads_all_to_polars(
     filters: typing.Union[str, typing.Sequence[str], None] = None,
     markdown: bool = False,
     modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
+    fences: typing.Optional[typing.Sequence[str]] = None,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional["futures.Executor"] = None,
 ) -> LoadedDataFrames["pl.DataFrame"]:
     """Read the tables to Polars DataFrames."""
     return reads_all(
@@ -623,9 +2027,77 @@ def reads_all_to_polars(
         filters=filters,
         modifier_prefix=modifier_prefix,
         markdown=markdown,
+        columns=columns,
+        nrows=nrows,
+        skip_rows=skip_rows,
+        engine=engine,
+        dictionary_encode=dictionary_encode,
+        fences=fences,
+        workers=workers,
+        executor=executor,
     )
 
 
+def _copy_frame(data_frame: typing.Any) -> typing.Any:
+    """Copy the Pandas or Polars DataFrame, or Arrow Table."""
+    if pl is not None and isinstance(data_frame, pl.DataFrame):
+        # Polars DataFrames are immutable and so clones share their data.
+        return data_frame.clone()
+    if pa is not None and isinstance(data_frame, pa.Table):
+        # Arrow Tables are immutable and so can be shared as they are.
+        return data_frame
+    return data_frame.copy()
+
+
+def _copy_result(result: typing.Any) -> typing.Any:
+    """Copy the DataFrame or loaded DataFrames returned by a read."""
+    if isinstance(result, LoadedDataFrames):
+        return LoadedDataFrames(
+            {name: _copy_frame(frame) for name, frame in result.to_dict().items()},
+            list(result.sourced_frame_names),
+        )
+    return _copy_frame(result)
+
+
+def _estimate_size(result: typing.Any) -> int:
+    """Estimate the memory used by the DataFrame or loaded DataFrames."""
+    if isinstance(result, LoadedDataFrames):
+        return sum(_estimate_size(frame) for frame in result.to_tuple())
+    if pl is not None and isinstance(result, pl.DataFrame):
+        return int(result.estimated_size())
+    if pa is not None and isinstance(result, pa.Table):
+        return int(result.nbytes)
+    return int(result.memory_usage(index=True, deep=True).sum())
+
+
+def _load_cached(
+    source_path: pathlib.Path,
+    settings: typing.Dict[str, typing.Any],
+    read: typing.Callable[..., typing.Any],
+    cache_dir: typing.Union[pathlib.Path, str, None],
+    memoize: bool,
+) -> typing.Any:
+    """
+    Read the file through the persistent and in-memory caches when enabled.
+
+    The read function is given the content of the file as its content argument when
+    the file has already been read to create the persistent cache key.
+    """
+    load = functools.partial(
+        _cache.load,
+        cache_dir=cache_dir,
+        path=source_path,
+        settings=settings,
+        read=lambda content: read(content=content),
+    )
+    if not memoize:
+        return load()
+
+    key = _cache.to_memory_key(source_path, settings)
+    # Cached results are shared and so callers always receive copies of them.
+    return _copy_result(_cache.memory_cache.load(key, load, _estimate_size))
+
+
 @typing.overload
 def read(
     path: typing.Union[pathlib.Path, str],
@@ -634,6 +2106,14 @@ def read(
     markdown: bool = False,
     encoding: str = "utf-8",
     modifier_prefix: str = "&",
+    mmap: bool = False,
+    cache_dir: typing.Union[pathlib.Path, str, None] = None,
+    memoize: bool = False,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
 ) -> "pd.DataFrame":
     """Read dftxt file into a Pandas DataFrame."""
     ...
@@ -647,31 +2127,174 @@ def read(
     markdown: bool = False,
     encoding: str = "utf-8",
     modifier_prefix: str = "&",
+    mmap: bool = False,
+    cache_dir: typing.Union[pathlib.Path, str, None] = None,
+    memoize: bool = False,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
 ) -> "pl.DataFrame":
     """Read dftxt file into a Polars DataFrame."""
     ...
 
 
+@typing.overload
 def read(
     path: typing.Union[pathlib.Path, str],
-    kind: typing.Literal["pandas", "polars"] = "pandas",
+    kind: typing.Literal["arrow"],
     filters: typing.Union[str, typing.Sequence[str], None] = None,
     markdown: bool = False,
     encoding: str = "utf-8",
     modifier_prefix: str = "&",
+    mmap: bool = False,
+    cache_dir: typing.Union[pathlib.Path, str, None] = None,
+    memoize: bool = False,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
+) -> "pa.Table":
+    """Read dftxt file into an Arrow Table."""
+    ...
+
+
+def read(
+    path: typing.Union[pathlib.Path, str],
+    kind: typing.Literal["pandas", "polars", "arrow"] = "pandas",
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    encoding: str = "utf-8",
+    modifier_prefix: str = "&",
+    mmap: bool = False,
+    cache_dir: typing.Union[pathlib.Path, str, None] = None,
+    memoize: bool = False,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
 ):
-    """Read dftxt file into a Pandas or Polars DataFrame."""
+    """
+    Read dftxt file into a Pandas or Polars DataFrame, or an Arrow Table.
+
+    When mmap is True, the file is memory-mapped and only its lines are decoded as
+    they are read, instead of decoding the whole file up front. Markdown files and
+    encodings that are not ASCII-compatible are always read in full.
+
+    When nrows or skip_rows are specified, the first skip_rows data rows are skipped
+    and at most nrows rows are read after them, which stops the remaining rows from
+    being parsed. Rows continued across lines with backslashes count as one row.
+
+    When engine is "arrow", the cells of each column are cast with pyarrow compute
+    functions in vectorized passes instead of one at a time, as they are with Pandas
+    and NumPy functions when engine is "pandas", which only reads Pandas DataFrames.
+    Columns that cannot be cast by them, such as categorical columns, are still cast
+    one value at a time. When engine is "polars", which only reads Polars
+    DataFrames, the data rows are also cut into cells by Polars.
+
+    When dictionary_encode is True, string columns are read as categorical columns,
+    which store each distinct string once, as is worthwhile for columns with few
+    distinct values repeated over many rows. String columns otherwise share a single
+    object for each distinct string in Pandas DataFrames.
+
+    When a cache_dir is specified, or the DFTXT_CACHE_DIR environment variable is
+    set, the DataFrame is stored in that directory keyed by the content of the file
+    and the read settings, and loaded from there on subsequent reads.
+
+    When memoize is True, the DataFrame is also kept in memory for subsequent reads
+    of the unchanged file within the process. Callers receive copies of it, which
+    they are free to modify.
+    """
     source_path = pathlib.Path(path).expanduser().resolve()
     is_markdown = markdown or source_path.name.endswith(".md")
-    return reads(
-        table=source_path.read_text(encoding),
-        kind=kind,
-        filters=filters,
-        modifier_prefix=modifier_prefix,
-        markdown=is_markdown,
+    settings = {
+        "function": "read",
+        "kind": kind,
+        "filters": filters,
+        "markdown": is_markdown,
+        "encoding": encoding,
+        "modifier_prefix": modifier_prefix,
+        "columns": columns,
+        "nrows": nrows,
+        "skip_rows": skip_rows,
+        "engine": engine,
+        "dictionary_encode": dictionary_encode,
+    }
+    return _load_cached(
+        source_path=source_path,
+        settings=settings,
+        read=functools.partial(
+            _read_file,
+            source_path=source_path,
+            kind=kind,
+            filters=filters,
+            is_markdown=is_markdown,
+            encoding=encoding,
+            modifier_prefix=modifier_prefix,
+            mmap=mmap,
+            columns=columns,
+            nrows=nrows,
+            skip_rows=skip_rows,
+            engine=engine,
+            dictionary_encode=dictionary_encode,
+        ),
+        cache_dir=cache_dir,
+        memoize=memoize,
     )
 
 
+def _read_file(
+    source_path: pathlib.Path,
+    kind: typing.Literal["pandas", "polars", "arrow"],
+    filters: typing.Union[str, typing.Sequence[str], None],
+    is_markdown: bool,
+    encoding: str,
+    modifier_prefix: str,
+    mmap: bool,
+    columns: typing.Optional[typing.Sequence[str]],
+    nrows: typing.Optional[int],
+    skip_rows: int,
+    engine: EngineType,
+    dictionary_encode: bool,
+    content: typing.Optional[bytes] = None,
+):
+    """Read the dftxt file, or its content if already read, into a DataFrame."""
+    if mmap and not is_markdown and _is_mappable(encoding):
+        selection = _to_selection(filters, columns, kind)
+        rows = _to_row_range(nrows, skip_rows)
+        with _map_file(source_path, content) as buffer:
+            lines = _iter_mapped_lines(buffer, 0, len(buffer), encoding)
+            data_frame = _read_frame(
+                lines,
+                kind,
+                selection,
+                modifier_prefix,
+                rows,
+                engine,
+                dictionary_encode,
+            )
+        selection.validate()
+        return data_frame
+
+    # Settings are passed as a mapping as there are too many combinations of their
+    # types for type checkers to match them to the overloads of reads.
+    settings: typing.Dict[str, typing.Any] = {
+        "kind": kind,
+        "filters": filters,
+        "modifier_prefix": modifier_prefix,
+        "markdown": is_markdown,
+        "columns": columns,
+        "nrows": nrows,
+        "skip_rows": skip_rows,
+        "engine": engine,
+        "dictionary_encode": dictionary_encode,
+    }
+    return reads(table=_read_text(source_path, encoding, content), **settings)
+
+
 @typing.overload
 def read_all(
     path: typing.Union[pathlib.Path, str],
@@ -680,6 +2303,18 @@ def read_all(
     markdown: bool = False,
     encoding: str = "utf-8",
     modifier_prefix: str = "&",
+    mmap: bool = False,
+    lazy: bool = False,
+    cache_dir: typing.Union[pathlib.Path, str, None] = None,
+    memoize: bool = False,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
+    fences: typing.Optional[typing.Sequence[str]] = None,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional["futures.Executor"] = None,
 ) -> LoadedDataFrames["pd.DataFrame"]:
     """Read dftxt file into Pandas DataFrames."""
     ...
@@ -693,28 +2328,200 @@ def read_all(
     markdown: bool = False,
     encoding: str = "utf-8",
     modifier_prefix: str = "&",
+    mmap: bool = False,
+    lazy: bool = False,
+    cache_dir: typing.Union[pathlib.Path, str, None] = None,
+    memoize: bool = False,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
+    fences: typing.Optional[typing.Sequence[str]] = None,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional["futures.Executor"] = None,
 ) -> LoadedDataFrames["pl.DataFrame"]:
     """Read dftxt file into Polars DataFrames."""
     ...
 
 
+@typing.overload
+def read_all(
+    path: typing.Union[pathlib.Path, str],
+    kind: typing.Literal["arrow"],
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    encoding: str = "utf-8",
+    modifier_prefix: str = "&",
+    mmap: bool = False,
+    lazy: bool = False,
+    cache_dir: typing.Union[pathlib.Path, str, None] = None,
+    memoize: bool = False,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
+    fences: typing.Optional[typing.Sequence[str]] = None,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional["futures.Executor"] = None,
+) -> LoadedDataFrames["pa.Table"]:
+    """Read dftxt file into Arrow Tables."""
+    ...
+
+
 def read_all(
     path: typing.Union[pathlib.Path, str],
-    kind: typing.Literal["pandas", "polars"] = "pandas",
+    kind: typing.Literal["pandas", "polars", "arrow"] = "pandas",
     filters: typing.Union[str, typing.Sequence[str], None] = None,
     markdown: bool = False,
     encoding: str = "utf-8",
     modifier_prefix: str = "&",
+    mmap: bool = False,
+    lazy: bool = False,
+    cache_dir: typing.Union[pathlib.Path, str, None] = None,
+    memoize: bool = False,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
+    fences: typing.Optional[typing.Sequence[str]] = None,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional["futures.Executor"] = None,
 ):
-    """Read dftxt file into Pandas or Polars DataFrames."""
+    """
+    Read dftxt file into Pandas or Polars DataFrames, or Arrow Tables.
+
+    When mmap is True, the file is memory-mapped and the data frame separators are
+    found within the mapped bytes, which are only decoded line-by-line as each data
+    frame is read. Markdown files and encodings that are not ASCII-compatible are
+    always read in full.
+
+    When nrows or skip_rows are specified, they apply to the data rows of each of
+    the DataFrames as they do for the read function.
+
+    When lazy is True, only the data frame separators and the headers of the tables
+    are read up front and each DataFrame is read when it is first accessed. Lazy
+    reads that are also memory-mapped index the DataFrames by their offsets within
+    the file, which must then remain unchanged until the DataFrames are accessed.
+
+    When a cache_dir is specified, or the DFTXT_CACHE_DIR environment variable is
+    set, the DataFrames are stored in that directory keyed by the content of the
+    file and the read settings, and loaded from there on subsequent reads.
+
+    When memoize is True, the DataFrames are also kept in memory for subsequent
+    reads of the unchanged file within the process. Callers receive copies of them,
+    which they are free to modify.
+
+    Lazy reads do not use either cache.
+
+    When workers is greater than one, or an executor is specified, the DataFrames
+    are read in parallel as they are by the reads_all function.
+    """
     source_path = pathlib.Path(path).expanduser().resolve()
     is_markdown = markdown or source_path.name.endswith(".md")
+    read_file = functools.partial(
+        _read_all_file,
+        source_path=source_path,
+        kind=kind,
+        filters=filters,
+        is_markdown=is_markdown,
+        encoding=encoding,
+        modifier_prefix=modifier_prefix,
+        mmap=mmap,
+        lazy=lazy,
+        columns=columns,
+        nrows=nrows,
+        skip_rows=skip_rows,
+        engine=engine,
+        dictionary_encode=dictionary_encode,
+        fences=fences,
+        workers=workers,
+        executor=executor,
+    )
+    if lazy:
+        return read_file()
+
+    settings = {
+        "function": "read_all",
+        "kind": kind,
+        "filters": filters,
+        "markdown": is_markdown,
+        "encoding": encoding,
+        "modifier_prefix": modifier_prefix,
+        "columns": columns,
+        "nrows": nrows,
+        "skip_rows": skip_rows,
+        "engine": engine,
+        "dictionary_encode": dictionary_encode,
+        "fences": fences,
+    }
+    return _load_cached(
+        source_path=source_path,
+        settings=settings,
+        read=read_file,
+        cache_dir=cache_dir,
+        memoize=memoize,
+    )
+
+
+def _read_all_file(
+    source_path: pathlib.Path,
+    kind: typing.Literal["pandas", "polars", "arrow"],
+    filters: typing.Union[str, typing.Sequence[str], None],
+    is_markdown: bool,
+    encoding: str,
+    modifier_prefix: str,
+    mmap: bool,
+    lazy: bool,
+    columns: typing.Optional[typing.Sequence[str]],
+    nrows: typing.Optional[int],
+    skip_rows: int,
+    engine: EngineType,
+    dictionary_encode: bool,
+    fences: typing.Optional[typing.Sequence[str]],
+    workers: typing.Optional[int],
+    executor: typing.Optional["futures.Executor"],
+    content: typing.Optional[bytes] = None,
+):
+    """Read the dftxt file, or its content if already read, into DataFrames."""
+    # Fences are only selected from markdown, which raises otherwise when read.
+    if mmap and not is_markdown and fences is None and _is_mappable(encoding):
+        with _map_file(source_path, content) as buffer, _open_executor(
+            workers, executor
+        ) as pool:
+            return _to_loaded_data_frames(
+                sections=_iter_mapped_sections(
+                    buffer, encoding, path=source_path if lazy else None
+                ),
+                kind=kind,
+                filters=filters,
+                modifier_prefix=modifier_prefix,
+                lazy=lazy,
+                columns=columns,
+                nrows=nrows,
+                skip_rows=skip_rows,
+                engine=engine,
+                dictionary_encode=dictionary_encode,
+                executor=pool,
+            )
+
     return reads_all(
-        tables=source_path.read_text(encoding),
+        tables=_read_text(source_path, encoding, content),
         kind=kind,
         filters=filters,
         modifier_prefix=modifier_prefix,
         markdown=is_markdown,
+        lazy=lazy,
+        columns=columns,
+        nrows=nrows,
+        skip_rows=skip_rows,
+        engine=engine,
+        dictionary_encode=dictionary_encode,
+        fences=fences,
+        workers=workers,
+        executor=executor,
     )
 
 
@@ -724,6 +2531,11 @@ def read_to_pandas(
     markdown: bool = False,
     encoding: str = "utf-8",
     modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
 ) -> "pd.DataFrame":
     """Read dftxt file into a Pandas DataFrame."""
     return typing.cast(
@@ -735,6 +2547,11 @@ def read_to_pandas(
             modifier_prefix=modifier_prefix,
             encoding=encoding,
             markdown=markdown,
+            columns=columns,
+            nrows=nrows,
+            skip_rows=skip_rows,
+            engine=engine,
+            dictionary_encode=dictionary_encode,
         ),
     )
 
@@ -745,6 +2562,14 @@ def read_all_to_pandas(
     markdown: bool = False,
     encoding: str = "utf-8",
     modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
+    fences: typing.Optional[typing.Sequence[str]] = None,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional["futures.Executor"] = None,
 ) -> LoadedDataFrames["pd.DataFrame"]:
     """Read dftxt file into Pandas DataFrames."""
     return read_all(
@@ -754,6 +2579,14 @@ def read_all_to_pandas(
         modifier_prefix=modifier_prefix,
         encoding=encoding,
         markdown=markdown,
+        columns=columns,
+        nrows=nrows,
+        skip_rows=skip_rows,
+        engine=engine,
+        dictionary_encode=dictionary_encode,
+        fences=fences,
+        workers=workers,
+        executor=executor,
     )
 
 
@@ -763,6 +2596,11 @@ def read_to_polars(
     markdown: bool = False,
     encoding: str = "utf-8",
     modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
 ) -> "pl.DataFrame":
     """Read dftxt file into a Pandas DataFrame."""
     return typing.cast(
@@ -774,6 +2612,11 @@ def read_to_polars(
             modifier_prefix=modifier_prefix,
             encoding=encoding,
             markdown=markdown,
+            columns=columns,
+            nrows=nrows,
+            skip_rows=skip_rows,
+            engine=engine,
+            dictionary_encode=dictionary_encode,
         ),
     )
 
@@ -784,6 +2627,14 @@ def read_all_to_polars(
     markdown: bool = False,
     encoding: str = "utf-8",
     modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    nrows: typing.Optional[int] = None,
+    skip_rows: int = 0,
+    engine: EngineType = "python",
+    dictionary_encode: bool = False,
+    fences: typing.Optional[typing.Sequence[str]] = None,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional["futures.Executor"] = None,
 ) -> LoadedDataFrames["pl.DataFrame"]:
     """Read dftxt file into a Pandas DataFrame."""
     return read_all(
@@ -793,4 +2644,12 @@ def read_all_to_polars(
         modifier_prefix=modifier_prefix,
         encoding=encoding,
         markdown=markdown,
+        columns=columns,
+        nrows=nrows,
+        skip_rows=skip_rows,
+        engine=engine,
+        dictionary_encode=dictionary_encode,
+        fences=fences,
+        workers=workers,
+        executor=executor,
     )
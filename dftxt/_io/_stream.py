@@ -0,0 +1,661 @@
+import abc
+import contextlib
+import decimal
+import itertools
+import pathlib
+import typing
+
+from . import _cast
+from . import _markdown
+from . import _modifiers
+from . import _read
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+    import polars as pl
+else:
+    try:
+        import pandas as pd
+    except ImportError:  # pragma: no cover
+        pd = None  # type: ignore
+
+    try:
+        import polars as pl
+    except ImportError:  # pragma: no cover
+        pl = None  # type: ignore
+
+SourceType = typing.Union[pathlib.Path, str, typing.TextIO]
+RowType = typing.Union[
+    typing.Tuple[typing.Any, ...], typing.Dict[typing.Any, typing.Any]
+]
+_BlockStream = typing.Tuple[
+    typing.List["_read.RawColumn"],
+    typing.Iterator[typing.Sequence[typing.Optional[str]]],
+]
+
+
+def _normalize(line: str) -> str:
+    """Normalize a raw source line in the same fashion as whole-string reads."""
+    return line.rstrip("\n").replace("\r", "").replace("\t", "  ")
+
+
+class _LineReader(abc.ABC):
+    """Iterator over normalized source lines that tracks positions for re-reading."""
+
+    def __init__(self, position: typing.Any) -> None:
+        #: Position where the line following the most recent blank line starts,
+        #: which is where any new table block within the source begins.
+        self.mark: typing.Any = position
+
+    def __iter__(self) -> "_LineReader":
+        """Iterate over the normalized lines."""
+        return self
+
+    @abc.abstractmethod
+    def __next__(self) -> str:
+        """Get the next normalized line."""
+
+
+class _TextLines(_LineReader):
+    """Line reader over a text file handle."""
+
+    def __init__(self, handle: typing.TextIO) -> None:
+        self._handle = handle
+        self._seekable = handle.seekable()
+        super().__init__(handle.tell() if self._seekable else None)
+
+    def __next__(self) -> str:
+        """Get the next normalized line."""
+        raw = self._handle.readline()
+        if not raw:
+            raise StopIteration()
+
+        line = _normalize(raw)
+        # Positions are only retrieved after blank lines because text handle tell
+        # calls are expensive and only the starts of blocks are needed.
+        if self._seekable and not line.strip():
+            self.mark = self._handle.tell()
+        return line
+
+
+class _StringLines(_LineReader):
+    """Line reader over an in-memory string."""
+
+    def __init__(self, text: str, position: int = 0) -> None:
+        super().__init__(position)
+        self._text = text
+        self._position = position
+
+    def __next__(self) -> str:
+        """Get the next normalized line."""
+        if self._position >= len(self._text):
+            raise StopIteration()
+
+        end = self._text.find("\n", self._position)
+        if end < 0:
+            end = len(self._text)
+        line = _normalize(self._text[self._position : end])  # noqa E203
+        self._position = end + 1
+        if not line.strip():
+            self.mark = self._position
+        return line
+
+
+class _Source(abc.ABC):
+    """Origin of dftxt lines that can be opened for reading."""
+
+    #: Whether readers can be re-opened at previously marked positions.
+    can_seek: bool = True
+    #: Whether multiple readers can be open on the source at the same time.
+    can_fork: bool = True
+
+    @abc.abstractmethod
+    def open(self, position: typing.Any = None) -> typing.ContextManager["_LineReader"]:
+        """Open a line reader at the start of the source or the given position."""
+
+
+class _PathSource(_Source):
+    """Source of lines read from a file path."""
+
+    def __init__(self, path: pathlib.Path, encoding: str) -> None:
+        self.path = path
+        self.encoding = encoding
+
+    @contextlib.contextmanager
+    def open(self, position: typing.Any = None) -> typing.Iterator["_LineReader"]:
+        """Open a line reader at the start of the source or the given position."""
+        with self.path.open(encoding=self.encoding) as handle:
+            if position is not None:
+                handle.seek(position)
+            yield _TextLines(handle)
+
+
+class _HandleSource(_Source):
+    """Source of lines read from a caller-owned text file handle."""
+
+    can_fork = False
+
+    def __init__(self, handle: typing.TextIO) -> None:
+        self.handle = handle
+        self.can_seek = handle.seekable()
+
+    @contextlib.contextmanager
+    def open(self, position: typing.Any = None) -> typing.Iterator["_LineReader"]:
+        """Open a line reader at the start of the source or the given position."""
+        if position is not None:
+            self.handle.seek(position)
+        yield _TextLines(self.handle)
+
+
+class _StringSource(_Source):
+    """Source of lines read from an in-memory string."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    @contextlib.contextmanager
+    def open(self, position: typing.Any = None) -> typing.Iterator["_LineReader"]:
+        """Open a line reader at the start of the source or the given position."""
+        yield _StringLines(self.text, position or 0)
+
+
+def _to_source(source: SourceType, markdown: bool, encoding: str) -> "_Source":
+    """Wrap the specified path or text file handle as a line source."""
+    if hasattr(source, "readline"):
+        handle = typing.cast(typing.TextIO, source)
+        if markdown:
+            return _StringSource(_markdown.extract(handle.read()))
+        return _HandleSource(handle)
+
+    path = pathlib.Path(typing.cast(typing.Union[str, pathlib.Path], source))
+    source_path = path.expanduser().resolve()
+    if markdown or source_path.name.endswith(".md"):
+        return _StringSource(_markdown.extract(source_path.read_text(encoding)))
+    return _PathSource(source_path, encoding)
+
+
+def _scan_block_positions(
+    reader: "_LineReader", modifier_prefix: str
+) -> typing.List[typing.Any]:
+    """Find the starting positions of each table block without slicing data rows."""
+    positions = [reader.mark]
+    for token, _ in _read._tokenize(reader, modifier_prefix, slice_rows=False):
+        if token is _read._Token.BLOCK:
+            positions.append(reader.mark)
+    return positions
+
+
+def _stream_block(
+    lines: typing.Iterable[str],
+    modifier_prefix: str,
+    selection: "_read._ColumnSelection",
+) -> "_BlockStream":
+    """
+    Read the header and modifiers of a block and stream its data rows after.
+
+    The data rows are only cut into the cells of the columns in the selection,
+    which are the columns of the returned block when it has data rows.
+    """
+    boundaries: typing.List[_read.ColumnBounds] = []
+    names: typing.List[str] = []
+    modifier_lines: typing.List[typing.List[typing.Optional[str]]] = []
+    selected: typing.Optional[typing.List[int]] = None
+
+    def to_columns() -> typing.List["_read.RawColumn"]:
+        return [
+            _read.RawColumn(
+                bounds=bounds,
+                name=name,
+                modifiers=_modifiers.parse(column_modifiers, modifier_prefix),
+            )
+            for bounds, name, column_modifiers in zip(boundaries, names, modifier_lines)
+        ]
+
+    def select_columns() -> typing.List[int]:
+        nonlocal selected
+        selected = [i for i, c in enumerate(to_columns()) if selection.includes(c)]
+        return selected
+
+    tokens = _read._tokenize(lines, modifier_prefix, select=select_columns)
+    first_row: typing.Optional[typing.List[typing.Optional[str]]] = None
+    for token, payload in tokens:
+        if token is _read._Token.HEADER:
+            boundaries, names = payload
+            modifier_lines = [[] for _ in range(len(names))]
+        elif token is _read._Token.MODIFIER:
+            _read._append_columnwise(modifier_lines, payload)
+        elif token is _read._Token.ROW:
+            first_row = payload
+            break
+        else:
+            break
+
+    columns = to_columns()
+    if selected is not None:
+        columns = [columns[i] for i in selected]
+
+    def rows() -> typing.Iterator[typing.Sequence[typing.Optional[str]]]:
+        if first_row is None:
+            return
+
+        yield first_row
+        for token, payload in tokens:
+            if token is _read._Token.ROW:
+                yield payload
+            elif token is _read._Token.MODIFIER:
+                raise ValueError(
+                    "Modifier rows must precede the data rows of a block when "
+                    "streaming."
+                )
+            else:
+                return
+
+    return columns, rows()
+
+
+def _scan_frame(
+    origin: "_Source", modifier_prefix: str
+) -> typing.Optional[typing.List[typing.Any]]:
+    """Get the block positions for the frame of the source if it can be re-read."""
+    if not origin.can_seek:
+        return None
+
+    with origin.open() as reader:
+        return _scan_block_positions(reader, modifier_prefix)
+
+
+@contextlib.contextmanager
+def _open_frame(
+    origin: "_Source",
+    positions: typing.Optional[typing.List[typing.Any]],
+    modifier_prefix: str,
+    selection: "_read._ColumnSelection",
+) -> typing.Iterator[typing.List["_BlockStream"]]:
+    """
+    Open the blocks of the source's frame to stream their rows together.
+
+    Each block gets its own reader when the source allows it. Otherwise, the
+    blocks are read into memory before their rows are streamed.
+    """
+    if positions is not None and (len(positions) == 1 or origin.can_fork):
+        with contextlib.ExitStack() as stack:
+            yield [
+                _stream_block(
+                    stack.enter_context(origin.open(position)),
+                    modifier_prefix,
+                    selection,
+                )
+                for position in positions
+            ]
+        return
+
+    with origin.open(positions[0] if positions else None) as reader:
+        blocks = _read._read_blocks(reader, modifier_prefix, selection)
+    yield [(b.columns, zip(*[c.cells for c in b.columns])) for b in blocks]
+
+
+def _select_columns(
+    blocks: typing.Sequence["_BlockStream"],
+    selection: "_read._ColumnSelection",
+) -> typing.List[typing.Tuple[int, int, "_read.RawColumn"]]:
+    """Select the (block index, cell index, column) of the columns to load."""
+    selected = [
+        (block_index, cell_index, column)
+        for block_index, (columns, _) in enumerate(blocks)
+        for cell_index, column in enumerate(columns)
+        if selection.includes(column)
+    ]
+    selection.validate()
+    return selected
+
+
+def _iter_selected_cells(
+    blocks: typing.Sequence["_BlockStream"],
+    selection: typing.List[typing.Tuple[int, int, "_read.RawColumn"]],
+) -> typing.Iterator[typing.List[typing.Optional[str]]]:
+    """Combine the rows of a frame's blocks into the cells of selected columns."""
+    for cells_by_block in itertools.zip_longest(*[rows for _, rows in blocks]):
+        if any(cells is None for cells in cells_by_block):
+            raise ValueError("The blocks of the frame do not have matching row counts.")
+
+        yield [
+            cells_by_block[block_index][cell_index]
+            for block_index, cell_index, _ in selection
+        ]
+
+
+def iter_rows(
+    source: SourceType,
+    as_dict: bool = False,
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    encoding: str = "utf-8",
+    modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+) -> typing.Iterator["RowType"]:
+    """
+    Stream the rows of a dftxt file as tuples, or dictionaries, of typed values.
+
+    File paths are streamed in constant memory. Frames that are wrapped across
+    multiple blocks are read with one reader per block, which advance in lockstep.
+    Caller-owned file handles can only have one reader and so frames wrapped across
+    multiple blocks are buffered in memory, as are the frames of handles that are
+    not seekable and markdown sources.
+    """
+    origin = _to_source(source, markdown, encoding)
+    positions = _scan_frame(origin, modifier_prefix)
+    selection = _read._to_selection(filters, columns)
+    with _open_frame(origin, positions, modifier_prefix, selection) as blocks:
+        selected = _select_columns(blocks, selection)
+        casters = [
+            _cast.to_caster(column.data_type or "str") for _, _, column in selected
+        ]
+        names = [
+            _cast.cast_to(column.name, column.modifiers.name_data_type or "str")
+            for _, _, column in selected
+        ]
+        for cells in _iter_selected_cells(blocks, selected):
+            values = tuple(cast(cell) for cast, cell in zip(casters, cells))
+            yield dict(zip(names, values)) if as_dict else values
+
+
+def _add_sample(samples: typing.Dict[typing.Any, None], value: typing.Any) -> None:
+    """Keep the values needed to infer the Polars dtype of a column as a whole."""
+    if value is None:
+        return
+
+    if not samples:
+        samples[value] = None
+    elif isinstance(value, decimal.Decimal):
+        # Polars infers the scale of decimal columns from the widest value.
+        widest = next(iter(reversed(samples)))
+        exponent = typing.cast(int, value.as_tuple().exponent)
+        if exponent < typing.cast(int, widest.as_tuple().exponent):
+            samples[value] = None
+
+
+def _to_schema_dtypes(
+    columns: typing.List["_read.RawColumn"],
+    samples: typing.Dict[int, typing.Dict[typing.Any, None]],
+    kind: typing.Literal["pandas", "polars"],
+) -> typing.List[typing.Any]:
+    """Determine the dtypes for the columns from the values of the whole frame."""
+    dtypes: typing.List[typing.Any] = []
+    for index, column in enumerate(columns):
+        values = list(samples.get(index, {}))
+        if kind == "polars":
+            polars_dtype = _cast.to_polars_dtype(column.data_type, values)
+            if polars_dtype is None and values:
+                polars_dtype = pl.Series(values).dtype
+            dtypes.append(polars_dtype)
+            continue
+
+        dtype = _cast.to_pandas_dtype(column.data_type or "object", values)
+        if isinstance(dtype, str) and dtype == "category":
+            # Pandas infers the sorted categories from the values it is given, which
+            # would otherwise differ between the frames built from the batches.
+            dtype = pd.CategoricalDtype(sorted(v for v in values if v is not None))
+        dtypes.append(dtype)
+    return dtypes
+
+
+def _iter_batches(
+    origin: "_Source",
+    batch_size: int,
+    kind: typing.Literal["pandas", "polars"],
+    filters: typing.Union[str, typing.Sequence[str], None],
+    modifier_prefix: str,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+) -> typing.Iterator[typing.Union["pd.DataFrame", "pl.DataFrame"]]:
+    """Read the frame of the source in batches that share a single schema."""
+    if batch_size < 1:
+        raise ValueError(f"Batch size must be a positive integer, not {batch_size}.")
+
+    if not origin.can_seek:
+        # Dtypes that depend on the whole frame require an extra pass over it.
+        origin = _StringSource(typing.cast(_HandleSource, origin).handle.read())
+
+    positions = _scan_frame(origin, modifier_prefix)
+    samples: typing.Dict[int, typing.Dict[typing.Any, None]] = {}
+    selection = _read._to_selection(filters, columns, kind)
+    with _open_frame(origin, positions, modifier_prefix, selection) as blocks:
+        selected = _select_columns(blocks, selection)
+        raw_columns = [column for _, _, column in selected]
+        categorical = [
+            index
+            for index, column in enumerate(raw_columns)
+            if _cast.is_categorical(column.data_type)
+        ]
+        inferred = [
+            index
+            for index, column in enumerate(raw_columns)
+            if kind == "polars"
+            and index not in categorical
+            and (
+                _cast.infers_polars_dtype(column.data_type)
+                or _cast.to_polars_dtype(column.data_type, []) is None
+            )
+        ]
+        samples.update({index: {} for index in categorical + inferred})
+        casters = {
+            index: _cast.to_caster(raw_columns[index].data_type or "str")
+            for index in samples
+        }
+        for cells in _iter_selected_cells(blocks, selected) if samples else []:
+            for index in categorical:
+                samples[index].setdefault(casters[index](cells[index]), None)
+            for index in inferred:
+                _add_sample(samples[index], casters[index](cells[index]))
+
+    dtypes = _to_schema_dtypes(raw_columns, samples, kind)
+    has_index = any(column.modifiers.index for column in raw_columns)
+    offset = 0
+    with _open_frame(origin, positions, modifier_prefix, selection) as blocks:
+        rows = _iter_selected_cells(blocks, _select_columns(blocks, selection))
+        while batch := list(itertools.islice(rows, batch_size)):
+            batch_columns = [
+                _read.RawColumn(
+                    bounds=column.bounds,
+                    name=column.name,
+                    modifiers=column.modifiers,
+                    cells=list(cells),
+                )
+                for column, cells in zip(raw_columns, zip(*batch))
+            ]
+            if kind == "polars":
+                yield _read._to_polars(batch_columns, dtypes)
+            else:
+                data_frame = _read._to_pandas(batch_columns, dtypes)
+                if not has_index:
+                    # Continue the default index across batches.
+                    data_frame.index = pd.RangeIndex(offset, offset + len(batch))
+                yield data_frame
+            offset += len(batch)
+
+
+@typing.overload
+def read_batches(
+    source: SourceType,
+    batch_size: int = 10_000,
+    kind: typing.Literal["pandas"] = "pandas",
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    encoding: str = "utf-8",
+    modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+) -> typing.Iterator["pd.DataFrame"]:
+    """Read dftxt file in batches of Pandas DataFrames."""
+    ...
+
+
+@typing.overload
+def read_batches(
+    source: SourceType,
+    batch_size: int = 10_000,
+    *,
+    kind: typing.Literal["polars"],
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    encoding: str = "utf-8",
+    modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+) -> typing.Iterator["pl.DataFrame"]:
+    """Read dftxt file in batches of Polars DataFrames."""
+    ...
+
+
+def read_batches(
+    source: SourceType,
+    batch_size: int = 10_000,
+    kind: typing.Literal["pandas", "polars"] = "pandas",
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    encoding: str = "utf-8",
+    modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+):
+    """
+    Read dftxt file in batches of Pandas or Polars DataFrames.
+
+    Each batch holds at most batch_size rows and all batches share the same schema,
+    including the categories of categorical columns, which are determined by an
+    initial pass over the whole frame when categorical columns are present.
+    """
+    yield from _iter_batches(
+        origin=_to_source(source, markdown, encoding),
+        batch_size=batch_size,
+        kind=kind,
+        filters=filters,
+        modifier_prefix=modifier_prefix,
+        columns=columns,
+    )
+
+
+@typing.overload
+def reads_batches(
+    table: str,
+    batch_size: int = 10_000,
+    kind: typing.Literal["pandas"] = "pandas",
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+) -> typing.Iterator["pd.DataFrame"]:
+    """Read dftxt string in batches of Pandas DataFrames."""
+    ...
+
+
+@typing.overload
+def reads_batches(
+    table: str,
+    batch_size: int = 10_000,
+    *,
+    kind: typing.Literal["polars"],
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+) -> typing.Iterator["pl.DataFrame"]:
+    """Read dftxt string in batches of Polars DataFrames."""
+    ...
+
+
+def reads_batches(
+    table: str,
+    batch_size: int = 10_000,
+    kind: typing.Literal["pandas", "polars"] = "pandas",
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+):
+    """Read dftxt string in batches of Pandas or Polars DataFrames."""
+    yield from _iter_batches(
+        origin=_StringSource(_markdown.extract(table) if markdown else table),
+        batch_size=batch_size,
+        kind=kind,
+        filters=filters,
+        modifier_prefix=modifier_prefix,
+        columns=columns,
+    )
+
+
+def _iter_sections(
+    lines: typing.Iterable[str],
+) -> typing.Iterator[typing.Tuple[typing.Optional[str], typing.List[str]]]:
+    """Split lines into the sourced name and lines of each data frame section."""
+    name: typing.Optional[str] = None
+    section: typing.List[str] = []
+    for line in lines:
+        match = (
+            _read._DATA_FRAME_SEPARATOR_LINE_REGEX.match(line)
+            if "---" in line
+            else None
+        )
+        if match is None:
+            section.append(line)
+            continue
+
+        yield name, section
+        name = match.group("name") or None
+        section = []
+
+    yield name, section
+
+
+@typing.overload
+def iter_frames(
+    source: SourceType,
+    kind: typing.Literal["pandas"] = "pandas",
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    encoding: str = "utf-8",
+    modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+) -> typing.Iterator[typing.Tuple[str, "pd.DataFrame"]]:
+    """Stream the frames of a dftxt file as Pandas DataFrames."""
+    ...
+
+
+@typing.overload
+def iter_frames(
+    source: SourceType,
+    kind: typing.Literal["polars"],
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    encoding: str = "utf-8",
+    modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+) -> typing.Iterator[typing.Tuple[str, "pl.DataFrame"]]:
+    """Stream the frames of a dftxt file as Polars DataFrames."""
+    ...
+
+
+def iter_frames(
+    source: SourceType,
+    kind: typing.Literal["pandas", "polars"] = "pandas",
+    filters: typing.Union[str, typing.Sequence[str], None] = None,
+    markdown: bool = False,
+    encoding: str = "utf-8",
+    modifier_prefix: str = "&",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+):
+    """
+    Stream the frames of a dftxt file as (name, DataFrame) pairs.
+
+    Each frame is yielded as soon as its section of the source has been read, so
+    only one frame is held in memory at a time. Names follow the same conventions
+    as the LoadedDataFrames returned by read_all.
+    """
+    origin = _to_source(source, markdown, encoding)
+    selection = _read._to_selection(filters, columns, kind)
+    with origin.open() as reader:
+        count = 0
+        for sourced_name, lines in _iter_sections(reader):
+            data_frame = _read._to_data_frame(
+                _read._read_blocks(lines, modifier_prefix, selection), kind, selection
+            )
+            if len(data_frame.columns) > 0:
+                count += 1
+                yield sourced_name or f"data_frame_{count}", data_frame
+    selection.validate()
@@ -0,0 +1,93 @@
+import asyncio
+import decimal
+import pathlib
+import typing
+from concurrent import futures
+
+import pandas.testing as pd_test
+import polars as pl
+import polars.testing as pl_test
+import pytest
+from pytest import mark
+
+import dftxt
+
+_DIRECTORY = pathlib.Path(__file__).resolve().parent.parent / "scenarios"
+_SOURCES = sorted(_DIRECTORY.glob("*/source.dftxt"))
+
+_POLARS = pl.DataFrame(
+    {"name": ["alpha", "beta"], "price": [decimal.Decimal("1.50"), None]},
+    schema={"name": pl.Utf8, "price": pl.Decimal(10, 2)},
+)
+
+
+@mark.parametrize("executor_type", [None, futures.ProcessPoolExecutor])
+def test_aread_all(executor_type: typing.Any):
+    """Should read the same frames as read_all without blocking the event loop."""
+
+    async def read_sources(executor: typing.Any) -> typing.List[typing.Any]:
+        return await dftxt.agather(
+            *(dftxt.aread_all(p, executor=executor) for p in _SOURCES), limit=4
+        )
+
+    executor = executor_type(max_workers=2) if executor_type else None
+    try:
+        observed = asyncio.run(read_sources(executor))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    for path, loaded in zip(_SOURCES, observed):
+        expected = dftxt.read_all(path)
+        assert loaded.frame_names == expected.frame_names
+        for frame, expected_frame in zip(loaded.to_tuple(), expected.to_tuple()):
+            pd_test.assert_frame_equal(frame, expected_frame)
+
+
+@mark.parametrize("executor_type", [None, futures.ProcessPoolExecutor])
+def test_awrite_aread(tmp_path: pathlib.Path, executor_type: typing.Any):
+    """Should write and read back Polars frames keeping their dtypes."""
+    path = tmp_path / "single.dftxt"
+    all_path = tmp_path / "all.dftxt"
+
+    async def write_and_read(executor: typing.Any) -> typing.Tuple[typing.Any, ...]:
+        await dftxt.awrite(path, _POLARS, executor=executor)
+        await dftxt.awrite_all(all_path, {"prices": _POLARS}, executor=executor)
+        return (
+            await dftxt.aread(path, kind="polars", executor=executor),
+            await dftxt.aread_all(all_path, kind="polars", executor=executor),
+        )
+
+    executor = executor_type(max_workers=1) if executor_type else None
+    try:
+        frame, frames = asyncio.run(write_and_read(executor))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    expected = dftxt.reads(dftxt.writes(_POLARS), kind="polars")
+    assert isinstance(expected.schema["price"], pl.Decimal)
+    pl_test.assert_frame_equal(frame, expected)
+    pl_test.assert_frame_equal(frames.prices, expected)
+
+
+def test_agather_limit():
+    """Should run at most the limit of awaitables at the same time, in order."""
+    running: typing.List[int] = []
+    peak: typing.List[int] = []
+
+    async def track(value: int) -> int:
+        running.append(value)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(value)
+        return value
+
+    async def gather() -> typing.List[int]:
+        return await dftxt.agather(*(track(i) for i in range(10)), limit=3)
+
+    assert asyncio.run(gather()) == list(range(10))
+    assert max(peak) == 3
+
+    with pytest.raises(ValueError):
+        asyncio.run(dftxt.agather(limit=0))
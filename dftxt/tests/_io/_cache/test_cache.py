@@ -0,0 +1,106 @@
+import os
+import pathlib
+import time
+from concurrent import futures
+
+import pandas.testing as pd_test
+import polars.testing as pl_test
+from pytest import mark
+
+import dftxt
+from dftxt._io import _cache
+from dftxt._io import _read
+
+_DIRECTORY = pathlib.Path(__file__).resolve().parent.parent / "scenarios"
+_SOURCES = sorted(_DIRECTORY.glob("*/source.dftxt"))
+
+
+def _fail(*args, **kwargs):
+    """Fail when a file is read instead of loaded from the cache."""
+    raise AssertionError("Unexpected read of the file.")
+
+
+@mark.parametrize("path", _SOURCES, ids=[p.parent.name for p in _SOURCES])
+def test_read_all_cached(path: pathlib.Path, tmp_path: pathlib.Path, monkeypatch):
+    """Should load the same DataFrames from the cache that are read from the file."""
+    expected_pandas = dftxt.read_all(path)
+    expected_polars = dftxt.read_all(path, kind="polars")
+    dftxt.read_all(path, cache_dir=tmp_path)
+    dftxt.read_all(path, kind="polars", cache_dir=tmp_path)
+
+    monkeypatch.setattr(_read, "_read_all_file", _fail)
+    observed_pandas = dftxt.read_all(path, cache_dir=tmp_path)
+    observed_polars = dftxt.read_all(path, kind="polars", cache_dir=tmp_path)
+
+    assert observed_pandas.frame_names == expected_pandas.frame_names
+    assert observed_pandas.sourced_frame_names == expected_pandas.sourced_frame_names
+    for pandas_pair in zip(observed_pandas.to_tuple(), expected_pandas.to_tuple()):
+        pd_test.assert_frame_equal(*pandas_pair)
+    for polars_pair in zip(observed_polars.to_tuple(), expected_polars.to_tuple()):
+        pl_test.assert_frame_equal(*polars_pair)
+
+
+def test_read_cache_keys(tmp_path: pathlib.Path, monkeypatch):
+    """Should cache by file content and read settings from the environment."""
+    monkeypatch.setenv(_cache.CACHE_DIR_ENVIRONMENT_VARIABLE, str(tmp_path / "cache"))
+    path = tmp_path / "source.dftxt"
+    path.write_text("foo  bar\n     &if=a\n1    2\n")
+
+    assert list(dftxt.read(path).columns) == ["foo"]
+    assert list(dftxt.read(path, filters=["a"]).columns) == ["foo", "bar"]
+    assert len(list((tmp_path / "cache").iterdir())) == 2
+
+    path.write_text("spam\n1\n")
+    assert list(dftxt.read(path).columns) == ["spam"]
+    assert len(list((tmp_path / "cache").iterdir())) == 3
+
+
+@mark.parametrize("function", [dftxt.read, dftxt.read_all])
+@mark.parametrize("mmap", [False, True])
+def test_read_cache_changed(function, mmap: bool, tmp_path: pathlib.Path, monkeypatch):
+    """Should cache the read of the content the key is created from."""
+    path = tmp_path / "source.dftxt"
+    path.write_text("foo\r\n1\r\n")
+    to_key = _cache.to_key
+
+    def change_after_key(content: bytes, settings):
+        """Change the file after its content is read for the cache key."""
+        path.write_text("spam\n2\n")
+        return to_key(content, settings)
+
+    monkeypatch.setattr(_cache, "to_key", change_after_key)
+    observed = function(path, cache_dir=tmp_path / "cache", mmap=mmap)
+    frame = observed if function is dftxt.read else observed.to_tuple()[0]
+    assert frame.to_dict("list") == {"foo": ["1"]}
+
+    monkeypatch.setattr(_cache, "to_key", to_key)
+    observed = function(path, cache_dir=tmp_path / "cache", mmap=mmap)
+    frame = observed if function is dftxt.read else observed.to_tuple()[0]
+    assert frame.to_dict("list") == {"spam": ["2"]}
+
+
+def test_cache_prune(tmp_path: pathlib.Path):
+    """Should remove the least recently used entries beyond the byte budget."""
+    cache = _cache.DiskCache(tmp_path, max_bytes=2500)
+    for index, key in enumerate(["a", "b", "c"]):
+        cache.put(key, b"x" * 1000)
+        accessed = time.time() - 100 + index
+        os.utime(tmp_path / f"{key}.pickle", (accessed, accessed))
+    assert cache.get("a")[0] is False
+    assert cache.get("b")[0] is True
+
+    # The "b" entry is now the most recently used.
+    cache.put("d", b"x" * 1000)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["b.pickle", "d.pickle"]
+
+
+def test_cache_concurrent(tmp_path: pathlib.Path):
+    """Should allow concurrent writers of the same entries."""
+    path = _DIRECTORY / "multi_block" / "source.dftxt"
+    with futures.ThreadPoolExecutor(8) as executor:
+        results = list(
+            executor.map(lambda _: dftxt.read(path, cache_dir=tmp_path), range(16))
+        )
+    for result in results:
+        pd_test.assert_frame_equal(result, dftxt.read(path))
+    assert [p.suffix for p in tmp_path.iterdir()] == [".pickle"]
@@ -0,0 +1,85 @@
+import os
+import pathlib
+import threading
+import time
+from concurrent import futures
+
+import pandas.testing as pd_test
+from pytest import raises
+
+import dftxt
+from dftxt._io import _cache
+from dftxt._io import _read
+
+_DIRECTORY = pathlib.Path(__file__).resolve().parent.parent / "scenarios"
+
+
+def _fail(*args, **kwargs):
+    """Fail when a file is read instead of loaded from the cache."""
+    raise AssertionError("Unexpected read of the file.")
+
+
+def test_memory_cache_single_flight():
+    """Should read once for concurrent loads of the same key."""
+    cache = _cache.MemoryCache(max_entries=10, max_bytes=1000)
+    calls = []
+
+    def _read():
+        calls.append(threading.get_ident())
+        time.sleep(0.1)
+        return "value"
+
+    with futures.ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(lambda _: cache.load("key", _read, len), range(8)))
+    assert results == ["value"] * 8
+    assert len(calls) == 1
+
+
+def test_memory_cache_errors():
+    """Should raise read errors to all waiting callers without caching them."""
+    cache = _cache.MemoryCache(max_entries=10, max_bytes=1000)
+
+    def _read():
+        raise ValueError("Bad read.")
+
+    with raises(ValueError):
+        cache.load("key", _read, len)
+    assert len(cache) == 0
+    assert cache.load("key", lambda: "value", len) == "value"
+
+
+def test_memory_cache_prune():
+    """Should remove the least recently used entries beyond the cache limits."""
+    cache = _cache.MemoryCache(max_entries=2, max_bytes=10)
+    cache.load("a", lambda: "aaa", len)
+    cache.load("b", lambda: "bbb", len)
+    cache.load("a", lambda: "unused", len)
+    cache.load("c", lambda: "ccc", len)
+    assert cache.load("a", lambda: "new", len) == "aaa"
+    assert cache.load("b", lambda: "new", len) == "new"
+
+    cache.load("d", lambda: "d" * 8, len)
+    assert len(cache) == 1
+
+
+def test_read_memoized(tmp_path: pathlib.Path, monkeypatch):
+    """Should memoize reads of unchanged files and return copies of them."""
+    monkeypatch.setattr(_cache, "memory_cache", _cache.MemoryCache(10, 10_000_000))
+    path = tmp_path / "source.dftxt"
+    path.write_text((_DIRECTORY / "multi_block" / "source.dftxt").read_text())
+    expected = dftxt.read_all(path)
+
+    observed = dftxt.read_all(path, memoize=True)
+    observed[0]["account_id"] = "modified"
+
+    read_all_file = _read._read_all_file
+    monkeypatch.setattr(_read, "_read_all_file", _fail)
+    for frame, expected_frame in zip(
+        dftxt.read_all(path, memoize=True).to_tuple(), expected.to_tuple()
+    ):
+        pd_test.assert_frame_equal(frame, expected_frame)
+
+    monkeypatch.setattr(_read, "_read_all_file", read_all_file)
+    path.write_text("spam\n1\n")
+    os.utime(path, ns=(time.time_ns() + 10**9, time.time_ns() + 10**9))
+    assert list(dftxt.read_all(path, memoize=True)[0].columns) == ["spam"]
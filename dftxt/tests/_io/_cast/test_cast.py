@@ -0,0 +1,132 @@
+import decimal
+import typing
+
+import pandas as pd
+import pandas.testing as pd_test
+import pytest
+from pytest import mark
+
+from dftxt._io import _cast
+
+_VALUES: typing.Dict[str, typing.List[typing.Any]] = {
+    "str": ["a", "NA", "b"],
+    "int": ["1", "None", "-2"],
+    "float": ["1.5", "NAN", "2"],
+    "decimal": ["1.50", "null", "2.25"],
+    "bool": ["true", "NA", "no"],
+    "date": ["2024-01-02", "NAT", "2024-03-04"],
+    "datetime": ["2024-01-02T03:04:05Z", "NAT", "2024-03-04T05:06:07"],
+    "datetime[ns, US/Central]": ["2024-01-02T03:04:05", None, "2024-03-04T05:06:07"],
+    "unknown": ["a", "NA", "b"],
+}
+
+
+@mark.parametrize("data_type", list(_VALUES))
+def test_cast_all(data_type: str):
+    """Should cast values of the column alike to casting them one at a time."""
+    values = _VALUES[data_type]
+    observed = _cast.cast_all(values, data_type)
+    assert observed == [_cast.cast_to(v, data_type) for v in values]
+    assert observed == [_cast.to_caster(data_type)(v) for v in values]
+    assert observed[1] is None
+    assert observed[0] is not None
+
+
+@mark.parametrize(
+    "data_type, cells",
+    [
+        ("str", ["a", "NA", None]),
+        ("Int", ["1", "None", "1_000"]),
+        ("int", ["1", "-2", " 3 "]),
+        ("float", ["1.5", "NAN", "0.1"]),
+        ("bool", ["true", "NA", " Yes"]),
+        ("boolean", ["true", "NA", "no"]),
+        ("datetime", ["2024-01-02T03:04:05", "NAT", "2024-03-04T05:06:07.25"]),
+        ("datetime", ["2024-01-02T03:04:05Z", None, "2024-03-04T05:06:07+00:00"]),
+        ("datetime64[ns, UTC]", ["2024-01-02T03:04:05", "null", "2024-03-04"]),
+    ],
+)
+def test_to_pandas(data_type: str, cells: typing.List[typing.Optional[str]]):
+    """Should create the same Pandas Series as the values cast one at a time."""
+    values = _cast.cast_all(cells, data_type)
+    dtype = _cast.to_pandas_dtype(data_type, values)
+    observed = _cast.to_pandas(cells, data_type)
+    assert observed is not None
+    pd_test.assert_series_equal(
+        pd.Series(observed, dtype=dtype), pd.Series(values, dtype=dtype)
+    )
+
+
+@mark.parametrize(
+    "data_type, cells",
+    [
+        ("cat", ["a", "b"]),
+        ("decimal", ["1.5", "2"]),
+        ("int", ["1", "NA"]),
+        ("int", ["1.0"]),
+        ("datetime", ["NA", None]),
+        ("datetime", ["2024-01-02T03:04:05Z", "2024-01-02T03:04:05"]),
+        ("datetime", ["2024-01-02T03:04:05+05:00"]),
+        ("datetime", ["0001-01-01T00:00:00"]),
+        ("datetime64[ns, US/Central]", ["2024-01-02T03:04:05"]),
+    ],
+)
+def test_to_pandas_unsupported(
+    data_type: str, cells: typing.List[typing.Optional[str]]
+):
+    """Should leave cells that Pandas cannot cast as Python does to Python."""
+    assert _cast.to_pandas(cells, data_type) is None
+
+
+@mark.parametrize(
+    "data_type, expected",
+    [
+        ("ord:az", ["a", "b", "c"]),
+        ("ord:za", ["c", "b", "a"]),
+        ("ord:3,0,x", ["b", "c", "x"]),
+        ("ord:320", ["b", "a", "c"]),
+    ],
+)
+def test_get_categorical_ordering(data_type: str, expected: typing.List[str]):
+    """Should order categories by the positions where values first appear."""
+    values = ["c", None, "a", "c", "b", None, "a"]
+    observed = _cast._get_categorical_ordering(data_type, values)
+    assert observed == expected
+    encoded = _cast._encode_categorical_ordering(observed, values)
+    assert _cast._get_categorical_ordering(f"ord:{encoded}", values) == expected
+
+
+@mark.parametrize(
+    "dtype",
+    ["category", pd.CategoricalDtype(["b", "a", "x"], ordered=True)],
+)
+@mark.parametrize("values", [["a", None, "b", "a"], [None, None], []])
+def test_to_pandas_categorical(dtype: typing.Any, values: typing.List[typing.Any]):
+    """Should create the same categorical as Pandas does from the values."""
+    observed = pd.Series(_cast.to_pandas_categorical(values, dtype), dtype=dtype)
+    pd_test.assert_series_equal(observed, pd.Series(values, dtype=dtype))
+
+
+@mark.parametrize(
+    "data_type, expected",
+    [
+        ("decimal[12,3]", (12, 3)),
+        ("Decimal[ 10 , 0 ]", (10, 0)),
+        ("decimal[5]", (5, 0)),
+        ("decimal", None),
+        ("decimal(12, 3)", None),
+    ],
+)
+def test_to_decimal_type(
+    data_type: str, expected: typing.Optional[typing.Tuple[int, int]]
+):
+    """Should parse the precision and scale of parameterized decimal data types."""
+    assert _cast.to_decimal_type(data_type) == expected
+
+
+@mark.parametrize("value", ["1.234", "-1000", "12345.6"])
+def test_to_decimal_invalid(value: str):
+    """Should raise an error for values that do not fit the decimal data type."""
+    with pytest.raises(ValueError):
+        _cast.to_decimal(value, "decimal[4,2]")
+    assert _cast.to_decimal(value, "decimal") == decimal.Decimal(value)
@@ -0,0 +1,113 @@
+import pathlib
+import typing
+
+import pandas as pd
+import pandas.testing as pd_test
+import polars as pl
+import polars.testing as pl_test
+import pytest
+from pytest import mark
+
+import dftxt
+
+_MULTI_BLOCK = (
+    pathlib.Path(__file__).resolve().parent.parent
+    / "scenarios"
+    / "multi_block"
+    / "source.dftxt"
+)
+_SOURCES = {
+    "a.dftxt": """
+--- planets ---
+
+name     kind
+         &dtype=cat
+Earth    rock
+Jupiter  gas
+
+--- moons ---
+
+moon
+Io
+""",
+    "b.dftxt": """
+--- planets ---
+
+name     kind
+         &dtype=cat
+Neptune  ice
+""",
+    "c.dftxt": """
+--- planets ---
+
+name     mass
+         &dtype=float
+Mars     0.1
+""",
+    "d.dftxt": """
+name
+&spam=ham
+x
+""",
+}
+
+
+def _write_sources(directory: pathlib.Path) -> None:
+    """Write the source files into the directory."""
+    for name, text in _SOURCES.items():
+        (directory / name).write_text(text)
+
+
+@mark.parametrize("workers", [None, 2])
+def test_read_many(tmp_path: pathlib.Path, workers: typing.Optional[int]):
+    """Should read each file and report the files that cannot be read."""
+    _write_sources(tmp_path)
+    observed = dftxt.read_many(tmp_path / "*.dftxt", workers=workers)
+
+    assert list(observed) == [tmp_path / n for n in ("a.dftxt", "b.dftxt", "c.dftxt")]
+    assert list(observed.errors) == [tmp_path / "d.dftxt"]
+    assert isinstance(observed.errors[tmp_path / "d.dftxt"], ValueError)
+    for path, loaded in observed.items():
+        expected = dftxt.read_all(path)
+        for frame, expected_frame in zip(loaded.to_tuple(), expected.to_tuple()):
+            pd_test.assert_frame_equal(frame, expected_frame)
+
+    with pytest.raises(ValueError):
+        observed.concatenated
+
+
+@mark.parametrize("kind", ["pandas", "polars"])
+def test_read_many_concat(tmp_path: pathlib.Path, kind: str):
+    """Should stack same-named frames with the same schema across the files."""
+    _write_sources(tmp_path)
+    paths = [tmp_path / n for n in ("a.dftxt", "b.dftxt", "c.dftxt")]
+    observed = dftxt.read_many(paths, kind=kind, workers=2, concat=True)  # type: ignore
+
+    assert list(observed.errors) == [tmp_path / "c.dftxt"]
+    assert observed.concatenated.frame_names == ("planets", "moons")
+    planets = observed.concatenated.planets
+    if kind == "pandas":
+        expected = pd.DataFrame(
+            {
+                "name": ["Earth", "Jupiter", "Neptune"],
+                "kind": pd.Categorical(["rock", "gas", "ice"]),
+            }
+        )
+        pd_test.assert_frame_equal(planets, expected)
+    else:
+        assert planets.schema["kind"] == pl.Categorical
+        pl_test.assert_series_equal(
+            planets["kind"].cast(pl.Utf8), pl.Series("kind", ["rock", "gas", "ice"])
+        )
+
+
+def test_read_many_after_polars():
+    """Should not hang reading in worker processes after Polars has been used."""
+    expected = dftxt.read_all(_MULTI_BLOCK, kind="polars")
+    observed = dftxt.read_many([_MULTI_BLOCK], kind="polars", workers=2)
+
+    assert list(observed) == [_MULTI_BLOCK]
+    for frame, expected_frame in zip(
+        observed[_MULTI_BLOCK].to_tuple(), expected.to_tuple()
+    ):
+        pl_test.assert_frame_equal(frame, expected_frame)
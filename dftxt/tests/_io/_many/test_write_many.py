@@ -0,0 +1,71 @@
+import decimal
+import os
+import pathlib
+import typing
+
+import pandas as pd
+import polars as pl
+import pytest
+from pytest import mark
+
+import dftxt
+
+_PANDAS = pd.DataFrame({"name": ["alpha", "beta"], "value": [1, 2]})
+_MULTI_BLOCK = (
+    pathlib.Path(__file__).resolve().parent.parent
+    / "scenarios"
+    / "multi_block"
+    / "source.dftxt"
+)
+_POLARS = pl.DataFrame(
+    {"price": [decimal.Decimal("1.50"), decimal.Decimal("2.25")]},
+    schema={"price": pl.Decimal(10, 2)},
+)
+
+
+@mark.parametrize("workers", [None, 2])
+def test_write_many(tmp_path: pathlib.Path, workers: typing.Optional[int]):
+    """Should write each file as write or write_all would write it."""
+    files: typing.Dict[typing.Any, typing.Any] = {
+        tmp_path / "single.dftxt": _PANDAS,
+        tmp_path / "named.dftxt": {"pandas": _PANDAS, "polars": _POLARS},
+        str(tmp_path / "listed.dftxt"): [_POLARS, _PANDAS],
+    }
+    observed = dftxt.write_many(files, workers=workers)
+
+    assert list(observed) == [pathlib.Path(p) for p in files]
+    for path, written in observed.items():
+        assert written.path == path
+        assert written.size == path.stat().st_size
+        assert written.seconds >= 0
+
+    assert (tmp_path / "single.dftxt").read_text() == dftxt.writes(_PANDAS) + "\n"
+    expected = dftxt.writes_all({"pandas": _PANDAS, "polars": _POLARS}) + "\n"
+    assert (tmp_path / "named.dftxt").read_text() == expected
+    expected = dftxt.writes_all([_POLARS, _PANDAS]) + "\n"
+    assert (tmp_path / "listed.dftxt").read_text() == expected
+    assert sorted(os.listdir(tmp_path)) == sorted(p.name for p in observed)
+
+
+def test_write_many_after_polars(tmp_path: pathlib.Path):
+    """Should not hang writing in worker processes after Polars has been used."""
+    expected = dftxt.read_all(_MULTI_BLOCK, kind="polars")
+    path = tmp_path / "multi_block.dftxt"
+    observed = dftxt.write_many({path: expected.to_tuple()}, workers=2)
+
+    assert list(observed) == [path]
+    assert path.read_text() == dftxt.writes_all(expected.to_tuple()) + "\n"
+
+
+def test_write_many_atomic(tmp_path: pathlib.Path):
+    """Should leave existing files untouched when writing them fails."""
+    path = tmp_path / "existing.dftxt"
+    path.write_text("original")
+    other = tmp_path / "other.dftxt"
+
+    with pytest.raises(ValueError):
+        dftxt.write_many({path: "not a data frame", other: _PANDAS})  # type: ignore
+
+    assert path.read_text() == "original"
+    assert other.read_text() == dftxt.writes(_PANDAS) + "\n"
+    assert sorted(os.listdir(tmp_path)) == ["existing.dftxt", "other.dftxt"]
@@ -2,6 +2,7 @@ import difflib
 import pathlib
 
 from pytest import mark
+from pytest import raises
 
 from dftxt._io import _markdown
 
@@ -39,3 +40,40 @@ def test_markdown(name: str):
     ), "Unexpected extraction results:\n{}\n\nfrom observed\n\n{}".format(
         "".join(diff_lines), observed_extracted
     )
+
+
+@mark.parametrize(
+    "names, expected",
+    [
+        (
+            None,
+            [
+                ("people", "markdown fences at lines 21-25, 30-33, 47-54"),
+                ("books", "markdown fence at lines 61-68"),
+            ],
+        ),
+        (["books"], [("books", "markdown fence at lines 61-68")]),
+    ],
+)
+def test_iter_sections(names, expected):
+    """Should find the sections of the named fences with their line numbers."""
+    source = _DIRECTORY.joinpath("multiple_frames", "source.md").read_text("utf-8")
+    observed = [(s.name, s.location) for s in _markdown.iter_sections(source, names)]
+    assert observed == expected
+
+
+def test_iter_sections_text():
+    """Should combine the fences of the sections as they are extracted."""
+    directory = _DIRECTORY / "multiple_frames"
+    source = directory.joinpath("source.md").read_text("utf-8")
+    sections = list(_markdown.iter_sections(source))
+    observed = "\n\n".join(
+        f"--- {s.name} ---\n\n{s.to_text().rstrip()}" for s in sections
+    )
+    assert observed == _markdown.extract(source).rstrip()
+
+
+def test_iter_sections_missing():
+    """Should raise an error when selected fences are not found."""
+    with raises(ValueError, match="not found"):
+        list(_markdown.iter_sections("```df a\nx\n1\n```\n", ["a", "b"]))
@@ -0,0 +1,60 @@
+import pathlib
+import typing
+
+import pandas.testing as pd_test
+import polars as pl
+import polars.testing as pl_test
+import pyarrow as pa
+from pytest import mark
+
+import dftxt
+
+_DIRECTORY = pathlib.Path(__file__).resolve().parent.parent / "scenarios"
+_SOURCES = sorted(_DIRECTORY.glob("*/source.dftxt"))
+
+_TABLE = r"""
+id          size                   grade             price
+&&int       &dtype=ordinal:S,M,L   &&category        &&decimal
+&index
+1           M                      b                 1.50
+2           L                      a                 NA
+3           S                      b                 3.25
+"""
+
+
+@mark.parametrize("path", _SOURCES, ids=[p.parent.name for p in _SOURCES])
+@mark.parametrize("engine", ["python", "arrow"])
+def test_read_all_arrow(path: pathlib.Path, engine: typing.Any):
+    """Should read Arrow Tables that convert into the Polars DataFrames."""
+    observed = dftxt.read_all(path, kind="arrow", engine=engine)
+    with pl.StringCache():
+        expected = dftxt.read_all(path, kind="polars", engine=engine)
+        frames = [pl.from_arrow(table) for table in observed.to_tuple()]
+    assert observed.frame_names == expected.frame_names
+    for table, frame, expected_frame in zip(
+        observed.to_tuple(), frames, expected.to_tuple()
+    ):
+        assert isinstance(table, pa.Table)
+        assert isinstance(frame, pl.DataFrame)
+        pl_test.assert_frame_equal(
+            frame, expected_frame, check_dtype=False, categorical_as_str=True
+        )
+
+
+def test_reads_arrow():
+    """Should read categorical columns as dictionaries and index columns as such."""
+    observed = dftxt.reads(_TABLE, kind="arrow")
+    assert observed.schema.field("size").type == pa.dictionary(
+        pa.int32(), pa.string(), ordered=True
+    )
+    assert observed["size"].chunk(0).dictionary.to_pylist() == ["S", "M", "L"]
+    assert observed["grade"].chunk(0).dictionary.to_pylist() == ["a", "b"]
+    assert observed.schema.pandas_metadata["index_columns"] == ["id"]
+    pd_test.assert_frame_equal(observed.to_pandas(), dftxt.reads(_TABLE))
+
+
+def test_reads_arrow_columns():
+    """Should keep index columns when reading only some of the columns."""
+    observed = dftxt.reads(_TABLE, kind="arrow", columns=["grade"])
+    assert observed.column_names == ["id", "grade"]
+    assert list(observed.to_pandas().index) == [1, 2, 3]
@@ -0,0 +1,84 @@
+import io
+import pathlib
+import typing
+
+import pandas.testing as pd_test
+import polars as pl
+import polars.testing as pl_test
+import pytest
+from pytest import mark
+
+import dftxt
+
+_DIRECTORY = pathlib.Path(__file__).resolve().parent.parent / "scenarios"
+_SOURCES = sorted(_DIRECTORY.glob("*/source.dftxt"))
+
+_TABLE = """
+name    value        tags
+        &dtype=int   &-extra
+alpha   1            a
+beta    2            b \\
+                     c
+"""
+
+
+@mark.parametrize("path", _SOURCES, ids=[p.parent.name for p in _SOURCES])
+def test_read_all_columns(path: pathlib.Path):
+    """Should read the requested columns as they would be read in full."""
+    expected = dftxt.read_all(path)
+    for name, frame in zip(expected.frame_names, expected.to_tuple()):
+        columns = [c for c in frame.columns[::2] if isinstance(c, str)]
+        if not columns:
+            continue
+
+        observed = dftxt.read_all(path, columns=columns, mmap=True)
+        pd_test.assert_frame_equal(observed[name], frame[columns])
+
+        lazy = dftxt.read_all(path, columns=columns, lazy=True)
+        pd_test.assert_frame_equal(lazy[name], frame[columns])
+
+
+@mark.parametrize("kind", ["pandas", "polars"])
+def test_reads_columns(kind: str):
+    """Should read the requested columns, including continued rows."""
+    observed = dftxt.reads(_TABLE, kind=kind, columns=["tags", "name"])  # type: ignore
+    assert list(observed.columns) == ["name", "tags"]
+    assert list(observed["tags"]) == ["a", "b c"]
+
+
+@mark.parametrize("kind", ["pandas", "polars"])
+@mark.parametrize("columns", [["b", "c"], ["c"], ["a", "c"]])
+def test_reads_columns_late_modifiers(kind: str, columns: typing.List[str]):
+    """Should apply modifier rows after the data rows to the requested columns."""
+    source = "a    b    c\n1    2    3\n4    5    6\n          &&int\n"
+    expected = dftxt.reads(source, kind=kind)[columns]  # type: ignore
+    observed = dftxt.reads(source, kind=kind, columns=columns)  # type: ignore
+    if kind == "pandas":
+        pd_test.assert_frame_equal(observed, expected)
+    else:
+        pl_test.assert_frame_equal(observed, expected)
+    assert str(observed["c"].dtype).lower() == "int64"
+
+
+def test_reads_columns_filtered():
+    """Should not read requested columns that are skipped by the filters."""
+    observed = dftxt.reads(_TABLE, filters=["extra"], columns=["value", "tags"])
+    assert list(observed.columns) == ["value"]
+
+
+def test_reads_columns_missing():
+    """Should raise an error for requested columns that are not in the table."""
+    with pytest.raises(ValueError, match="'spam'"):
+        dftxt.reads(_TABLE, columns=["name", "spam"])
+
+
+def test_stream_columns():
+    """Should stream the requested columns from the streaming readers."""
+    rows = list(dftxt.iter_rows(io.StringIO(_TABLE), columns=["value"]))
+    assert rows == [(1,), (2,)]
+
+    with pl.StringCache():
+        batches = list(dftxt.reads_batches(_TABLE, 1, kind="polars", columns=["value"]))
+    pl_test.assert_frame_equal(
+        pl.concat(batches), dftxt.reads(_TABLE, kind="polars", columns=["value"])
+    )
@@ -0,0 +1,86 @@
+import decimal
+import typing
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+from pytest import mark
+
+import dftxt
+from dftxt._io import _cast
+
+_TABLE = r"""
+price                  quantity
+&dtype=decimal[12,5]   &&decimal
+25.49                  1.5
+NA                     2.25
+-1                     3
+3.14159                NA
+"""
+
+
+@mark.parametrize("engine", ["python", "arrow", "pandas"])
+def test_reads_decimal_pandas(engine: typing.Any):
+    """Should read parameterized decimals into native Arrow decimal columns."""
+    observed = dftxt.reads(_TABLE, engine=engine)
+    assert observed["price"].dtype == pd.ArrowDtype(pa.decimal128(12, 5))
+    assert observed["price"][0] == decimal.Decimal("25.49000")
+    assert observed["price"][3] == decimal.Decimal("3.14159")
+    assert observed["quantity"].dtype == "object"
+
+
+@mark.parametrize("engine", ["python", "arrow", "polars"])
+def test_reads_decimal_polars(engine: typing.Any):
+    """Should read parameterized decimals with their precision and scale."""
+    observed = dftxt.reads(_TABLE, kind="polars", engine=engine)
+    assert observed.schema["price"] == pl.Decimal(12, 5)
+    assert observed["price"].to_list() == [
+        decimal.Decimal("25.49000"),
+        None,
+        decimal.Decimal("-1.00000"),
+        decimal.Decimal("3.14159"),
+    ]
+
+
+@mark.parametrize("kind", ["pandas", "polars"])
+def test_writes_decimal(kind: typing.Any):
+    """Should write parameterized decimals with their precision and scale."""
+    data_frame = dftxt.reads(_TABLE, kind=kind)
+    written = dftxt.writes(data_frame)
+    assert written.splitlines()[1].split() == ["&dtype=decimal[12,5]", "&dtype=decimal"]
+    assert dftxt.writes(dftxt.reads(written, kind=kind)) == written
+
+
+@mark.parametrize(
+    "kind, engine",
+    [
+        ("pandas", "python"),
+        ("pandas", "arrow"),
+        ("pandas", "pandas"),
+        ("polars", "python"),
+        ("polars", "arrow"),
+        ("polars", "polars"),
+        ("arrow", "python"),
+        ("arrow", "arrow"),
+    ],
+)
+@mark.parametrize("value", ["1.25", "1.20", "1234"])
+def test_reads_decimal_invalid(kind: typing.Any, engine: typing.Any, value: str):
+    """Should raise errors for values that do not fit rather than round them."""
+    with pytest.raises(ValueError, match="does not fit"):
+        dftxt.reads(f"x\n&dtype=decimal[4,1]\n{value}\n", kind=kind, engine=engine)
+
+
+def test_reads_decimal_native():
+    """Should cast parameterized decimals into Arrow arrays without Decimal objects."""
+    cells = ["1.5", None, "NA", "-22.125"]
+    observed = _cast.to_pandas(cells, "decimal[6,3]")
+    assert isinstance(observed, pd.arrays.ArrowExtensionArray)
+    assert observed.tolist() == [
+        decimal.Decimal("1.500"),
+        pd.NA,
+        pd.NA,
+        decimal.Decimal("-22.125"),
+    ]
+    assert _cast.to_pandas(["1.50000"], "decimal[6,3]") is None
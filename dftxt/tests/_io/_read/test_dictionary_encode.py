@@ -0,0 +1,54 @@
+import typing
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+from pytest import mark
+
+import dftxt
+
+_TABLE = r"""
+id     carrier   origin   flights
+&&int  &&str              &&int
+&index
+1      AA        JFK      3
+2      UA        LGA      1
+3      AA        NA       4
+4      AA        JFK      1
+"""
+
+
+@mark.parametrize("engine", ["python", "arrow", "pandas"])
+def test_reads_dictionary_encode_pandas(engine: typing.Any):
+    """Should read string columns as categorical columns when dictionary-encoded."""
+    expected = dftxt.reads(_TABLE, engine=engine)
+    observed = dftxt.reads(_TABLE, engine=engine, dictionary_encode=True)
+    assert observed["carrier"].dtype == "category"
+    assert observed["origin"].cat.categories.tolist() == ["JFK", "LGA"]
+    assert observed["origin"].isna().tolist() == [False, False, True, False]
+    assert observed["carrier"].tolist() == expected["carrier"].tolist()
+    pd.testing.assert_series_equal(observed["flights"], expected["flights"])
+
+
+@mark.parametrize("engine", ["python", "arrow", "polars"])
+def test_reads_dictionary_encode_polars(engine: typing.Any):
+    """Should read string columns as Polars categorical columns."""
+    expected = dftxt.reads(_TABLE, kind="polars", engine=engine)
+    observed = dftxt.reads(_TABLE, kind="polars", engine=engine, dictionary_encode=True)
+    assert observed.schema["carrier"] == pl.Categorical
+    assert observed.schema["origin"] == pl.Categorical
+    assert observed.with_columns(pl.col(pl.Categorical).cast(pl.Utf8)).equals(expected)
+
+
+def test_reads_dictionary_encode_arrow():
+    """Should read string columns as Arrow dictionary arrays."""
+    observed = dftxt.reads(_TABLE, kind="arrow", dictionary_encode=True)
+    assert pa.types.is_dictionary(observed.schema.field("carrier").type)
+    assert observed["origin"].to_pylist() == ["JFK", "LGA", None, "JFK"]
+
+
+@mark.parametrize("engine", ["python", "pandas"])
+def test_reads_shared_strings(engine: typing.Any):
+    """Should share a single object for each of the distinct strings of columns."""
+    observed = dftxt.reads(_TABLE, engine=engine)
+    assert observed["carrier"].iloc[0] is observed["carrier"].iloc[3]
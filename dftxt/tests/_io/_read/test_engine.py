@@ -0,0 +1,143 @@
+import datetime
+import decimal
+import pathlib
+import typing
+
+import pandas.testing as pd_test
+import polars as pl
+import polars.testing as pl_test
+import pytest
+from pytest import mark
+
+import dftxt
+
+_DIRECTORY = pathlib.Path(__file__).resolve().parent.parent / "scenarios"
+_SOURCES = sorted(_DIRECTORY.glob("*/source.dftxt"))
+
+_TABLE = r"""
+count   price        flag    day         at                    zoned
+&&int   &&decimal    &&bool  &&date      &&datetime            &dtype=datetime[UTC]
+1       1.50         yes     2024-01-02  2024-01-02T03:04:05Z  2024-01-02T03:04:05
+NA      -22.1        NA      NAT         None                  null
+3       3            off     2024-03-04  2024-03-04T05:06:07Z  2024-03-04T05:06:07
+"""
+
+
+@mark.parametrize("path", _SOURCES, ids=[p.parent.name for p in _SOURCES])
+@mark.parametrize("kind", ["pandas", "polars", "arrow"])
+def test_read_all_arrow_engine(path: pathlib.Path, kind: typing.Any):
+    """Should read the same DataFrames, with the same dtypes, as without it."""
+    with pl.StringCache():
+        expected = dftxt.read_all(path, kind=kind)
+        observed = dftxt.read_all(path, kind=kind, engine="arrow")
+    for frame, expected_frame in zip(observed.to_tuple(), expected.to_tuple()):
+        if kind == "pandas":
+            pd_test.assert_frame_equal(frame, expected_frame)
+        elif kind == "polars":
+            assert frame.schema == expected_frame.schema
+            pl_test.assert_frame_equal(frame, expected_frame)
+        else:
+            assert frame.schema == expected_frame.schema
+            assert frame.equals(expected_frame)
+
+
+@mark.parametrize("path", _SOURCES, ids=[p.parent.name for p in _SOURCES])
+def test_read_all_pandas_engine(path: pathlib.Path):
+    """Should read the same DataFrames with the pandas engine as without it."""
+    expected = dftxt.read_all(path)
+    observed = dftxt.read_all(path, engine="pandas")
+    for frame, expected_frame in zip(observed.to_tuple(), expected.to_tuple()):
+        pd_test.assert_frame_equal(frame, expected_frame, check_exact=True)
+
+
+def test_reads_pandas_engine():
+    """Should cast columns with vectorized Pandas and NumPy functions."""
+    table = _TABLE.replace("&&int ", "&&Int ").replace("[UTC]", "64[ns, UTC]")
+    observed = dftxt.reads(table, engine="pandas")
+    pd_test.assert_frame_equal(observed, dftxt.reads(table), check_exact=True)
+    assert str(observed["count"].dtype) == "Int64"
+    assert str(observed["at"].dtype) == "datetime64[ns, UTC]"
+    assert str(observed["zoned"].dtype) == "datetime64[ns, UTC]"
+    with pytest.raises(ValueError):
+        dftxt.reads(_TABLE, kind="polars", engine="pandas")
+
+
+def test_reads_arrow_engine():
+    """Should mask missing values and cast each column in vectorized passes."""
+    observed = dftxt.reads(_TABLE, kind="polars", engine="arrow")
+    assert observed.schema == {
+        "count": pl.Int64,
+        "price": pl.Decimal(None, 2),
+        "flag": pl.Boolean,
+        "day": pl.Date,
+        "at": pl.Datetime("us", "UTC"),
+        "zoned": pl.Datetime("us", "UTC"),
+    }
+    assert observed.row(1) == (None, decimal.Decimal("-22.10"), None, None, None, None)
+    assert observed["flag"].to_list() == [True, None, False]
+    assert observed["zoned"][0] == datetime.datetime(
+        2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc
+    )
+    pl_test.assert_frame_equal(observed, dftxt.reads(_TABLE, kind="polars"))
+
+
+def test_reads_arrow_engine_fallback():
+    """Should cast values that Arrow cannot parse one at a time instead."""
+    table = "at\n&&datetime\n2024-01-02T03:04:05+05:00\n2024-01-02T03:04:05\n"
+    observed = dftxt.reads(table, engine="arrow")
+    pd_test.assert_frame_equal(observed, dftxt.reads(table))
+
+
+@mark.parametrize(
+    "table",
+    [
+        "x\n&&decimal\n0.001\n00\n",
+        "x\n&&datetime\nNone\n",
+        "x\n&&int\nNA\n",
+        "x\n&dtype=datetime[America/New_York]\n2024-01-02T03:04:05\n",
+    ],
+)
+@mark.parametrize("kind", ["polars", "arrow"])
+def test_reads_arrow_engine_dtypes(table: str, kind: typing.Any):
+    """Should read the same dtypes as without the arrow engine."""
+    expected = dftxt.reads(table, kind=kind)
+    observed = dftxt.reads(table, kind=kind, engine="arrow")
+    assert observed.schema == expected.schema
+    if kind == "arrow":
+        assert observed.equals(expected)
+    else:
+        pl_test.assert_frame_equal(observed, expected)
+
+
+@mark.parametrize(
+    "kind, data_type",
+    [
+        ("pandas", "datetime64[ns, UTC]"),
+        ("polars", "datetime[UTC]"),
+        ("arrow", "datetime[UTC]"),
+    ],
+)
+def test_reads_arrow_engine_zoned_offsets(kind: typing.Any, data_type: str):
+    """Should read zoned values with offsets as without the arrow engine."""
+    table = f"x\n&dtype={data_type}\n2024-01-01T10:00:00+02:00\n"
+    expected = dftxt.reads(table, kind=kind)
+    observed = dftxt.reads(table, kind=kind, engine="arrow")
+    if kind == "pandas":
+        pd_test.assert_frame_equal(observed, expected)
+    else:
+        assert observed.equals(expected)
+    value = observed["x"][0]
+    assert (value.as_py() if kind == "arrow" else value).hour == 10
+
+
+@mark.parametrize("engine", ["python", "arrow", "pandas"])
+def test_reads_engine_invalid_int(engine: typing.Any):
+    """Should raise the same errors for missing values of NumPy integer columns."""
+    with pytest.raises(TypeError):
+        dftxt.reads("x\n&&int\n1\nNone\n", engine=engine)
+
+
+def test_reads_invalid_engine():
+    """Should raise an error for unknown engines."""
+    with pytest.raises(ValueError):
+        dftxt.reads(_TABLE, engine="spam")  # type: ignore
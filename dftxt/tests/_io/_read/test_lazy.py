@@ -0,0 +1,84 @@
+import pathlib
+
+import polars.testing as pl_test
+from pytest import mark
+
+import dftxt
+from dftxt._io import _read
+
+_DIRECTORY = pathlib.Path(__file__).resolve().parent.parent / "scenarios"
+_SOURCES = sorted(_DIRECTORY.glob("*/*.dftxt"))
+
+_EDGE_CASES = """
+--- only_index ---
+foo
+&index
+1
+
+--- filtered ---
+bar
+&if=spam
+2
+
+--- ---
+# Only a comment.
+
+---
+baz
+3
+"""
+
+
+@mark.parametrize("path", _SOURCES, ids=[f"{p.parent.name}/{p.stem}" for p in _SOURCES])
+@mark.parametrize("mmap", [False, True])
+def test_read_all_lazy(path: pathlib.Path, mmap: bool):
+    """Should lazily read the same frames that are eagerly read from the file."""
+    try:
+        expected = dftxt.read_all(path, kind="polars")
+    except ValueError:
+        return
+
+    observed = dftxt.read_all(path, kind="polars", mmap=mmap, lazy=True)
+    assert observed.frame_names == expected.frame_names
+    assert observed.sourced_frame_names == expected.sourced_frame_names
+    for loaded, expected_loaded in zip(observed, expected):
+        pl_test.assert_frame_equal(loaded.frame, expected_loaded.frame)
+
+
+@mark.parametrize("kind", ["pandas", "polars"])
+@mark.parametrize("filters", [None, ["spam"]])
+def test_reads_all_lazy_frame_names(kind: str, filters: list):
+    """Should find the same frames as eager reads without reading data rows."""
+    expected = dftxt.reads_all(_EDGE_CASES, kind=kind, filters=filters)  # type: ignore
+    observed = dftxt.reads_all(
+        _EDGE_CASES,
+        kind=kind,
+        filters=filters,
+        lazy=True,  # type: ignore
+    )
+    assert observed.frame_names == expected.frame_names
+    assert observed.sourced_frame_names == expected.sourced_frame_names
+
+
+def test_reads_all_lazy_memoized(monkeypatch):
+    """Should read each frame only when first accessed and only once."""
+    read_frames = []
+    read_section = _read._read_section
+
+    def _read_section(*args, **kwargs):
+        read_frames.append(args)
+        return read_section(*args, **kwargs)
+
+    monkeypatch.setattr(_read, "_read_section", _read_section)
+    observed = dftxt.reads_all(_EDGE_CASES, kind="polars", lazy=True)
+    assert observed.frame_names == ("only_index", "baz")
+    assert "baz" in observed
+    assert len(read_frames) == 0
+
+    frame = observed.baz
+    assert observed["baz"] is frame
+    assert observed[1] is frame
+    assert len(read_frames) == 1
+
+    expected = dftxt.reads_all(_EDGE_CASES, kind="polars").baz
+    pl_test.assert_frame_equal(frame, expected)
@@ -0,0 +1,61 @@
+import pathlib
+import typing
+from concurrent import futures
+
+from pytest import mark
+from pytest import raises
+
+import dftxt
+
+_SOURCE = """# Flights
+
+```df flights
+id     carrier
+&&int
+1      AA
+```
+
+Some text between the fences.
+
+```df airports
+code  city
+JFK   New York
+```
+
+```df flights
+spam   UA
+```
+"""
+
+
+@mark.parametrize("settings", [{}, {"lazy": True}, {"workers": 1}])
+def test_reads_all_fences(settings: typing.Dict[str, typing.Any]):
+    """Should only read the selected fences of the markdown."""
+    observed = dftxt.reads_all(_SOURCE, markdown=True, fences=["airports"], **settings)
+    assert observed.frame_names == ("airports",)
+    assert observed.airports["city"].tolist() == ["New York"]
+
+
+@mark.parametrize("settings", [{}, {"lazy": True}, {"workers": 1}])
+def test_reads_all_error_lines(settings: typing.Dict[str, typing.Any]):
+    """Should report the line numbers of the fences in errors reading them."""
+    with raises(ValueError, match="markdown fences at lines 3-7, 16-18"):
+        dftxt.reads_all(_SOURCE, markdown=True, **settings).flights
+
+
+def test_reads_all_error_lines_parallel():
+    """Should report the line numbers of the fences read in parallel."""
+    with futures.ThreadPoolExecutor() as pool, raises(ValueError, match="16-18"):
+        dftxt.reads_all(_SOURCE, markdown=True, executor=pool)
+
+
+def test_read_all_fences(tmp_path: pathlib.Path):
+    """Should select the fences of markdown files and reject them otherwise."""
+    path = tmp_path / "source.md"
+    path.write_text(_SOURCE.replace("spam", "2   "))
+    observed = dftxt.read_all(path, fences=["flights"], mmap=True)
+    assert observed.flights["carrier"].tolist() == ["AA", "UA"]
+
+    path = path.rename(tmp_path / "source.dftxt")
+    with raises(ValueError, match="only be selected from markdown"):
+        dftxt.read_all(path, fences=["flights"], mmap=True)
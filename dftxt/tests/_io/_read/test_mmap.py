@@ -0,0 +1,54 @@
+import pathlib
+
+import pandas.testing as pd_test
+from pytest import mark
+
+import dftxt
+
+_DIRECTORY = pathlib.Path(__file__).resolve().parent.parent / "scenarios"
+_SOURCES = sorted(_DIRECTORY.glob("*/source.dftxt"))
+
+
+@mark.parametrize("path", _SOURCES, ids=[p.parent.name for p in _SOURCES])
+def test_read_all_mmap(path: pathlib.Path):
+    """Should read the same frames from the mapped file as from the decoded one."""
+    expected = dftxt.read_all(path)
+    observed = dftxt.read_all(path, mmap=True)
+    assert observed.sourced_frame_names == expected.sourced_frame_names
+    for frame, expected_frame in zip(observed.to_tuple(), expected.to_tuple()):
+        pd_test.assert_frame_equal(frame, expected_frame)
+
+    if len(expected) == 1:
+        pd_test.assert_frame_equal(dftxt.read(path, mmap=True), dftxt.read(path))
+
+
+@mark.parametrize("encoding", ["utf-8", "utf-16"])
+def test_read_mmap_newlines(tmp_path: pathlib.Path, encoding: str):
+    """Should read mapped files with Windows newlines or non-ASCII encodings."""
+    path = tmp_path / "source.dftxt"
+    table = "\n".join(
+        [
+            "--- foo ---",
+            "",
+            "name  value",
+            "      &dtype=int",
+            "Åsa   1",
+            "",
+            "--- bar ---",
+        ]
+        + ["spam", "ham", ""]
+    )
+    path.write_bytes(table.replace("\n", "\r\n").encode(encoding))
+
+    observed = dftxt.read_all(path, encoding=encoding, mmap=True)
+    expected = dftxt.reads_all(table)
+    assert observed.sourced_frame_names == ("foo", "bar")
+    pd_test.assert_frame_equal(observed.foo, expected.foo)
+    pd_test.assert_frame_equal(observed.bar, expected.bar)
+
+
+def test_read_mmap_empty(tmp_path: pathlib.Path):
+    """Should read empty files that cannot be mapped."""
+    path = tmp_path / "source.dftxt"
+    path.write_text("")
+    assert len(dftxt.read_all(path, mmap=True)) == 0
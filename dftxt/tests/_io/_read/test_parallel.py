@@ -0,0 +1,101 @@
+import pathlib
+import typing
+from concurrent import futures
+
+import pandas.testing as pd_test
+import polars.testing as pl_test
+import pytest
+from pytest import MonkeyPatch, mark
+
+import dftxt
+from dftxt._io import _read
+
+_DIRECTORY = pathlib.Path(__file__).resolve().parent.parent / "scenarios"
+_SOURCES = sorted(_DIRECTORY.glob("*/source.dftxt"))
+
+_TABLES = r"""
+--- wrapped ---
+
+name    value
+        &dtype=int
+alpha   1
+beta    2
+
+
+price           tags
+&dtype=decimal
+1.50            a \
+                b
+2.25            c
+
+--- other ---
+
+score
+&dtype=float
+1.5
+"""
+
+
+def test_read_all_parallel():
+    """Should read the same frames in parallel as when read one after another."""
+    with futures.ProcessPoolExecutor(max_workers=2) as pool:
+        for path in _SOURCES:
+            expected = dftxt.read_all(path)
+            observed = dftxt.read_all(path, executor=pool)
+            assert observed.sourced_frame_names == expected.sourced_frame_names
+            for frame, expected_frame in zip(observed.to_tuple(), expected.to_tuple()):
+                pd_test.assert_frame_equal(frame, expected_frame)
+
+
+@mark.parametrize("kind", ["pandas", "polars"])
+def test_reads_all_parallel_blocks(monkeypatch: MonkeyPatch, kind: str):
+    """Should read the blocks of wrapped frames in parallel and combine them."""
+    monkeypatch.setattr(_read, "_PARALLEL_BLOCK_MIN_LINES", 0)
+    sections = dict(_read._iter_text_sections(_TABLES))
+    assert len(_read._split_blocks(list(sections["wrapped"]()), "&")) == 2
+    settings: typing.Dict[str, typing.Any] = {
+        "kind": kind,
+        "columns": ["name", "price", "tags", "score"],
+    }
+    expected = dftxt.reads_all(_TABLES, **settings)
+    observed = dftxt.reads_all(_TABLES, workers=2, **settings)
+    assert observed.frame_names == ("wrapped", "other")
+    for frame, expected_frame in zip(observed.to_tuple(), expected.to_tuple()):
+        if kind == "pandas":
+            pd_test.assert_frame_equal(frame, expected_frame)
+        else:
+            pl_test.assert_frame_equal(frame, expected_frame)
+
+
+def test_read_all_parallel_after_polars():
+    """Should not hang reading in worker processes after Polars has been used."""
+    path = _DIRECTORY / "multi_block" / "source.dftxt"
+    expected = dftxt.read_all(path, kind="polars")
+    for observed in (
+        dftxt.read_all(path, kind="polars", workers=2),
+        dftxt.reads_all(path.read_text(), kind="polars", workers=2),
+    ):
+        assert observed.frame_names == expected.frame_names
+        for frame, expected_frame in zip(observed.to_tuple(), expected.to_tuple()):
+            pl_test.assert_frame_equal(frame, expected_frame)
+
+
+def test_reads_all_parallel_missing_columns():
+    """Should raise an error for requested columns not found by any worker."""
+    with futures.ThreadPoolExecutor(max_workers=2) as pool:
+        with pytest.raises(ValueError, match="'spam'"):
+            dftxt.reads_all(_TABLES, columns=["name", "spam"], executor=pool)
+
+
+@mark.parametrize(
+    "settings",
+    [
+        {"workers": 0},
+        {"workers": 2, "executor": futures.ThreadPoolExecutor()},
+        {"workers": 2, "lazy": True},
+    ],
+)
+def test_reads_all_parallel_invalid(settings: typing.Dict[str, typing.Any]):
+    """Should raise an error for invalid parallel read settings."""
+    with pytest.raises(ValueError):
+        dftxt.reads_all(_TABLES, **settings)
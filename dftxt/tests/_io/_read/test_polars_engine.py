@@ -0,0 +1,110 @@
+import pathlib
+import typing
+
+import polars as pl
+import polars.testing as pl_test
+import pytest
+from pytest import mark
+
+import dftxt
+from dftxt._io import _polars
+from dftxt._io import _read
+
+_DIRECTORY = pathlib.Path(__file__).resolve().parent.parent / "scenarios"
+_SOURCES = sorted(_DIRECTORY.glob("*/source.dftxt"))
+
+_TABLE = r"""
+count   price        flag    day         at                    state
+&&int   &&decimal    &&bool  &&date      &&datetime            &dtype=ord:low,high
+1       1.50         yes     2024-01-02  2024-01-02T03:04:05   high
+NA      -22.1        NA      NAT         None                  null
+3       3            off     2024-03-04  2024-03-04T05:06:07   low
+4
+"""
+
+_TOKENIZED = {
+    "quoted": 'name      value\n          &&int\n"a  b"    1\nbeta      2\n',
+    "continued": "name   value\n       &&int\na \\    1\nb      \nc      2\n",
+    "misaligned": "name  label\nalpha_beta gamma\nbeta  delta\n",
+}
+
+
+@mark.parametrize("path", _SOURCES, ids=[p.parent.name for p in _SOURCES])
+def test_read_all_polars_engine(path: pathlib.Path):
+    """Should read the same DataFrames with the polars engine as without it."""
+    with pl.StringCache():
+        expected = dftxt.read_all(path, kind="polars")
+        observed = dftxt.read_all(path, kind="polars", engine="polars")
+    assert observed.frame_names == expected.frame_names
+    for frame, expected_frame in zip(observed.to_tuple(), expected.to_tuple()):
+        pl_test.assert_frame_equal(frame, expected_frame)
+
+
+@mark.parametrize(
+    "settings",
+    [{}, {"columns": ["price", "state"]}, {"nrows": 2, "skip_rows": 1}],
+)
+def test_reads_polars_engine(settings: typing.Dict[str, typing.Any]):
+    """Should cut and cast the cells of aligned blocks within Polars."""
+    with pl.StringCache():
+        expected = dftxt.reads(_TABLE, kind="polars", **settings)
+        observed = dftxt.reads(_TABLE, kind="polars", engine="polars", **settings)
+    pl_test.assert_frame_equal(observed, expected)
+
+
+@mark.parametrize("name", list(_TOKENIZED.keys()))
+def test_reads_polars_engine_tokenized(name: str):
+    """Should tokenize blocks that cannot be cut into cells by their boundaries."""
+    table = _TOKENIZED[name]
+    lines = list(_read._to_lines(table))
+    block = _read._scan_blocks(lines, "&")[0]
+    selection = _read._ColumnSelection()
+    rows = pl.Series("line", block.rows, dtype=pl.Utf8)
+    raw = _read._read_blocks(lines)[0]
+    assert block.has_continuations or _polars._cut_cells(rows, raw.columns) is None
+    pl_test.assert_frame_equal(
+        _polars.read_frame(lines, "&", selection),
+        dftxt.reads(table, kind="polars"),
+    )
+
+
+@mark.parametrize(
+    "table",
+    [
+        "x\n&&decimal\n1.50\nNone\n3.14159\n",
+        "x\n&&decimal\nNone\n-2\n.125\n",
+        "x\n&&decimal\nNone\nNone\n",
+    ],
+)
+def test_reads_polars_engine_decimals(table: str):
+    """Should read decimals with the scale of all of them, not the leading ones."""
+    expected = dftxt.reads(table, kind="polars")
+    observed = dftxt.reads(table, kind="polars", engine="polars")
+    assert observed.schema == expected.schema
+    pl_test.assert_frame_equal(observed, expected)
+
+
+@mark.parametrize(
+    "table",
+    [
+        "x\n&dtype=datetime[UTC]\n2024-01-01T10:00:00+02:00\n",
+        "x\n&dtype=datetime[UTC]\n2024-01-01T10:00:00\nNone\n",
+        "x\n&dtype=datetime[America/New_York]\n2024-01-01T10:00:00\n",
+        "x\n&dtype=datetime[America/New_York]\n2024-01-01T10:00:00-05:00\n",
+    ],
+)
+def test_reads_polars_engine_zoned(table: str):
+    """Should read zoned datetimes as they are read by each of the other engines."""
+    expected = dftxt.reads(table, kind="polars")
+    for engine in ("polars", "arrow"):
+        observed = dftxt.reads(table, kind="polars", engine=engine)  # type: ignore
+        assert observed.schema == expected.schema
+        pl_test.assert_frame_equal(observed, expected)
+
+
+def test_reads_polars_engine_invalid():
+    """Should raise the same errors for invalid values and unsupported kinds."""
+    with pytest.raises(ValueError, match="'q'"):
+        dftxt.reads("x\n&&int\n1\nq\n", kind="polars", engine="polars")
+    with pytest.raises(ValueError):
+        dftxt.reads(_TABLE, kind="pandas", engine="polars")
@@ -0,0 +1,94 @@
+import typing
+
+from pytest import mark
+
+from dftxt._io import _read
+
+
+class Scenario(typing.TypedDict):
+    """Interface for scenario tests."""
+
+    headers: str
+    line: str
+    sliced: bool
+
+
+_HEADERS = "foo   bar     hello world    spam"
+
+_SCENARIOS: typing.Dict[str, "Scenario"] = {
+    "basic": {
+        "headers": _HEADERS,
+        "line": "1     abc     some value     1.5",
+        "sliced": True,
+    },
+    "empty_cells": {
+        "headers": _HEADERS,
+        "line": "1                            1.5",
+        "sliced": True,
+    },
+    "single_column": {
+        "headers": "foo",
+        "line": "some value",
+        "sliced": True,
+    },
+    "apostrophe": {
+        "headers": _HEADERS,
+        "line": "1     it's    don't          1.5",
+        "sliced": True,
+    },
+    "hanging_column": {
+        "headers": _HEADERS,
+        "line": "1     abc     some value",
+        "sliced": False,
+    },
+    "negative_alignment": {
+        "headers": _HEADERS,
+        "line": "1     abc    -12            1.5",
+        "sliced": False,
+    },
+    "quoted": {
+        "headers": _HEADERS,
+        "line": '1     " ab"   some value     1.5',
+        "sliced": False,
+    },
+    "continuation": {
+        "headers": _HEADERS,
+        "line": "1     abc     some \\        1.5",
+        "sliced": False,
+    },
+}
+
+
+@mark.parametrize("scenario", list(_SCENARIOS.keys()))
+def test_row_slicer(scenario: str):
+    """Should slice rows identically to the per-cell path or defer to it."""
+    data = _SCENARIOS[scenario]
+    boundaries = _read._find_boundaries(data["headers"])
+    observed = _read._compile_row_slicer(boundaries)(data["line"])
+
+    if not data["sliced"]:
+        assert observed is None
+        return
+
+    expected, continues = _read._explode_line(boundaries, data["line"])
+    assert not continues
+    assert observed == expected
+
+
+@mark.parametrize("scenario", list(_SCENARIOS.keys()))
+def test_raw_rows(scenario: str):
+    """Should cut the cells of columns out of rows held as lines or as cells."""
+    data = _SCENARIOS[scenario]
+    basic = _SCENARIOS["basic"]["line"] if data["headers"] == _HEADERS else "value"
+    lines = [data["headers"], basic, data["line"], basic]
+    block = _read._read_blocks(lines)[0]
+    boundaries = _read._find_boundaries(data["headers"])
+    expected = [_read._explode_line(boundaries, line)[0] for line in lines[1:]]
+    rows = typing.cast(_read.RawRows, block.columns[0]._rows)
+    # Rows with quotes are cut by the row slicer and held as their cells.
+    is_line = data["sliced"] and "'" not in data["line"]
+    assert list(rows.positions) == ([] if is_line else [1])
+
+    for index, column in enumerate(block.columns):
+        assert column.cells == [row[index] for row in expected]
+        assert rows.cut_arrow(column.bounds, index).to_pylist() == column.cells
@@ -0,0 +1,70 @@
+import pathlib
+
+import polars as pl
+import polars.testing as pl_test
+import pytest
+from pytest import mark
+
+import dftxt
+
+_DIRECTORY = pathlib.Path(__file__).resolve().parent.parent / "scenarios"
+_SOURCES = sorted(_DIRECTORY.glob("*/source.dftxt"))
+
+_TABLE = r"""
+name    value        tags
+        &dtype=int
+alpha   1            a
+beta    2            b \
+                     c
+gamma   3            d
+
+
+score
+&dtype=float
+1.5
+2.5
+3.5
+"""
+
+
+@mark.parametrize("path", _SOURCES, ids=[p.parent.name for p in _SOURCES])
+@mark.parametrize("nrows, skip_rows", [(0, 0), (3, 0), (None, 2), (2, 1)])
+def test_read_all_rows(path: pathlib.Path, nrows: int, skip_rows: int):
+    """Should read the rows of each frame that would be sliced from the full read."""
+    with pl.StringCache():
+        expected = dftxt.read_all(path, kind="polars")
+        observed = dftxt.read_all(
+            path, kind="polars", nrows=nrows, skip_rows=skip_rows, mmap=True
+        )
+    assert observed.frame_names == expected.frame_names
+    for frame, expected_frame in zip(observed.to_tuple(), expected.to_tuple()):
+        pl_test.assert_frame_equal(
+            frame,
+            expected_frame.slice(skip_rows, nrows),
+            check_dtype=False,
+            categorical_as_str=True,
+        )
+
+
+def test_reads_rows():
+    """Should limit the rows of wrapped blocks alike, counting continued rows once."""
+    observed = dftxt.reads(_TABLE, nrows=2, skip_rows=1)
+    assert list(observed.columns) == ["name", "value", "tags", "score"]
+    assert list(observed["name"]) == ["beta", "gamma"]
+    assert list(observed["tags"]) == ["b c", "d"]
+    assert list(observed["score"]) == [2.5, 3.5]
+    assert list(observed.index) == [0, 1]
+
+
+def test_reads_rows_empty():
+    """Should keep the schema of the frame when no rows are read."""
+    observed = dftxt.reads(_TABLE, kind="polars", skip_rows=10)
+    assert observed.schema == dftxt.reads(_TABLE, kind="polars").schema
+    assert len(observed) == 0
+
+
+@mark.parametrize("nrows, skip_rows", [(-1, 0), (None, -1)])
+def test_reads_rows_invalid(nrows: int, skip_rows: int):
+    """Should raise an error for negative row counts."""
+    with pytest.raises(ValueError):
+        dftxt.reads(_TABLE, nrows=nrows, skip_rows=skip_rows)
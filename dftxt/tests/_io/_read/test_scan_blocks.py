@@ -0,0 +1,93 @@
+import typing
+
+from pytest import mark
+
+import dftxt
+from dftxt._io import _read
+
+_TABLES = {
+    "plain": r"""
+name    value    note
+        &&int
+# A comment between rows.
+alpha   1        first
+beta    22       second
+
+gamma   -3       hanging
+delta   4
+""",
+    "quoted": r"""
+name    value    note
+        &&int
+alpha   1        " spaced "
+beta    2        it's
+""",
+    "continued": r"""
+name    value    note
+        &&int
+alpha   1        a \
+                 b \
+                 c
+beta    2        \
+
+
+gamma   3        d
+""",
+    "late_modifiers": r"""
+name    value    note
+alpha   1        a
+        &&int
+beta    2        b
+""",
+}
+
+
+@mark.parametrize(
+    "name, features",
+    [
+        ("plain", []),
+        ("quoted", ["has_quotes"]),
+        ("continued", ["has_continuations"]),
+        ("late_modifiers", ["has_late_modifiers"]),
+    ],
+)
+def test_scan_blocks(name: str, features: typing.List[str]):
+    """Should find the blocks and their features as the tokenizer would."""
+    lines = _read._to_lines(_TABLES[name])
+    blocks = _read._scan_blocks(lines, "&")
+    assert len(blocks) == len(_read._tokenize_blocks(lines))
+    for feature in ("has_quotes", "has_continuations", "has_late_modifiers"):
+        assert getattr(blocks[0], feature) == (feature in features)
+    assert blocks[0].is_plain == (not features)
+
+
+@mark.parametrize("name", list(_TABLES.keys()))
+@mark.parametrize(
+    "settings",
+    [{}, {"selection": _read._ColumnSelection(names={"note"})}, {"rows": range(1, 3)}],
+)
+def test_read_blocks(name: str, settings: typing.Dict[str, typing.Any]):
+    """Should read the same raw blocks as tokenizing them line by line."""
+    lines = _read._to_lines(_TABLES[name])
+    observed = _read._read_blocks(lines, **settings)
+    expected = _read._tokenize_blocks(lines, **settings)
+    assert [[(c.name, c.cells) for c in b.columns] for b in observed] == [
+        [(c.name, c.cells) for c in b.columns] for b in expected
+    ]
+
+
+def test_reads_continued():
+    """Should join cells continued across many lines."""
+    table = "name    note\nalpha   " + " \\\n        ".join(["ab"] * 500)
+    expected = " ".join(["ab"] * 500)
+    observed = dftxt.reads(table, kind="polars", engine="polars")
+    assert observed["note"].to_list() == [expected]
+    assert dftxt.reads(table)["note"].tolist() == [expected]
+
+
+@mark.parametrize("name", list(_TABLES.keys()))
+def test_reads_polars_engine_scanned(name: str):
+    """Should split the blocks read by the polars engine as the tokenizer does."""
+    expected = dftxt.reads(_TABLES[name], kind="polars")
+    observed = dftxt.reads(_TABLES[name], kind="polars", engine="polars")
+    assert observed.equals(expected)
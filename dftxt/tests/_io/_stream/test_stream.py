@@ -0,0 +1,99 @@
+import pathlib
+import typing
+
+import pandas as pd
+import pandas.testing as pd_test
+import polars as pl
+import polars.testing as pl_test
+from pytest import mark
+from pytest import raises
+
+import dftxt
+from dftxt._io import _read
+
+_DIRECTORY = pathlib.Path(__file__).resolve().parent.parent / "scenarios"
+_SOURCES = sorted(_DIRECTORY.glob("*/source.dftxt"))
+_SINGLE_FRAME_SOURCES = [
+    p for p in _SOURCES if "---" not in p.read_text("utf-8").replace("----", "")
+]
+
+
+def _expected_rows(path: pathlib.Path) -> typing.List[typing.Tuple[typing.Any, ...]]:
+    """Get the typed rows for the file as cast by the whole-string reader."""
+    source = path.read_text("utf-8").replace("\t", "  ")
+    blocks = _read._read_blocks(source.split("\n"))
+    columns = [c for b in blocks for c in b.columns if not c.should_skip(set())]
+    return list(zip(*[c.to_values() for c in columns]))
+
+
+@mark.parametrize("path", _SOURCES, ids=[p.parent.name for p in _SOURCES])
+def test_iter_frames(path: pathlib.Path):
+    """Should stream the same named frames that read_all loads."""
+    expected = dftxt.read_all(path)
+    observed = list(dftxt.iter_frames(path))
+    assert [name for name, _ in observed] == list(expected.frame_names)
+    for (_, frame), expected_frame in zip(observed, expected.to_tuple()):
+        pd_test.assert_frame_equal(frame, expected_frame)
+
+
+@mark.parametrize(
+    "path", _SINGLE_FRAME_SOURCES, ids=[p.parent.name for p in _SINGLE_FRAME_SOURCES]
+)
+def test_iter_rows(path: pathlib.Path):
+    """Should stream the same typed values that the whole-string reader casts."""
+    expected = _expected_rows(path)
+    assert list(dftxt.iter_rows(path)) == expected
+    with path.open(encoding="utf-8") as handle:
+        assert list(dftxt.iter_rows(handle)) == expected
+
+
+def test_iter_rows_as_dict():
+    """Should stream rows as dictionaries keyed by column name."""
+    path = _DIRECTORY / "multi_block" / "source.dftxt"
+    observed = next(dftxt.iter_rows(path, as_dict=True))
+    expected = dftxt.read(path, kind="polars").columns
+    assert list(observed.keys()) == expected
+
+
+@mark.parametrize(
+    "path", _SINGLE_FRAME_SOURCES, ids=[p.parent.name for p in _SINGLE_FRAME_SOURCES]
+)
+@mark.parametrize("batch_size", [1, 2, 1000])
+def test_read_batches(path: pathlib.Path, batch_size: int):
+    """Should read batches that combine into the frame that read loads."""
+    expected = dftxt.read(path)
+    batches = list(dftxt.read_batches(path, batch_size=batch_size))
+    assert all(len(b) <= batch_size for b in batches)
+    if batches:
+        pd_test.assert_frame_equal(pd.concat(batches), expected)
+    else:
+        assert len(expected) == 0
+
+
+@mark.parametrize(
+    "path", _SINGLE_FRAME_SOURCES, ids=[p.parent.name for p in _SINGLE_FRAME_SOURCES]
+)
+def test_read_batches_polars(path: pathlib.Path):
+    """Should read Polars batches that combine into the frame that read loads."""
+    with pl.StringCache():
+        expected = dftxt.read(path, kind="polars")
+        table = path.read_text("utf-8")
+        batches = list(dftxt.reads_batches(table, 2, kind="polars"))
+        assert sum(len(b) for b in batches) == len(expected)
+        for index, batch in enumerate(batches):
+            pl_test.assert_frame_equal(batch, expected.slice(index * 2, 2))
+
+
+def test_read_batches_categories():
+    """Should give every batch the categories of the whole column."""
+    table = "\n".join(["letter", "&dtype=category", "c", "a", "b", "a"])
+    batches = list(dftxt.reads_batches(table, batch_size=1))
+    assert len(batches) == 4
+    for batch in batches:
+        assert list(batch["letter"].cat.categories) == ["a", "b", "c"]
+
+
+def test_read_batches_invalid_size():
+    """Should reject batch sizes that are not positive."""
+    with raises(ValueError):
+        next(dftxt.reads_batches("foo\n1", batch_size=0))